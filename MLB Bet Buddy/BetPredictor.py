@@ -12,10 +12,25 @@ from Game import Game
 from Hitter import Hitter
 from Pitcher import Pitcher
 from LocalFactors import LocalFactors
+from DataFrameBuilder import DataFrameBuilder
+from FetchPlanner import FetchPlanner
+from TestingDataCache import TestingDataCache
+from NRFITestingData import NRFITestingData
+from OutcomeCache import OutcomeCache
 import pandas as pd
+import numpy as np
 import os
+import json
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import multiprocessing
 from bayes_opt import BayesianOptimization
 
+#Older versions of bayes_opt (before 2.0) require a utility function to be passed when suggesting a point.
+try:
+    from bayes_opt import UtilityFunction
+except ImportError:
+    UtilityFunction = None
+
 class BetPredictor():
     #CONSTANTS
     #Pitching Score for NRFI Constants.
@@ -24,6 +39,23 @@ class BetPredictor():
     #Team Score for NRFI Constants.
     #OMITTED.
     
+    #Maximum number of games processed at the same time when creating the schedule in parallel mode.
+    MAXIMUM_SCHEDULE_WORKERS = 8
+
+    #Number of times a game is attempted before it is left out of the schedule in parallel mode.
+    MAXIMUM_SCHEDULE_ATTEMPTS = 3
+
+    #Number of worker processes the qualified hitters are split across when creating the hitting predictions in sharded mode.
+    DEFAULT_HITTING_PROCESSES = 4
+
+    #Number of candidate weight vectors evaluated together, and the maximum number of chunks evaluated at the same time,
+    #when evaluating many NRFI weight vectors at once.
+    NRFI_EVALUATION_CHUNK_SIZE = 256
+    MAXIMUM_EVALUATION_WORKERS = 4
+
+    #BetPredictor object used to evaluate NRFI weights inside an optimization worker process. Only set inside workers.
+    WORKER_PREDICTOR = None
+
     #Minimum starts required for a pitcher to consider them for bet predictions.
     MINIMUM_GAMES_STARTED = 3
     
@@ -47,6 +79,22 @@ class BetPredictor():
     
     HITTING_COLUMNS = [] #OMITTED.
 
+    #Column type constants for bet prediction tables. Columns that are not listed keep the type pandas infers.
+    SCHEDULE_COLUMN_TYPES = { 'Game ID': 'int64', 'Home Team ID': 'int64', 'Home Team Probable Pitcher ID': 'int64',
+                              'Away Team ID': 'int64', 'Away Team Probable Pitcher ID': 'int64' }
+
+    NRFI_COLUMN_TYPES = {} #OMITTED.
+
+    HITTING_COLUMN_TYPES = {} #OMITTED.
+
+    #Columns of the testing data needed to re-calculate and review bet predictions. All columns are loaded if empty.
+    NRFI_TESTING_COLUMNS = [] #OMITTED.
+
+    HITTING_TESTING_COLUMNS = [] #OMITTED.
+
+    #Names of the NRFI weights tuned by Bayesian optimization, in the order of the statistics in the NRFI feature matrix.
+    NRFI_WEIGHT_NAMES = [] #OMITTED.
+
     #CONSTRUCTOR
     def __init__(self):
         """Constructor for the BetPredictor class.
@@ -56,28 +104,52 @@ class BetPredictor():
         """
         #Endpoint object from the Endpoints class to handle MLB API access.
         self.m_endpointObj = Endpoints()
+
+        #Games that could not be processed the last time a schedule was created in parallel mode.
+        self.m_failedScheduleGames = []
+
+        #The plan of the last prefetched slate (see PrefetchSlate()), used to split the prefetched data between worker processes.
+        self.m_fetchPlanner = None
+
+        #Parquet caches of the Excel testing data used for accuracy testing.
+        testingDataDirectory = os.path.join(os.getcwd(), 'Testing Data')
+        self.m_NRFITestingData = TestingDataCache(os.path.join(testingDataDirectory, 'NRFI'), os.path.join(testingDataDirectory, 'Cache', 'NRFI'))
+        self.m_hittingTestingData = TestingDataCache(os.path.join(testingDataDirectory, 'Hitting'), os.path.join(testingDataDirectory, 'Cache', 'Hitting'))
+
+        #Stored results of finished games and hitter bet reviews, used for accuracy testing.
+        self.m_outcomeCache = OutcomeCache()
+
+        #In-memory NRFI testing data used by the Bayesian optimization. Created the first time it is needed.
+        self.m_NRFITensor = None
         
     #SCHEDULE AND BET PREDICTION CREATION METHODS
-    def CreateSchedule(self, a_date, a_season):
+    def CreateSchedule(self, a_date, a_season, a_parallel = False):
         """Creates a pandas DataFrame representing the schedule on the provided date.
 
         This method is used to create the schedule DataFrame that holds information about all the games that will be
         played on the provided date. All the games being played are first extracted from the schedule endpoint of the
-        MLB API. Then, the game ID for each game is parsed (see ExtractGameIDsFromSchedule()). A Game object is
-        created for each game using its ID so that information about that game such as the probable starting
-        pitchers, team records, etc. can be retrieved. Finally, the local factors about the game are extracted using
-        the LocalFactors class (ballpark factors and weather), and the game is added as a row into the DataFrame.
-        Once all games have been processed, the completed DataFrame is returned.
+        MLB API. Then, the game ID for each game is parsed (see ExtractGameIDsFromSchedule()), and a row is created
+        for each game (see CreateScheduleRow()). Each row is added into the table (see the DataFrameBuilder class), and
+        once all games have been processed, the completed DataFrame is created and returned.
+
+        Since the games are independent of each other, they can optionally be processed in parallel. In parallel
+        mode, the games are split across a bounded pool of threads (at most MAXIMUM_SCHEDULE_WORKERS), so creating the
+        schedule takes about as long as the slowest game instead of the sum of all of them. The rows are still added in
+        schedule order. If an individual game fails to be processed in parallel mode, it is retried one game at a time
+        (up to MAXIMUM_SCHEDULE_ATTEMPTS in total), since most failures are temporary MLB API errors. A game that still
+        fails is left out of the schedule instead of stopping the rest of the games, and is reported through
+        GetFailedScheduleGames().
 
         Args:
             a_date (datetime): The date to get the schedule for.
             a_season (int): The season to get the schedule from.
+            a_parallel (bool): True to process the games in parallel, false to process them one after another.
 
         Returns:
             A pandas DataFrame containing schedule information for the provided date and season.
-        
+
         Assistance Received:
-            https://stackoverflow.com/questions/71565413/adding-a-dictionary-to-a-row-in-a-pandas-dataframe-using-concat-in-pandas-1-4
+            https://docs.python.org/3/library/concurrent.futures.html#threadpoolexecutor
         """
         #Create the endpoint to obtain the schedule information and access the data from it.
         scheduleEndpoint = self.m_endpointObj.GetTodayScheduleEndpoint(a_date, a_date)
@@ -85,71 +157,131 @@ class BetPredictor():
         
         allGameIDs = self.ExtractGameIDsFromSchedule(scheduleData)
         
-        #Create the base pandas DataFrame that will hold the schedule information.
-        scheduleDataFrame = pd.DataFrame(columns=self.SCHEDULE_COLUMNS)
+        #Create the builder that will hold the schedule information until the DataFrame is created.
+        scheduleBuilder = DataFrameBuilder(self.SCHEDULE_COLUMNS, self.SCHEDULE_COLUMN_TYPES)
+        self.m_failedScheduleGames = []
         
         #If there are no games to add to the schedule, return the empty DataFrame.
         if len(allGameIDs) == 0:
-            return scheduleDataFrame
+            return scheduleBuilder.Build()
 
         #Loop through each game that is being played on the provided date and extract all the required information from them.
+        if not a_parallel:
+            for gameID in allGameIDs:
+                scheduleBuilder.AddRow(self.CreateScheduleRow(gameID, a_date, a_season))
+
+            return scheduleBuilder.Build()
+
+        #In parallel mode, submit every game to the thread pool first, then collect the rows in schedule order.
+        scheduleRows = {}
+        scheduleErrors = {}
+        totalWorkers = min(self.MAXIMUM_SCHEDULE_WORKERS, len(allGameIDs))
+        with ThreadPoolExecutor(max_workers=totalWorkers) as executor:
+            futures = [executor.submit(self.CreateScheduleRow, gameID, a_date, a_season) for gameID in allGameIDs]
+
+            for gameID, future in zip(allGameIDs, futures):
+                try:
+                    scheduleRows[gameID] = future.result()
+                except Exception as error:
+                    scheduleErrors[gameID] = error
+
+        #Retry the failed games one at a time, so that a temporary error does not drop a game from the schedule.
+        for attempt in range(1, self.MAXIMUM_SCHEDULE_ATTEMPTS):
+            for gameID in list(scheduleErrors):
+                print('Retrying the schedule row for game', gameID, 'after error -', scheduleErrors[gameID])
+                try:
+                    scheduleRows[gameID] = self.CreateScheduleRow(gameID, a_date, a_season)
+                    del scheduleErrors[gameID]
+                except Exception as error:
+                    scheduleErrors[gameID] = error
+
         for gameID in allGameIDs:
-            #Create a Game object with the game ID to easily obtain all information about that game.
-            gameObj = Game(gameID)
-            
-            #Get the basic game information.
-            todayDate = a_date.strftime('%m/%d/%Y')
-            gameDateTimeString = gameObj.GetGameDateTimeString() 
-            gameTime = gameObj.GetGameTime()
-            homeTeamName = gameObj.GetHomeTeamName()
-            homeTeamID = gameObj.GetHomeTeamID()
-            awayTeamName = gameObj.GetAwayTeamName()
-            awayTeamID = gameObj.GetAwayTeamID()
-            stadium = gameObj.GetStadium()
-            
-            #Get the records of the two teams.
-            homeTeam = Team(homeTeamID)
-            awayTeam = Team(awayTeamID)
-            homeTeamRecord = homeTeam.GetRecord(a_date, a_season)
-            awayTeamRecord = awayTeam.GetRecord(a_date, a_season)
-            
-            #Get the probable pitcher information.
-            homeProbablePitcherName = gameObj.GetHomeStartingPitcherName()
-            homeProbablePitcherID = gameObj.GetHomeStartingPitcherID()
-            awayProbablePitcherName = gameObj.GetAwayStartingPitcherName()
-            awayProbablePitcherID = gameObj.GetAwayStartingPitcherID()
-            
-            #Get the local factors of the game.
-            localFactors = LocalFactors()
-            ballparkFactor = localFactors.GetBallparkFactor(stadium)
-            weatherInformation = localFactors.GetWeather(stadium, gameTime)
-            
-            #Make sure the stadium was found.
-            if weatherInformation == 'Unknown':
-                weatherDescription = 'Unknown'
-                weatherCode = 'Unknown'
-                temperature = 'Unknown'
-                windSpeed = 'Unknown'
+            if gameID in scheduleRows:
+                scheduleBuilder.AddRow(scheduleRows[gameID])
             else:
-                weatherDescription = weatherInformation['weatherCondition']
-                weatherCode = weatherInformation['weatherCode']
-                temperature = str(weatherInformation['temperatureF']) + ' \u00b0F'      #Note: The unicode is the degree symbol for Fahrenheit.
-                windSpeed = str(weatherInformation['windSpeed']) + ' mph'
-            
-            
-            #Create a row, representing a game, to be inserted into the table.
-            gameRow = { 'Game ID': gameID, 'Date': todayDate, 'DateTime String': gameDateTimeString, 'Time': gameTime, 
-                        'Home Team Name': homeTeamName, 'Home Team ID': homeTeamID, 'Home Team Record': homeTeamRecord, 
-                        'Home Team Probable Pitcher Name': homeProbablePitcherName, 'Home Team Probable Pitcher ID': homeProbablePitcherID, 
-                        'Away Team Name': awayTeamName, 'Away Team ID': awayTeamID, 'Away Team Record': awayTeamRecord, 
-                        'Away Team Probable Pitcher Name': awayProbablePitcherName, 'Away Team Probable Pitcher ID': awayProbablePitcherID, 
-                        'Stadium': stadium, 'Ballpark Factor': ballparkFactor, 'Weather Description': weatherDescription, 
-                        'Weather Code': weatherCode, 'Temperature': temperature, 'Wind Speed': windSpeed }
-            
-            #Add the created game row into the DataFrame.
-            scheduleDataFrame = pd.concat([scheduleDataFrame, pd.DataFrame([gameRow])], ignore_index=True)
+                #Report the failed game, but continue on with the rest of the slate.
+                print('Error creating the schedule row for game', gameID, '-', scheduleErrors[gameID])
+                self.m_failedScheduleGames.append({ 'gameID': gameID, 'error': str(scheduleErrors[gameID]) })
+
+        return scheduleBuilder.Build()
+
+    def CreateScheduleRow(self, a_gameID, a_date, a_season):
+        """Helper method that creates the schedule row for a single game.
+
+        This method is a helper method for the CreateSchedule() method. A Game object is created for the game using
+        its ID so that information about that game such as the probable starting pitchers, team records, etc. can be
+        retrieved. Then, the local factors about the game are extracted using the LocalFactors class (ballpark factors
+        and weather). This method does not depend on any other game, so it is safe to call for several games at once.
 
-        return scheduleDataFrame
+        Args:
+            a_gameID (int): The ID used by the MLB API to represent the game.
+            a_date (datetime): The date the schedule is being created for.
+            a_season (int): The season the schedule is being created for.
+
+        Returns:
+            A dictionary, representing a row of the schedule DataFrame for the game.
+        """
+        #Create a Game object with the game ID to easily obtain all information about that game.
+        gameObj = Game(a_gameID)
+        
+        #Get the basic game information.
+        todayDate = a_date.strftime('%m/%d/%Y')
+        gameDateTimeString = gameObj.GetGameDateTimeString() 
+        gameTime = gameObj.GetGameTime()
+        homeTeamName = gameObj.GetHomeTeamName()
+        homeTeamID = gameObj.GetHomeTeamID()
+        awayTeamName = gameObj.GetAwayTeamName()
+        awayTeamID = gameObj.GetAwayTeamID()
+        stadium = gameObj.GetStadium()
+        
+        #Get the records of the two teams.
+        homeTeam = Team(homeTeamID)
+        awayTeam = Team(awayTeamID)
+        homeTeamRecord = homeTeam.GetRecord(a_date, a_season)
+        awayTeamRecord = awayTeam.GetRecord(a_date, a_season)
+        
+        #Get the probable pitcher information.
+        homeProbablePitcherName = gameObj.GetHomeStartingPitcherName()
+        homeProbablePitcherID = gameObj.GetHomeStartingPitcherID()
+        awayProbablePitcherName = gameObj.GetAwayStartingPitcherName()
+        awayProbablePitcherID = gameObj.GetAwayStartingPitcherID()
+        
+        #Get the local factors of the game.
+        localFactors = LocalFactors()
+        ballparkFactor = localFactors.GetBallparkFactor(stadium)
+        weatherInformation = localFactors.GetWeather(stadium, gameTime)
+        
+        #Make sure the stadium was found.
+        if weatherInformation == 'Unknown':
+            weatherDescription = 'Unknown'
+            weatherCode = 'Unknown'
+            temperature = 'Unknown'
+            windSpeed = 'Unknown'
+        else:
+            weatherDescription = weatherInformation['weatherCondition']
+            weatherCode = weatherInformation['weatherCode']
+            temperature = str(weatherInformation['temperatureF']) + ' \u00b0F'      #Note: The unicode is the degree symbol for Fahrenheit.
+            windSpeed = str(weatherInformation['windSpeed']) + ' mph'
+        
+        
+        #Create a row, representing a game, to be inserted into the table.
+        gameRow = { 'Game ID': a_gameID, 'Date': todayDate, 'DateTime String': gameDateTimeString, 'Time': gameTime, 
+                    'Home Team Name': homeTeamName, 'Home Team ID': homeTeamID, 'Home Team Record': homeTeamRecord, 
+                    'Home Team Probable Pitcher Name': homeProbablePitcherName, 'Home Team Probable Pitcher ID': homeProbablePitcherID, 
+                    'Away Team Name': awayTeamName, 'Away Team ID': awayTeamID, 'Away Team Record': awayTeamRecord, 
+                    'Away Team Probable Pitcher Name': awayProbablePitcherName, 'Away Team Probable Pitcher ID': awayProbablePitcherID, 
+                    'Stadium': stadium, 'Ballpark Factor': ballparkFactor, 'Weather Description': weatherDescription, 
+                    'Weather Code': weatherCode, 'Temperature': temperature, 'Wind Speed': windSpeed }
+        
+        return gameRow
+
+    def GetFailedScheduleGames(self):
+        """Gets the games that could not be processed the last time a schedule was created in parallel mode.
+
+        Returns:
+            A list of dictionaries, each containing the game ID of a failed game and the error that occurred.
+        """
+        return self.m_failedScheduleGames
 
     def ExtractGameIDsFromSchedule(self, a_scheduleData):
         """Helper method that extracts only the game IDs from a dictionary containing the entire schedule information.
@@ -202,10 +334,9 @@ class BetPredictor():
 
         Assistance Received:
             https://stackoverflow.com/questions/16476924/how-to-iterate-over-rows-in-a-pandas-dataframe
-            https://stackoverflow.com/questions/71565413/adding-a-dictionary-to-a-row-in-a-pandas-dataframe-using-concat-in-pandas-1-4
         """
-        #Create the base pandas DataFrame that will hold all the NRFI prediction data.   
-        nrfiDataFrame = pd.DataFrame(columns=self.NRFI_COLUMNS)
+        #Create the builder that will hold all the NRFI prediction data until the DataFrame is created.
+        nrfiBuilder = DataFrameBuilder(self.NRFI_COLUMNS, self.NRFI_COLUMN_TYPES)
         
         #Loop through each game in the schedule and fill in the information for each column. 
         #NOTE: Lots of the general information is pulled directly from the schedule DataFrame.
@@ -239,11 +370,11 @@ class BetPredictor():
             #Add on the individual pitching and team hitting statistics to the row.
             #OMITTED.
 
-            #Add the created game row into the DataFrame. Sort by overall NRFI Score.
-            nrfiDataFrame = pd.concat([nrfiDataFrame, pd.DataFrame([gameRow])], ignore_index=True)
+            #Add the created game row into the table.
+            nrfiBuilder.AddRow(gameRow)
             
-        #Sort by overall NRFI Score.
-        sortedNRFIDataFrame = nrfiDataFrame.sort_values(by='Overall NRFI Score')
+        #Create the DataFrame and sort by overall NRFI Score.
+        sortedNRFIDataFrame = nrfiBuilder.Build().sort_values(by='Overall NRFI Score')
         return sortedNRFIDataFrame
     
     def GatherPitcherNRFIData(self, a_pitcherID, a_season, a_startDate, a_endDate, a_homeOrAway):
@@ -316,49 +447,182 @@ class BetPredictor():
         
         return formattedDictionary
     
-    def CreateHittingPredictions(self, a_scheduleDataFrame, a_openingDayDate, a_currentDate, a_season):
+    def CreateHittingPredictions(self, a_scheduleDataFrame, a_openingDayDate, a_currentDate, a_season, a_processes = 1):
         """Creates the hitting predictions and processes them into a pandas DataFrame.
 
         This method is used to create the hitting predictions and return them as a pandas DataFrame. A prediction is
-        made for only qualified hitters that are playing on the day the predictions are being made for. For each
-        qualified hitter (a hitter with at least 3.1 plate appearances per game played), the game(s) that hitter is
-        playing in is extracted from the schedule DataFrame (see FindGamesOnSchedule()). From those games,
-        a Hitter object is created for the hitter, and a Pitcher object is created for the pitcher that hitter is
-        facing. Statistics for the starting pitcher the hitter will be facing, along with individual hitting
-        statistics for the hitter is generated from the MLB API using methods from both the Hitter and Pitcher
-        class. Finally, the hitting prediction is created (see CalculateAdjustedBA(), CalculateCareerStatsFactor(),
+        made for only qualified hitters that are playing on the day the predictions are being made for. The
+        predictions are created in two stages. First, every probable pitcher on the schedule is resolved exactly once
+        (see CreatePitcherPlan()): a Pitcher object is created, their statistics are generated from the MLB API, and
+        pitchers that have not met the minimum games started requirement are dropped. Then, for each qualified hitter
+        (a hitter with at least 3.1 plate appearances per game played), the game(s) that hitter is playing in is
+        looked up in an index of the schedule DataFrame (see CreateScheduleIndex() and FindGamesInScheduleIndex()),
+        and only the games against an eligible pitcher are kept. Hitters without any eligible matchup are skipped
+        before any of their own statistics are requested. For the remaining hitters, a Hitter object is created, and
+        the individual hitting statistics for the hitter are generated from the MLB API and combined with the already
+        resolved pitcher statistics. Finally, the hitting prediction is created (see CalculateAdjustedBA(), CalculateCareerStatsFactor(),
         CalculateCareerStatsFactor(), CalculateOverallHittingScore()), and added to the result DataFrame. Each row in
         the DataFrame also contains the statistics as well as other helpful information that were used in the bet
         prediction creation. If any important statistics are missing, or hitters/pitchers have not met minimum game
         requirements, the individual prediction is omitted from the final DataFrame.
 
+        When more than one process is requested, the qualified hitters are split into shards and each shard is
+        predicted in its own worker process (see CreateHittingPredictionsSharded()). The pitcher plan is still only
+        resolved once, before the hitters are split up.
+
         Args:
             a_scheduleDataFrame (pandas.DataFrame): A pandas DataFrame containing the schedule information.
             a_openingDayDate (datetime): The date of opening day of the season the schedule was generated for.
             a_currentDate (datetime): The date the predictions are being generated for.
             a_season (int): The season the schedule was generated for.
+            a_processes (int): The number of worker processes to split the hitters across. 1 (the default) creates
+                               every prediction in the current process.
 
         Returns:
             A pandas DataFrame containing the hitting bet predictions. The DataFrame is sorted by the Overall Hitting
             Score column, with the best hitting predictions at the top. A higher Overall Hitting Score is better.
-
-        Assistance Received:
-            https://stackoverflow.com/questions/16476924/how-to-iterate-over-rows-in-a-pandas-dataframe
-            https://stackoverflow.com/questions/71565413/adding-a-dictionary-to-a-row-in-a-pandas-dataframe-using-concat-in-pandas-1-4
         """
-        #Create the base pandas DataFrame that will hold all the hitting prediction data.
-        hittingDataFrame = pd.DataFrame(columns=self.HITTING_COLUMNS)
+        #Resolve every probable pitcher on the schedule once. Only matchups against eligible pitchers will be considered.
+        pitcherPlan = self.CreatePitcherPlan(a_scheduleDataFrame, a_openingDayDate, a_season)
 
         #Get a list of all the hitters that will be in the DataFrame.
         allHitters = Hitter.GetAllHitters(a_season)
+
+        if a_processes > 1:
+            hittingDataFrame = self.CreateHittingPredictionsSharded(a_scheduleDataFrame, allHitters, pitcherPlan, a_openingDayDate,
+                                                                    a_currentDate, a_season, a_processes)
+        else:
+            hittingDataFrame = self.CreateHittingRows(a_scheduleDataFrame, allHitters, pitcherPlan, a_openingDayDate, a_currentDate, a_season)
+
+        #Sort by overall Hitting Score in descending order.
+        sortedHittingDataFrame = hittingDataFrame.sort_values(by='Overall Hitting Score', ascending=False)
+        return sortedHittingDataFrame
+
+    def CreateHittingPredictionsSharded(self, a_scheduleDataFrame, a_hitters, a_pitcherPlan, a_openingDayDate, a_currentDate, a_season, a_processes):
+        """Creates the hitting predictions for a list of hitters using several worker processes.
+
+        This method is a helper method for the CreateHittingPredictions() method. The hitters are dealt out into one
+        shard per process, and each shard is predicted by its own worker process (see CreateHittingShard()). Every
+        worker has its own HTTP session and its own cache of MLB API responses. If the slate has been prefetched (see
+        PrefetchSlate()), each worker's cache is seeded with only the prefetched data planned for the hitters in its
+        shard, rather than a copy of everything that was prefetched. The partial DataFrames are combined in shard order
+        once every worker has finished.
+
+        The worker processes are always started with the "spawn" start method. This method is called from inside the
+        multithreaded server, and a forked process could inherit a lock held by another thread (such as a database or
+        HTTP connection pool lock) and deadlock.
+
+        Args:
+            a_scheduleDataFrame (pandas.DataFrame): A pandas DataFrame containing the schedule information.
+            a_hitters (list): A list of dictionaries, each representing a qualified hitter (see Hitter.GetAllHitters()).
+            a_pitcherPlan (dict): The resolved probable pitchers on the schedule (see CreatePitcherPlan()).
+            a_openingDayDate (datetime): The date of opening day of the season the schedule was generated for.
+            a_currentDate (datetime): The date the predictions are being generated for.
+            a_season (int): The season the schedule was generated for.
+            a_processes (int): The maximum number of worker processes to use.
+
+        Returns:
+            A pandas DataFrame containing the unsorted hitting bet predictions for every provided hitter.
+
+        Assistance Received:
+            - https://docs.python.org/3/library/concurrent.futures.html#processpoolexecutor
+            - https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods
+        """
+        #Deal the hitters out one at a time, so that each shard gets a similar mix of teams and games.
+        shards = [a_hitters[shardIndex::a_processes] for shardIndex in range(a_processes)]
+        shards = [shard for shard in shards if shard]
+        if not shards:
+            return self.CreateHittingRows(a_scheduleDataFrame, [], a_pitcherPlan, a_openingDayDate, a_currentDate, a_season)
+
+        #Give each shard only the prefetched data planned for its own hitters.
+        sharedCache = Endpoints.GetSharedCache()
+        shardCaches = []
+        for shard in shards:
+            shardCache = {}
+            if sharedCache is not None and self.m_fetchPlanner is not None:
+                for hitter in shard:
+                    for URL in self.m_fetchPlanner.GetHitterURLs(hitter['playerID']):
+                        if URL in sharedCache:
+                            shardCache[URL] = sharedCache[URL]
+
+            shardCaches.append(shardCache)
+
+        spawnContext = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=len(shards), mp_context=spawnContext) as executor:
+            futures = [executor.submit(BetPredictor.CreateHittingShard, a_scheduleDataFrame, shard, a_pitcherPlan, a_openingDayDate,
+                                       a_currentDate, a_season, shardCache) for shard, shardCache in zip(shards, shardCaches)]
+
+            partialDataFrames = [future.result() for future in futures]
+
+        return pd.concat(partialDataFrames, ignore_index=True)
+
+    @staticmethod
+    def CreateHittingShard(a_scheduleDataFrame, a_hitters, a_pitcherPlan, a_openingDayDate, a_currentDate, a_season, a_cache):
+        """Creates the hitting predictions for a single shard of hitters inside a worker process.
+
+        The provided cache is used as the worker's shared Endpoints cache while the shard is being predicted (see
+        Endpoints.SetSharedCache()).
+
+        Args:
+            a_scheduleDataFrame (pandas.DataFrame): A pandas DataFrame containing the schedule information.
+            a_hitters (list): A list of dictionaries, each representing a qualified hitter in this shard.
+            a_pitcherPlan (dict): The resolved probable pitchers on the schedule (see CreatePitcherPlan()).
+            a_openingDayDate (datetime): The date of opening day of the season the schedule was generated for.
+            a_currentDate (datetime): The date the predictions are being generated for.
+            a_season (int): The season the schedule was generated for.
+            a_cache (dict): The prefetched MLB API responses for the hitters in the shard (URL --> JSON data).
+
+        Returns:
+            A pandas DataFrame containing the unsorted hitting bet predictions for the hitters in the shard.
+        """
+        Endpoints.SetSharedCache(a_cache)
+        try:
+            return BetPredictor().CreateHittingRows(a_scheduleDataFrame, a_hitters, a_pitcherPlan, a_openingDayDate, a_currentDate, a_season)
+        finally:
+            Endpoints.ClearSharedCache()
+
+    def CreateHittingRows(self, a_scheduleDataFrame, a_hitters, a_pitcherPlan, a_openingDayDate, a_currentDate, a_season):
+        """Creates the hitting predictions for a list of hitters against an already resolved pitcher plan.
+
+        This method is a helper method for the CreateHittingPredictions() method, and holds the per hitter portion of
+        the hitting prediction creation. It is used directly in the default mode, and by each worker process in
+        sharded mode (see CreateHittingShard()).
+
+        Args:
+            a_scheduleDataFrame (pandas.DataFrame): A pandas DataFrame containing the schedule information.
+            a_hitters (list): A list of dictionaries, each representing a qualified hitter (see Hitter.GetAllHitters()).
+            a_pitcherPlan (dict): The resolved probable pitchers on the schedule (see CreatePitcherPlan()).
+            a_openingDayDate (datetime): The date of opening day of the season the schedule was generated for.
+            a_currentDate (datetime): The date the predictions are being generated for.
+            a_season (int): The season the schedule was generated for.
+
+        Returns:
+            A pandas DataFrame containing the unsorted hitting bet predictions for the provided hitters.
+        """
+        #Create the builder that will hold all the hitting prediction data until the DataFrame is created.
+        hittingBuilder = DataFrameBuilder(self.HITTING_COLUMNS, self.HITTING_COLUMN_TYPES)
+
+        #Index the schedule by team once, so each hitter's games can be found without scanning the whole schedule.
+        scheduleIndex = self.CreateScheduleIndex(a_scheduleDataFrame)
         
         #Loop through each of the qualified hitters.
-        for hitter in allHitters:
+        for hitter in a_hitters:
             #Extract the basic information about the hitter.
             hitterName = hitter['playerName']
             hitterID = hitter['playerID']
             hitterTeamName = hitter['teamName']
             hitterTeamID = hitter['teamID']
+
+            #Find each game the hitter is playing on that day, keeping only the games against an eligible pitcher.
+            #Note: There can be double headers, which means two different pitchers they are facing on the same day.
+            #Each "game" is returned as a tuple, with game[0] representing a row in the pandas DataFrame, and game[1] representing 
+            #if the pitcher is on the home or away team.
+            gamesToCheck = [game for game in self.FindGamesInScheduleIndex(scheduleIndex, hitterTeamID, hitterTeamName)
+                            if (game[0]['Game ID'], game[1]) in a_pitcherPlan]
+
+            #Skip the hitter entirely if they are not facing an eligible pitcher, before any of their statistics are requested.
+            if not gamesToCheck:
+                continue
             
             #Extract the hitter's season offensive statistics.
             '''
@@ -367,21 +631,97 @@ class BetPredictor():
             '''
 
             #Now that all the hitter's general data has been gathered, loop through each game they are playing on that day.
-            #Note: There can be double headers, which means two different pitchers they are facing on the same day.
-            gamesToCheck = self.FindGamesOnSchedule(a_scheduleDataFrame, hitterTeamName)
             for game in gamesToCheck:
-                #Each "game" is returned as a tuple, with game[0] representing a row in the pandas DataFrame, and game[1] representing 
-                #if the pitcher is on the home or away team.
                 gameInformation = game[0]
                 homeOrAway = game[1]
                 gameDatetimeObj = datetime.strptime(gameInformation['Date'], '%m/%d/%Y')
                 
-                #Extract basic information about the pitcher the hitter will be facing.
+                #Extract the already resolved information about the pitcher the hitter will be facing.
+                pitcherInformation = a_pitcherPlan[(gameInformation['Game ID'], homeOrAway)]
+                pitcherName = pitcherInformation['pitcherName']
+                pitcherID = pitcherInformation['pitcherID']
+                pitcherTeamName = pitcherInformation['pitcherTeamName']
+                pitcherTeamID = pitcherInformation['pitcherTeamID']
+                pitcherStats = pitcherInformation['pitcherStats']
+                pitchHand = pitcherInformation['pitchHand']
+
+                '''
+                The stat extraction portion of this method has been omitted for privacy reasons.
+                If you wish to know more about how the hitting bet predictions are created, reach out to me.
+                '''
+                
+                #Calculate all the offensive factors and scores for the individual hitter.
+                '''
+                The calculation portion of this method has been omitted for privacy reasons.
+                If you wish to know more about how the hitting bet predictions are created, reach out to me.
+                '''
+
+                #Add a row into the hitter DataFrame.
+                hitterRow = {} #Omitted.
+               
+                #Add the created hitter row into the table.
+                hittingBuilder.AddRow(hitterRow)
+        
+        return hittingBuilder.Build()
+
+    def PrefetchSlate(self, a_scheduleDataFrame, a_openingDayDate, a_currentDate, a_season):
+        """Fetches the data every NRFI/YRFI and hitting bet prediction on a schedule will need before they are created.
+
+        This method plans the full set of MLB API requests the prediction methods will make for the schedule, removes
+        the duplicates, and fetches them concurrently into the shared Endpoints cache of the current call (see the
+        FetchPlanner class). CreateNRFIPredictions() and CreateHittingPredictions() then read their data from the cache.
+        The cache is left in place afterwards, and should be cleared with Endpoints.ClearSharedCache() once the
+        predictions are created.
+
+        Args:
+            a_scheduleDataFrame (pandas.DataFrame): A pandas DataFrame containing the schedule information.
+            a_openingDayDate (datetime): The date of opening day of the season the schedule was generated for.
+            a_currentDate (datetime): The date the predictions are being generated for.
+            a_season (int): The season the schedule was generated for.
+
+        Returns:
+            A dictionary containing the total number of requested, unique, saved (duplicate) and fetched requests.
+        """
+        if Endpoints.GetSharedCache() is None:
+            Endpoints.SetSharedCache({})
+
+        self.m_fetchPlanner = FetchPlanner()
+        self.m_fetchPlanner.PlanSlate(a_scheduleDataFrame, Hitter.GetAllHitters(a_season), a_openingDayDate, a_currentDate, a_season,
+                                      self.MINIMUM_GAMES_STARTED)
+
+        return self.m_fetchPlanner.Prefetch()
+
+    def CreatePitcherPlan(self, a_scheduleDataFrame, a_openingDayDate, a_season):
+        """Resolves every probable pitcher on a schedule once, for use in the hitting bet predictions.
+
+        This method is a helper method for the CreateHittingPredictions() method. Roughly nine qualified hitters face
+        each starting pitcher, so instead of re-deriving everything about a pitcher for each of those hitters, each
+        probable pitcher on the schedule is resolved here a single time. A Pitcher object is created for each pitcher,
+        their statistics are generated from the MLB API, and it is checked that they have started the minimum number of
+        games and that their hand information could be found. The pitcher-side statistics used in the hitting bet
+        predictions are gathered as well. Pitchers that have not been announced yet or are not eligible are left out
+        of the returned dictionary.
+
+        Args:
+            a_scheduleDataFrame (pandas.DataFrame): A pandas DataFrame containing the schedule information.
+            a_openingDayDate (datetime): The date of opening day of the season the schedule was generated for.
+            a_season (int): The season the schedule was generated for.
+
+        Returns:
+            A dictionary where each key is a tuple of the game ID and the side of the pitcher ('Home' or 'Away'), and
+            each value is a dictionary containing the resolved information and statistics about that pitcher.
+        """
+        pitcherPlan = {}
+        for _, gameInformation in a_scheduleDataFrame.iterrows():
+            gameDatetimeObj = datetime.strptime(gameInformation['Date'], '%m/%d/%Y')
+
+            for homeOrAway in ['Home', 'Away']:
+                #Extract basic information about the pitcher. Pitchers that have not been announced yet are skipped.
                 pitcherName = gameInformation[homeOrAway + ' Team Probable Pitcher Name']
                 pitcherID = gameInformation[homeOrAway + ' Team Probable Pitcher ID']
-                pitcherTeamName = gameInformation[homeOrAway + ' Team Name']
-                pitcherTeamID = gameInformation[homeOrAway + ' Team ID']
-                
+                if pitcherName == 'T.B.D.' or pitcherID == 0:
+                    continue
+
                 #Extract statistics based on the pitcher. Make sure the data can be extracted and the pitcher has enough games started.
                 pitcherObj = Pitcher(pitcherID)
                 pitcherStats = pitcherObj.GetPitchingStatistics(a_season, a_openingDayDate, gameDatetimeObj)
@@ -391,56 +731,89 @@ class BetPredictor():
                 handInformation = pitcherObj.GetHandInformation()
                 if not handInformation:
                     continue
-                pitchHand = handInformation['pitchHand']
 
                 '''
                 The stat extraction portion of this method has been omitted for privacy reasons.
                 If you wish to know more about how the hitting bet predictions are created, reach out to me.
                 '''
-                
-                #Calculate all the offensive factors and scores for the individual hitter.
-                '''
-                The calculation portion of this method has been omitted for privacy reasons.
-                If you wish to know more about how the hitting bet predictions are created, reach out to me.
-                '''
 
-                #Add a row into the hitter DataFrame.
-                hitterRow = {} #Omitted.
-               
-                #Add the created game row into the DataFrame.
-                hittingDataFrame = pd.concat([hittingDataFrame, pd.DataFrame([hitterRow])], ignore_index=True)
-        
-        #Sort by overall Hitting Score in descending order.
-        sortedHittingDataFrame = hittingDataFrame.sort_values(by='Overall Hitting Score', ascending=False)
-        return sortedHittingDataFrame
+                pitcherPlan[(gameInformation['Game ID'], homeOrAway)] = { 'pitcherName': pitcherName,
+                                                                          'pitcherID': pitcherID,
+                                                                          'pitcherTeamName': gameInformation[homeOrAway + ' Team Name'],
+                                                                          'pitcherTeamID': gameInformation[homeOrAway + ' Team ID'],
+                                                                          'pitcherStats': pitcherStats,
+                                                                          'pitchHand': handInformation['pitchHand'] }
+
+        return pitcherPlan
     
     def FindGamesOnSchedule(self, a_scheduleDataFrame, a_hitterTeamName):
         """Finds the game on a schedule DataFrame that the hitter is playing in.
 
-        This method is a helper method for the CreateHittingPredictions() method and used to find all the games on
-        the schedule DataFrame where the hitter is playing in. Every row on the DataFrame is looped through,
-        and if the hitter's team matches one of the teams playing in that game, the row is added to the return list.
-        Additionally, the team the hitter is facing (away or home) is also added to the return list to make prediction
-        creation easier.
+        This method is a helper method used to find all the games on the schedule DataFrame where the hitter is
+        playing in. The schedule is indexed by team (see CreateScheduleIndex()), and the hitter's team is looked up in
+        that index. Additionally, the team the hitter is facing (away or home) is also added to the return list to make
+        prediction creation easier. When finding games for many hitters on the same schedule, the index should be
+        created once and searched directly with FindGamesInScheduleIndex() instead.
 
         Args:
             a_scheduleDataFrame (pandas.DataFrame): A pandas DataFrame containing the schedule information.
             a_hitterTeamName (string): The name of the team the hitter is currently on.
 
         Returns:
-            A list of tuples, with the first element being a pandas Series object representing the row from the schedule
-            DataFrame, and the second being the hitter's opponent's team name as a string.
+            A list of tuples, with the first element being a dictionary representing the row from the schedule
+            DataFrame, and the second being the side ('Home' or 'Away') of the hitter's opponent as a string.
+        """
+        scheduleIndex = self.CreateScheduleIndex(a_scheduleDataFrame)
+        return self.FindGamesInScheduleIndex(scheduleIndex, None, a_hitterTeamName)
+
+    def CreateScheduleIndex(self, a_scheduleDataFrame):
+        """Creates an index of the games on a schedule DataFrame, keyed by the teams playing in them.
+
+        This method is a helper method for the CreateHittingPredictions() method. The schedule DataFrame is looped
+        through a single time, and each game is added to the index under the names and IDs of both teams playing in
+        it. Each entry also records which side (home or away) the opponent of that team is on, so the opposing
+        pitcher can be found directly. Teams playing in a double header have both of their games in their entry.
+
+        Args:
+            a_scheduleDataFrame (pandas.DataFrame): A pandas DataFrame containing the schedule information.
+
+        Returns:
+            A dictionary where each key is either a team name (string) or a team ID (int), and each value is a list
+            of tuples, with the first element being a dictionary representing the row from the schedule DataFrame,
+            and the second being the side ('Home' or 'Away') of that team's opponent as a string.
         """
-        #Loop through each game on the schedule, and search for the hitter's team.
-        resultRows = []
-        for _, row in a_scheduleDataFrame.iterrows():
+        scheduleIndex = {}
+        for row in a_scheduleDataFrame.to_dict('records'):
             #Add on a key that will help determine if the pitcher the hitter is facing is on the home or away team (since there are two pitchers).
-            if row['Home Team Name'] == a_hitterTeamName:
-                resultRows.append((row, 'Away'))
-            elif row['Away Team Name'] == a_hitterTeamName:
-                resultRows.append((row, 'Home'))
-                
-        return resultRows
+            homeEntry = (row, 'Away')
+            awayEntry = (row, 'Home')
+
+            scheduleIndex.setdefault(row['Home Team Name'], []).append(homeEntry)
+            scheduleIndex.setdefault(row['Home Team ID'], []).append(homeEntry)
+            scheduleIndex.setdefault(row['Away Team Name'], []).append(awayEntry)
+            scheduleIndex.setdefault(row['Away Team ID'], []).append(awayEntry)
+
+        return scheduleIndex
+
+    def FindGamesInScheduleIndex(self, a_scheduleIndex, a_hitterTeamID, a_hitterTeamName):
+        """Finds the games a hitter is playing in using an index of the schedule.
+
+        The hitter's team ID is searched for first, since the team name attached to a hitter can be out of date
+        after a mid-season trade. If the team ID is not provided or could not be found, the team name is used.
+
+        Args:
+            a_scheduleIndex (dict): An index of the schedule created by CreateScheduleIndex().
+            a_hitterTeamID (int): The ID used by the MLB API of the team the hitter is currently on. Can be None.
+            a_hitterTeamName (string): The name of the team the hitter is currently on.
+
+        Returns:
+            A list of tuples, with the first element being a dictionary representing the row from the schedule
+            DataFrame, and the second being the side ('Home' or 'Away') of the hitter's opponent as a string.
+        """
+        if a_hitterTeamID is not None and a_hitterTeamID in a_scheduleIndex:
+            return a_scheduleIndex[a_hitterTeamID]
+
+        return a_scheduleIndex.get(a_hitterTeamName, [])
                 
     #BET CALCULATION METHODS
     def CalculatePitchingScore(self, a_pitchingStats, a_homeOrAway):
@@ -456,13 +829,9 @@ class BetPredictor():
         Returns:
             A float, representing the pitching score calculated for the pitcher.
         """
-        
-        '''
-        The calculation portion of this method has been omitted for privacy reasons.
-        If you wish to know more about how the NRFI/YRFI bet predictions are created, reach out to me.
-        '''
-        
-        return pitchingScore
+        #Score the pitcher as a slate of one (see CalculatePitchingScores()).
+        pitchingScores = self.CalculatePitchingScores(self.ConvertStatsToArrays([a_pitchingStats]), np.array([a_homeOrAway]))
+        return float(pitchingScores[0])
         
     def CalculateTeamHittingScore(self, a_teamStats, a_homeOrAway):
         """Calculates a team hitting score for an individual team.
@@ -477,13 +846,9 @@ class BetPredictor():
         Returns:
             A float, representing the team hitting score calculated for the team.
         """
-        
-        '''
-        The calculation portion of this method has been omitted for privacy reasons.
-        If you wish to know more about how the NRFI/YRFI bet predictions are created, reach out to me.
-        '''
-        
-        return teamHittingScore
+        #Score the team as a slate of one (see CalculateTeamHittingScores()).
+        teamHittingScores = self.CalculateTeamHittingScores(self.ConvertStatsToArrays([a_teamStats]), np.array([a_homeOrAway]))
+        return float(teamHittingScores[0])
     
     def CalculateOverallNRFIScore(self, a_homePitcherNRFIScore, a_awayPitcherNRFIScore, a_ballparkFactor, a_weatherFactor):
         """Calculates the overall NRFI score for a game.
@@ -499,13 +864,10 @@ class BetPredictor():
         Returns:
             A float, representing the overall NRFI score for a game.
         """
-        
-        '''
-        The calculation portion of this method has been omitted for privacy reasons.
-        If you wish to know more about how the NRFI/YRFI bet predictions are created, reach out to me.
-        '''
-
-        return overallNRFIScore
+        #Score the game as a slate of one (see CalculateOverallNRFIScores()).
+        overallNRFIScores = self.CalculateOverallNRFIScores(np.array([a_homePitcherNRFIScore]), np.array([a_awayPitcherNRFIScore]),
+                                                            np.array([a_ballparkFactor]), np.array([a_weatherFactor]))
+        return float(overallNRFIScores[0])
 
     def CalculateAdjustedBA(self, a_vsLeftBA, a_vsRightBA, a_vsLeftBAA, a_vsRightBAA, a_batHand, a_pitchHand):
         """Calculates the adjusted batting average for a hitter.
@@ -523,13 +885,10 @@ class BetPredictor():
         Returns:
             A float, representing the adjusted batting average for a hitter.
         """
-        
-        '''
-        The calculation portion of this method has been omitted for privacy reasons.
-        If you wish to know more about how the hitting bet predictions are created, reach out to me.
-        '''
-        
-        return adjustedBA
+        #Score the hitter as a slate of one (see CalculateAdjustedBAs()).
+        adjustedBAs = self.CalculateAdjustedBAs(np.array([a_vsLeftBA]), np.array([a_vsRightBA]), np.array([a_vsLeftBAA]),
+                                                np.array([a_vsRightBAA]), np.array([a_batHand]), np.array([a_pitchHand]))
+        return float(adjustedBAs[0])
     
     def CalculateHotColdFactor(self, a_L10PlateAppearances, a_L10BA):
         """Calculates the hot/cold factor for a hitter.
@@ -543,13 +902,9 @@ class BetPredictor():
         Returns:
             A tuple, containing the hot/cold factor description as a string and hot/cold factor value as a float.
         """
-       
-        '''
-        The calculation portion of this method has been omitted for privacy reasons.
-        If you wish to know more about how the hitting bet predictions are created, reach out to me.
-        '''
-        
-        return description, factor
+        #Score the hitter as a slate of one (see CalculateHotColdFactors()).
+        descriptions, factors = self.CalculateHotColdFactors(np.array([a_L10PlateAppearances]), np.array([a_L10BA]))
+        return str(descriptions[0]), float(factors[0])
         
     def CalculateCareerStatsFactor(self, a_careerPlateAppearances, a_careerBA):
         """Calculates the career stats factor for a hitter off a pitcher.
@@ -564,13 +919,9 @@ class BetPredictor():
             A tuple, containing the career stats factor description as a string and career stats factor value as a
             float.
         """
-        
-        '''
-        The calculation portion of this method has been omitted for privacy reasons.
-        If you wish to know more about how the hitting bet predictions are created, reach out to me.
-        '''
-        
-        return description, factor
+        #Score the hitter as a slate of one (see CalculateCareerStatsFactors()).
+        descriptions, factors = self.CalculateCareerStatsFactors(np.array([a_careerPlateAppearances]), np.array([a_careerBA]))
+        return str(descriptions[0]), float(factors[0])
     
     def CalculateOverallHittingScore(self, a_adjustedBA, a_hotColdFactor, a_careerStatsFactor, a_weatherFactor, a_ballparkFactor):
         """Calculates the overall hitting score for a hitter.
@@ -587,27 +938,242 @@ class BetPredictor():
         Returns:
             A float, representing the overall hitting score for that hitter.
         """
+        #Score the hitter as a slate of one (see CalculateOverallHittingScores()).
+        overallHittingScores = self.CalculateOverallHittingScores(np.array([a_adjustedBA]), np.array([a_hotColdFactor]), np.array([a_careerStatsFactor]),
+                                                                  np.array([a_weatherFactor]), np.array([a_ballparkFactor]))
+        return float(overallHittingScores[0])
+
+    #VECTORIZED SCORING METHODS
+    def CalculatePitchingScores(self, a_pitchingStats, a_homeOrAway):
+        """Calculates the pitching scores for many pitchers at once.
+
+        This method is the array-based version of CalculatePitchingScore(). Each statistic is a NumPy array with one
+        entry per pitcher, so an entire slate (or archive) of pitchers is scored with a handful of array operations
+        instead of one Python call per pitcher.
+
+        Args:
+            a_pitchingStats (dict): A dictionary mapping each pitching statistic to a NumPy array of its values.
+            a_homeOrAway (numpy.ndarray): An array of strings indicating if each pitcher is on the home or away team.
+
+        Returns:
+            A NumPy array of floats, representing the pitching score calculated for each pitcher.
+        """
+        
+        '''
+        The calculation portion of this method has been omitted for privacy reasons.
+        If you wish to know more about how the NRFI/YRFI bet predictions are created, reach out to me.
+        '''
+        
+        return pitchingScores
+
+    def CalculateTeamHittingScores(self, a_teamStats, a_homeOrAway):
+        """Calculates the team hitting scores for many teams at once.
+
+        This method is the array-based version of CalculateTeamHittingScore().
+
+        Args:
+            a_teamStats (dict): A dictionary mapping each team offensive statistic to a NumPy array of its values.
+            a_homeOrAway (numpy.ndarray): An array of strings indicating if each team is the home or away team.
+
+        Returns:
+            A NumPy array of floats, representing the team hitting score calculated for each team.
+        """
+        
+        '''
+        The calculation portion of this method has been omitted for privacy reasons.
+        If you wish to know more about how the NRFI/YRFI bet predictions are created, reach out to me.
+        '''
+        
+        return teamHittingScores
+
+    def CalculateOverallNRFIScores(self, a_homePitcherNRFIScores, a_awayPitcherNRFIScores, a_ballparkFactors, a_weatherFactors):
+        """Calculates the overall NRFI scores for many games at once.
+
+        This method is the array-based version of CalculateOverallNRFIScore().
+
+        Args:
+            a_homePitcherNRFIScores (numpy.ndarray): The NRFI scores for the home team pitchers.
+            a_awayPitcherNRFIScores (numpy.ndarray): The NRFI scores for the away team pitchers.
+            a_ballparkFactors (numpy.ndarray): The ballpark factors of the stadiums where the games are being played.
+            a_weatherFactors (numpy.ndarray): The weather factors at the stadiums where the games are being played.
+
+        Returns:
+            A NumPy array of floats, representing the overall NRFI score for each game.
+        """
+        
+        '''
+        The calculation portion of this method has been omitted for privacy reasons.
+        If you wish to know more about how the NRFI/YRFI bet predictions are created, reach out to me.
+        '''
+
+        return overallNRFIScores
+
+    def CalculateAdjustedBAs(self, a_vsLeftBAs, a_vsRightBAs, a_vsLeftBAAs, a_vsRightBAAs, a_batHands, a_pitchHands):
+        """Calculates the adjusted batting averages for many hitters at once.
+
+        This method is the array-based version of CalculateAdjustedBA(). The choice of split for each hitter is made
+        with array masks on the bat and pitch hands rather than with Python if statements.
+
+        Args:
+            a_vsLeftBAs (numpy.ndarray): The batting averages of the hitters when facing lefty pitchers.
+            a_vsRightBAs (numpy.ndarray): The batting averages of the hitters when facing righty pitchers.
+            a_vsLeftBAAs (numpy.ndarray): The batting averages against of the pitchers when facing lefty hitters.
+            a_vsRightBAAs (numpy.ndarray): The batting averages against of the pitchers when facing righty hitters.
+            a_batHands (numpy.ndarray): The batting hands of the hitters (left, right, or switch).
+            a_pitchHands (numpy.ndarray): The throwing hands of the pitchers (left or right).
+
+        Returns:
+            A NumPy array of floats, representing the adjusted batting average for each hitter.
+        """
+        
+        '''
+        The calculation portion of this method has been omitted for privacy reasons.
+        If you wish to know more about how the hitting bet predictions are created, reach out to me.
+        '''
+        
+        return adjustedBAs
+
+    def CalculateHotColdFactors(self, a_L10PlateAppearances, a_L10BAs):
+        """Calculates the hot/cold factors for many hitters at once.
+
+        This method is the array-based version of CalculateHotColdFactor().
+
+        Args:
+            a_L10PlateAppearances (numpy.ndarray): The number of plate appearances of the hitters in their last 10 games.
+            a_L10BAs (numpy.ndarray): The batting averages of the hitters in their last 10 games.
+
+        Returns:
+            A tuple, containing a NumPy array of the hot/cold factor descriptions and a NumPy array of the hot/cold
+            factor values.
+        """
+        
+        '''
+        The calculation portion of this method has been omitted for privacy reasons.
+        If you wish to know more about how the hitting bet predictions are created, reach out to me.
+        '''
+        
+        return descriptions, factors
+
+    def CalculateCareerStatsFactors(self, a_careerPlateAppearances, a_careerBAs):
+        """Calculates the career stats factors for many hitters at once.
+
+        This method is the array-based version of CalculateCareerStatsFactor().
+
+        Args:
+            a_careerPlateAppearances (numpy.ndarray): The number of plate appearances of the hitters facing their pitchers.
+            a_careerBAs (numpy.ndarray): The batting averages of the hitters when facing their pitchers.
+
+        Returns:
+            A tuple, containing a NumPy array of the career stats factor descriptions and a NumPy array of the career
+            stats factor values.
+        """
         
         '''
         The calculation portion of this method has been omitted for privacy reasons.
         If you wish to know more about how the hitting bet predictions are created, reach out to me.
         '''
         
-        return overallHittingScore
+        return descriptions, factors
+
+    def CalculateOverallHittingScores(self, a_adjustedBAs, a_hotColdFactors, a_careerStatsFactors, a_weatherFactors, a_ballparkFactors):
+        """Calculates the overall hitting scores for many hitters at once.
+
+        This method is the array-based version of CalculateOverallHittingScore().
+
+        Args:
+            a_adjustedBAs (numpy.ndarray): The adjusted batting averages of the hitters.
+            a_hotColdFactors (numpy.ndarray): The hot/cold factors of the hitters based on their last 10 games.
+            a_careerStatsFactors (numpy.ndarray): The career stats factors of the hitters off their pitchers.
+            a_weatherFactors (numpy.ndarray): The weather factors at the stadiums where the games are being played.
+            a_ballparkFactors (numpy.ndarray): The ballpark factors of the stadiums where the games are being played.
+
+        Returns:
+            A NumPy array of floats, representing the overall hitting score for each hitter.
+        """
+        
+        '''
+        The calculation portion of this method has been omitted for privacy reasons.
+        If you wish to know more about how the hitting bet predictions are created, reach out to me.
+        '''
+        
+        return overallHittingScores
+
+    def ScoreNRFISlate(self, a_NRFIDataFrame):
+        """Re-calculates every NRFI/YRFI factor and score in a NRFI bet prediction DataFrame in one pass.
+
+        The statistics are pulled out of the DataFrame as whole columns (see PullPitcherStatsFromColumns() and
+        PullTeamStatsFromColumns()), and scored with the array-based scoring methods. This is used when re-scoring
+        archived bet predictions, where the weights may have changed since the predictions were made.
+
+        Args:
+            a_NRFIDataFrame (pandas.DataFrame): A NRFI/YRFI bet prediction DataFrame.
+
+        Returns:
+            A copy of the DataFrame with the factor and score columns re-calculated.
+        """
+        NRFIDataFrame = a_NRFIDataFrame.copy()
+
+        homePitcherStats = self.PullPitcherStatsFromColumns(NRFIDataFrame, 'Home')
+        awayPitcherStats = self.PullPitcherStatsFromColumns(NRFIDataFrame, 'Away')
+
+        homeTeamStats = self.PullTeamStatsFromColumns(NRFIDataFrame, 'Home')
+        awayTeamStats = self.PullTeamStatsFromColumns(NRFIDataFrame, 'Away')
+
+        #Re-calculate the overall NRFI values for every game at once.
+        '''
+        The calculation portion of this method has been omitted for privacy reasons.
+        If you wish to know more about how the NRFI/YRFI bet predictions are created, reach out to me.
+        '''
+
+        return NRFIDataFrame
+
+    def ScoreHittingSlate(self, a_hittingDataFrame):
+        """Re-calculates every hitting factor and score in a hitting bet prediction DataFrame in one pass.
+
+        Args:
+            a_hittingDataFrame (pandas.DataFrame): A hitting bet prediction DataFrame.
+
+        Returns:
+            A copy of the DataFrame with the factor and score columns re-calculated.
+        """
+        hittingDataFrame = a_hittingDataFrame.copy()
+
+        #Re-calculate the overall hitting values for every hitter at once.
+        '''
+        The calculation portion of this method has been omitted for privacy reasons.
+        If you wish to know more about how the hitting bet predictions are created, reach out to me.
+        '''
+
+        return hittingDataFrame
+
+    def ConvertStatsToArrays(self, a_statsList):
+        """Converts a list of statistics dictionaries into a dictionary of NumPy arrays.
+
+        Args:
+            a_statsList (list): A list of dictionaries that all contain the same statistics.
+
+        Returns:
+            A dictionary mapping each statistic to a NumPy array of its values, in the order of the provided list.
+        """
+        if not a_statsList:
+            return {}
+
+        return { stat: np.array([stats[stat] for stats in a_statsList]) for stat in a_statsList[0] }
 
     #ACCURACY TESTING METHODS
     def AccuracyTestNRFIYRFI(self, a_topX):
         """Tests the accuracy of NRFI and YRFI bets.
 
         This method is used to test the accuracy of NRFI and YRFI bets that have already been made. The NRFI and YRFI
-        bets for previous days are located in the \\Testing Data\\NRFI directory, in the form of Excel
-        spreadsheets. For each spreadsheet containing bet predictions, the spreadsheet is read in as a pandas
-        DataFrame. Then, all the factors and scores used in the NRFI and YRFI bet predictions are re-calculated in
-        case the weights of certain factors or statistics has been changed. The a_topX best NRFI and YRFI bets are
-        then extracted from the re-calculated bet predictions, and a Game object is created for each so that it can
-        be determined if a NRFI or YRFI occurred for that game. The success rates are tallied up, and once all games
-        have been reviewed, the success rates are returned. Spreadsheets that do not have the minimum required bet
-        predictions required are skipped and not included in the success rate calculation.
+        bets for previous days are located in the \\Testing Data\\NRFI directory, in the form of Excel spreadsheets.
+        For each spreadsheet containing bet predictions, the spreadsheet is read in as a pandas DataFrame (from its
+        Parquet copy when possible, see the TestingDataCache class). Then, all the factors and scores used in the NRFI
+        and YRFI bet predictions are re-calculated in case the weights of certain factors or statistics has been
+        changed. The a_topX best NRFI and YRFI bets are then extracted from the re-calculated bet predictions, and a
+        Game object is created for each so that it can be determined if a NRFI or YRFI occurred for that game. The
+        success rates are tallied up, and once all games have been reviewed, the success rates are returned.
+        Spreadsheets that do not have the minimum required bet predictions required are skipped and not included in
+        the success rate calculation.
 
         Args:
             a_topX (int): The number of top bets for each day to consider for the accuracy testing.
@@ -616,11 +1182,8 @@ class BetPredictor():
             A dictionary, containing both the NRFI and YRFI success rates, as well as the total games analyzed and the
             total NRFI and YRFI successes.
         """
-        #Directory of the NRFI test data.
-        directory = os.getcwd() + '\\Testing Data\\NRFI'
-        
         #Loop through each simulated day of bet predictions in the testing directory.
-        allFiles = os.listdir(directory)
+        allFiles = self.m_NRFITestingData.GetFileNames()
         
         #Counter variables to determine overall accuracy.
         totalGames = 0
@@ -629,28 +1192,15 @@ class BetPredictor():
         
         for file in allFiles:
             #Read in the contents of the file into a pandas DataFrame. Note: All testing data is in the format .xlsx (excel file).
-            nrfiDataFrame = pd.read_excel(directory + '\\' + file)
+            nrfiDataFrame = self.m_NRFITestingData.LoadFile(file, self.NRFI_TESTING_COLUMNS or None)
             
             #Skip empty data frames.
             if int(len(nrfiDataFrame) == 0):
                 continue
             
-            #Loop through each row of the DataFrame.
-            for index, game in nrfiDataFrame.iterrows():
-                #Pull the statistics from the individual game row for each pitcher and team.
-                homePitcherStats = self.PullPitcherStatsFromTable(game, 'Home')
-                awayPitcherStats = self.PullPitcherStatsFromTable(game, 'Away')
-                
-                homeTeamStats = self.PullTeamStatsFromTable(game, 'Home')
-                awayTeamStats = self.PullTeamStatsFromTable(game, 'Away')
-                
-                #Re-calculate the overall NRFI values. This is because the individual weights may have changed for each stat.
-                '''
-                The calculation portion of this method has been omitted for privacy reasons.
-                If you wish to know more about how the NRFI/YRFI bet predictions are created, reach out to me.
-                '''
-                
-                sortedNRFIDataFrame = nrfiDataFrame.sort_values(by='Overall NRFI Score')           
+            #Re-calculate the overall NRFI values for the whole day at once. This is because the individual weights may have changed for each stat.
+            #A stable sort keeps tied scores in their original order (see CountSuccesses() in the NRFITestingData class).
+            sortedNRFIDataFrame = self.ScoreNRFISlate(nrfiDataFrame).sort_values(by='Overall NRFI Score', kind='stable')
                 
             #Extract the best 3 NRFI predictions and the worst 3 NRFI predictions (for YRFI). Make sure there is the minimum number of predictions.
             if int(len(sortedNRFIDataFrame) < (a_topX * 2)) or int(len(sortedNRFIDataFrame)) < self.MINIMUM_PREDICTIONS_FOR_NRFIYRFI:
@@ -663,20 +1213,18 @@ class BetPredictor():
 
             #Loop through each best NRFI prediction.         
             for index, game in topXNRFI.iterrows():
-                #Extract the game ID from the game, and create a Game object based on the game ID.
+                #Extract the game ID from the game, and look up its result (see the OutcomeCache class).
                 gameID = game['Game ID']
-                gameObj = Game(gameID)
                 
-                if not gameObj.DidYRFIOccur():
+                if not self.m_outcomeCache.DidYRFIOccur(gameID):
                     totalNRFI += 1
                     
             #Loop through each best YRFI prediction.         
             for index, game in topXYRFI.iterrows():
-                #Extract the game ID from the game, and create a Game object based on the game ID.
+                #Extract the game ID from the game, and look up its result (see the OutcomeCache class).
                 gameID = game['Game ID']
-                gameObj = Game(gameID)
                 
-                if gameObj.DidYRFIOccur():
+                if self.m_outcomeCache.DidYRFIOccur(gameID):
                     totalYRFI += 1
         
         #Return the total percentage of success for NRFI predictions and YRFI predictions.
@@ -697,7 +1245,8 @@ class BetPredictor():
 
         This method is used to test the accuracy of the hitting bets that have already been made. The hitting bets
         for previous days are located in the \\Testing Data\\Hitting directory, in the form of Excel spreadsheets.
-        For each spreadsheet containing bet predictions, the spreadsheet is read in as a pandas DataFrame. Then,
+        For each spreadsheet containing bet predictions, the spreadsheet is read in as a pandas DataFrame (from its
+        Parquet copy when possible, see the TestingDataCache class). Then,
         all the factors and scores used in the hitting bet predictions are re-calculated in case the weights of
         certain factors or statistics has been changed. The a_topX best hitting bet prediction scores are extracted
         from the re-calculated bet predictions, and a Hitter object is created for each of the hitters. Using that
@@ -714,11 +1263,8 @@ class BetPredictor():
             This includes the success rates for over 0.5 hits, over 1.5 hits, over 1.5 hits + runs + RBIs, and over
             2.5 hits + runs + RBIs. The total hitters analyzed and totals for these bet types are included as well.
         """
-        #Directory of the Hitting test data.
-        directory = os.getcwd() + '\\Testing Data\\Hitting'
-        
         #Loop through each simulated day of bet predictions in the testing directory.
-        allFiles = os.listdir(directory)
+        allFiles = self.m_hittingTestingData.GetFileNames()
         
         #Counter variables to determine overall accuracy. Note: HRR = Hits, Runs, and RBIs combined.
         totalHitters = 0
@@ -729,21 +1275,14 @@ class BetPredictor():
         
         for file in allFiles:
             #Read in the contents of the file into a pandas DataFrame. Note: All testing data is in the format .xlsx (excel file).
-            hittingDataFrame = pd.read_excel(directory + '\\' + file)
+            hittingDataFrame = self.m_hittingTestingData.LoadFile(file, self.HITTING_TESTING_COLUMNS or None)
             
             #Skip empty data frames.
             if int(len(hittingDataFrame) == 0):
                 continue
             
-            #Loop through each row of the DataFrame.
-            for index, hitter in hittingDataFrame.iterrows():
-                #Pull the statistics of interest involved in making the overall hitting prediction score.
-                '''
-                The calculation portion of this method has been omitted for privacy reasons.
-                If you wish to know more about how the hitting bet predictions are created, reach out to me.
-                '''
-
-                sortedHittingDataFrame = hittingDataFrame.sort_values(by='Overall Hitting Score', ascending=False)   
+            #Re-calculate the overall hitting values for the whole day at once.
+            sortedHittingDataFrame = self.ScoreHittingSlate(hittingDataFrame).sort_values(by='Overall Hitting Score', ascending=False)
             
             #Extract the top X hitters from the data frame. Make sure there is the minimum number of predictions.
             if int(len(sortedHittingDataFrame)) < self.MINIMUM_PREDICTIONS_FOR_HITTING:
@@ -756,9 +1295,8 @@ class BetPredictor():
                 hitterID = hitter['Hitter ID']
                 gameDate = hitter['Date']
             
-                #Create a Hitter object from that hitter's ID and extract their stats from that day.
-                hitterObj = Hitter(hitterID)
-                betStats = hitterObj.HittingBetReview(gameDate)
+                #Extract the hitter's stats from that day (see the OutcomeCache class).
+                betStats = self.m_outcomeCache.GetHittingBetReview(hitterID, gameDate, hitter['Game ID'])
                 
                 #Make sure the hitter played that day, if they didn't, skip the hitter. Sometimes hitters have off-days.
                 if not betStats:
@@ -802,6 +1340,34 @@ class BetPredictor():
         
         return formattedDictionary
     
+    def PullPitcherStatsFromColumns(self, a_NRFIDataFrame, a_homeOrAway):
+        """Helper method for the ScoreNRFISlate() method, to pull the pitcher stats of every game as whole columns.
+
+        Args:
+            a_NRFIDataFrame (pandas.DataFrame): A NRFI/YRFI bet prediction DataFrame.
+            a_homeOrAway (string): A string indicating to pull stats for the home or away pitchers.
+
+        Returns:
+            A dictionary mapping each pitcher statistic to a NumPy array of its values, one per game.
+        """
+        formattedDictionary = {} #Omitted.
+        
+        return formattedDictionary
+
+    def PullTeamStatsFromColumns(self, a_NRFIDataFrame, a_homeOrAway):
+        """Helper method for the ScoreNRFISlate() method, to pull the team stats of every game as whole columns.
+
+        Args:
+            a_NRFIDataFrame (pandas.DataFrame): A NRFI/YRFI bet prediction DataFrame.
+            a_homeOrAway (string): A string indicating to pull stats for the home or away teams.
+
+        Returns:
+            A dictionary mapping each team statistic to a NumPy array of its values, one per game.
+        """
+        formattedDictionary = {} #Omitted.
+        
+        return formattedDictionary
+    
     def PullTeamStatsFromTable(self, a_gameRow, a_homeOrAway):
         """Helper method for the AccuracyTestNRFIYRFI() method, to pull the team stats from the bet prediction table.
 
@@ -817,29 +1383,161 @@ class BetPredictor():
         return formattedDictionary
     
     #BAYESIAN OPTIMIZATION METHODS
-    def NRFIBlackBoxFunction(self):
+    def NRFIBlackBoxFunction(self, **a_weights):
         """Calculates the NRFI bet prediction accuracy with provided weights for each statistic.
 
-        This method acts as the black box method for the Bayesian Optimization algorithm. First, the passed weights
-        are normalized so that the pitcher related weights as well as the team offensive related weights add up to 1. 
-        Then, the actual weights are set to the updated weights and the bet predictions are re-calculated and new accuracy 
-        determined (see AccuracyTestNRFIYRFI()). The accuracy value is returned and is used to help optimize the weights of 
-        each statistic to produce the highest possible accuracy percentage.
+        This method acts as the black box method for the Bayesian Optimization algorithm. The passed weights are
+        evaluated as a batch of one (see EvaluateNRFIWeights()), which normalizes them and determines their accuracy
+        against the in-memory NRFI testing data. This gives the same result as AccuracyTestNRFIYRFI(), but since the
+        testing data and game results are only loaded once, each call takes milliseconds. The accuracy value is
+        returned and is used to help optimize the weights of each statistic to produce the highest possible accuracy
+        percentage.
+
+        Args:
+            **a_weights (float): The value of each weight, keyed by the names in NRFI_WEIGHT_NAMES.
 
         Returns:
             A float, representing the accuracy of the newly generated NRFI bet predictions with the provided weights for
             each statistic.
         """
-        #Find the sums of all the weights for the pitcher statistics and all the weights for the team offensive statistics.
+        #Find the accuracy percentage for the best NRFI prediction and return that value. This is the value that is trying to be optimized.
+        weightVector = np.array([a_weights[weightName] for weightName in self.NRFI_WEIGHT_NAMES])
+        accuracies = self.EvaluateNRFIWeights(weightVector[np.newaxis, :], 1)
+        return float(accuracies['NRFI Success Rate'][0])
+
+    def EvaluateNRFIWeights(self, a_weightMatrix, a_topX = 1, a_incumbentAccuracy = None):
+        """Calculates the NRFI and YRFI accuracy of many candidate weight vectors at once.
+
+        This method is the batched version of NRFIBlackBoxFunction(), and can be used for grid scans, random restarts
+        or population based searches over the same objective. First, every row of the weight matrix is normalized so
+        that the pitcher related weights as well as the team offensive related weights add up to 1. The rows are then
+        split into chunks, and each chunk is evaluated in one vectorized pass over the in-memory NRFI testing data
+        (see EvaluateNRFIChunk()). When there is more than one chunk, they are evaluated on several threads, since
+        NumPy releases the GIL during the matrix products and sorts. If an incumbent accuracy is provided, candidates
+        are scored on a growing subset of days and stopped as soon as they are very unlikely to beat it (see
+        EvaluateWeightMatrixWithEarlyStopping() in the NRFITestingData class).
+
+        Args:
+            a_weightMatrix (numpy.ndarray): A 2D array of shape candidates x weights, with the columns in the order of
+                                            NRFI_WEIGHT_NAMES.
+            a_topX (int): The number of top bets for each day to consider.
+            a_incumbentAccuracy (float): The best NRFI accuracy found so far. Every candidate is scored on every day if
+                                         it is not provided.
+
+        Returns:
+            A dictionary, containing the NRFI success rates and total NRFI successes as NumPy arrays with one entry per
+            candidate, as well as the total games analyzed. Without an incumbent accuracy, the YRFI success rates and
+            total YRFI successes are included as well. With one, whether each candidate was stopped early and the
+            number of days it was scored on are included instead, and the success rate of a stopped candidate is NaN.
+
+        Assistance Received:
+            - https://numpy.org/doc/stable/reference/generated/numpy.take_along_axis.html
+        """
+        weightMatrix = np.array(a_weightMatrix, dtype=float, ndmin=2)
+
+        #Find the sums of all the weights for the pitcher statistics and all the weights for the team offensive statistics, for each candidate.
         
         '''
         The calculation portion of this method has been omitted for privacy reasons.
         If you wish to know more about how the NRFI/YRFI bet predictions are created, reach out to me.
         '''
 
-        #Find the accuracy percentage for the best NRFI prediction and return that value. This is the value that is trying to be optimized.
-        accuracy = self.AccuracyTestNRFIYRFI(1)
-        return accuracy['NRFI Success Rate']
+        testingTensor = self.GetNRFITestingTensor()
+        chunks = [weightMatrix[start:start + self.NRFI_EVALUATION_CHUNK_SIZE] for start in range(0, len(weightMatrix), self.NRFI_EVALUATION_CHUNK_SIZE)]
+
+        #A single chunk (such as the one point evaluated by NRFIBlackBoxFunction()) is evaluated without starting any threads.
+        if len(chunks) == 1:
+            chunkAccuracies = [self.EvaluateNRFIChunk(testingTensor, chunks[0], a_topX, a_incumbentAccuracy)]
+        else:
+            with ThreadPoolExecutor(max_workers=self.MAXIMUM_EVALUATION_WORKERS) as executor:
+                chunkAccuracies = list(executor.map(self.EvaluateNRFIChunk, [testingTensor] * len(chunks), chunks,
+                                                    [a_topX] * len(chunks), [a_incumbentAccuracy] * len(chunks)))
+
+        #Every chunk is evaluated over the same days, so either all or none of them found games.
+        if not chunkAccuracies or isinstance(chunkAccuracies[0], str):
+            return 'No games found in test data!'
+
+        #Join the per candidate arrays of every chunk. The total games analyzed is the same for every chunk.
+        return { key: np.concatenate([accuracies[key] for accuracies in chunkAccuracies]) if isinstance(value, np.ndarray) else value
+                 for key, value in chunkAccuracies[0].items() }
+
+    def EvaluateNRFIChunk(self, a_testingTensor, a_weightMatrix, a_topX = 1, a_incumbentAccuracy = None):
+        """Calculates the NRFI and YRFI accuracy of a chunk of normalized weight vectors.
+
+        This method is a helper method for the EvaluateNRFIWeights() method.
+
+        Args:
+            a_testingTensor (NRFITestingData): The in-memory NRFI testing data (see GetNRFITestingTensor()).
+            a_weightMatrix (numpy.ndarray): A 2D array of shape candidates x weights, already normalized.
+            a_topX (int): The number of top bets for each day to consider.
+            a_incumbentAccuracy (float): The best NRFI accuracy found so far, used for early stopping if provided.
+
+        Returns:
+            A dictionary, containing the accuracies of the chunk (see EvaluateWeightMatrix() and
+            EvaluateWeightMatrixWithEarlyStopping() in the NRFITestingData class).
+        """
+        if a_incumbentAccuracy is None:
+            return a_testingTensor.EvaluateWeightMatrix(a_weightMatrix, a_topX, self.MINIMUM_PREDICTIONS_FOR_NRFIYRFI)
+
+        return a_testingTensor.EvaluateWeightMatrixWithEarlyStopping(a_weightMatrix, a_incumbentAccuracy, a_topX, self.MINIMUM_PREDICTIONS_FOR_NRFIYRFI)
+
+    def GetNRFITestingTensor(self, a_reload = False):
+        """Gets the NRFI testing data as an in-memory feature tensor and outcome array.
+
+        The first time this method is called, every day of NRFI testing data is loaded (see the TestingDataCache
+        class), turned into a feature matrix (see CreateNRFIFeatureMatrix()), and stacked into a NRFITestingData
+        object. The result of the first inning of every game is then looked up once. Later calls return the same
+        object.
+
+        Args:
+            a_reload (bool): If true, the testing data is loaded again even if it has already been loaded.
+
+        Returns:
+            A NRFITestingData object holding every day of NRFI testing data.
+        """
+        if self.m_NRFITensor is not None and not a_reload:
+            return self.m_NRFITensor
+
+        dayFeatures = []
+        dayGameIDs = []
+        fileNames = []
+        for file in self.m_NRFITestingData.GetFileNames():
+            nrfiDataFrame = self.m_NRFITestingData.LoadFile(file, self.NRFI_TESTING_COLUMNS or None)
+
+            #Skip empty data frames.
+            if len(nrfiDataFrame) == 0:
+                continue
+
+            dayFeatures.append(self.CreateNRFIFeatureMatrix(nrfiDataFrame))
+            dayGameIDs.append(nrfiDataFrame['Game ID'].tolist())
+            fileNames.append(file)
+
+        self.m_NRFITensor = NRFITestingData(dayFeatures, dayGameIDs, fileNames)
+        self.m_NRFITensor.LoadOutcomes(self.m_outcomeCache.DidYRFIOccur)
+
+        return self.m_NRFITensor
+
+    def CreateNRFIFeatureMatrix(self, a_NRFIDataFrame):
+        """Creates the NRFI feature matrix for a day of NRFI bet predictions.
+
+        Each row of the matrix is a game, and each column is the contribution of one statistic (in the order of
+        NRFI_WEIGHT_NAMES) to that game's overall NRFI score before it is multiplied by its weight. The ballpark and
+        weather factors of each game are already applied to its row, so the overall NRFI score of every game is the
+        product of the matrix with the weight vector.
+
+        Args:
+            a_NRFIDataFrame (pandas.DataFrame): A NRFI/YRFI bet prediction DataFrame for a single day.
+
+        Returns:
+            A 2D NumPy array of shape games x statistics.
+        """
+        
+        '''
+        The calculation portion of this method has been omitted for privacy reasons.
+        If you wish to know more about how the NRFI/YRFI bet predictions are created, reach out to me.
+        '''
+        
+        return featureMatrix
 
     def OptimizeNRFIWeights(self, a_lowerBounds, a_upperBounds, a_numInitPoints, a_numberOfIterations):
         """Optimizes the weights of statistics for NRFI/YRFI bet prediction creation.
@@ -892,4 +1590,285 @@ class BetPredictor():
         If you wish to know more about how the NRFI/YRFI bet predictions are created, reach out to me.
         '''
             
-        return optimizedWeights
\ No newline at end of file
+        return optimizedWeights
+
+    def OptimizeNRFIWeightsInBatches(self, a_lowerBounds, a_upperBounds, a_numInitPoints, a_numberOfIterations, a_batchSize = 4,
+                                     a_processes = 1, a_logPath = None, a_earlyStopping = False):
+        """Optimizes the weights of statistics for NRFI/YRFI bet prediction creation, evaluating several points per round.
+
+        This method is the batch version of OptimizeNRFIWeights(). Instead of evaluating one point at a time, each round
+        a_batchSize points are proposed (see ProposeNRFIBatch()) and evaluated together (see EvaluateNRFIBatch()),
+        either in one vectorized pass or split across a_processes worker processes. The first a_numInitPoints points
+        are chosen randomly, as they are with maximize(). Every observed point is appended to a JSON-lines log as soon
+        as it is evaluated. If the log already exists when the optimization starts, its points are registered with the
+        optimizer first and count towards the total, so an interrupted optimization continues where it left off
+        instead of starting over. With early stopping, points that were stopped before being scored on every day have
+        no real accuracy, so they are never registered with the optimizer. They are logged without a target, and are
+        only used to keep the proposals away from them (see ProposeNRFIBatch()).
+
+        Args:
+            a_lowerBounds (float): The lower bound of what the weights can be (usually 0).
+            a_upperBounds (float): The upper bound of what the weights can be (usually 1).
+            a_numInitPoints (int): The total number of initial points of random exploration used in the optimization.
+            a_numberOfIterations (int): The total number of iterations to run the algorithm for.
+            a_batchSize (int): The number of points proposed and evaluated each round.
+            a_processes (int): The number of worker processes to evaluate each round with. 1 (the default) evaluates
+                               each round in the current process.
+            a_logPath (string): The path of the JSON-lines log of observed points. No log is kept if not provided.
+            a_earlyStopping (bool): If true, points that are very unlikely to beat the best accuracy found before their
+                                    round are only scored on part of the testing data (see EvaluateNRFIWeights()).
+
+        Returns:
+            A dictionary, containing all the optimized version of the weights used in NRFY/YRFI bet prediction
+            creation. Each weight is between 0 and 1, and both the pitcher and team offense weights add up to 1
+            separately.
+
+        Raises:
+            ValueError: If no point with a known accuracy was observed (see LoadOptimizationLog()).
+
+        Assistance Received:
+            - https://github.com/bayesian-optimization/BayesianOptimization/blob/master/examples/advanced-tour.ipynb
+            - https://hal.science/hal-00732512/document
+        """
+        bounds = { weightName: (a_lowerBounds, a_upperBounds) for weightName in self.NRFI_WEIGHT_NAMES }
+        optimizer = BayesianOptimization(f=None, pbounds=bounds, random_state=1, verbose=0)
+
+        #Resume from any points observed by a previous run. Points that were stopped early are not observations.
+        totalEvaluated = 0
+        stoppedPoints = []
+        if a_logPath and os.path.exists(a_logPath):
+            for observation in self.LoadOptimizationLog(a_logPath):
+                if observation.get('stoppedEarly'):
+                    stoppedPoints.append(observation['params'])
+                else:
+                    self.RegisterObservation(optimizer, observation['params'], observation['target'])
+                totalEvaluated += 1
+
+        #Seed the random points with the number of points already observed, so a resumed run does not repeat them.
+        randomState = np.random.RandomState(totalEvaluated + 1)
+        totalPoints = a_numInitPoints + a_numberOfIterations
+
+        #The testing data is loaded once here and sent to each worker process when it starts. The workers are started
+        #fresh rather than forked, since this process already has thread pools running (see EvaluateNRFIWeights()).
+        executor = None
+        if a_processes > 1:
+            executor = ProcessPoolExecutor(max_workers=a_processes, mp_context=multiprocessing.get_context('spawn'),
+                                           initializer=BetPredictor.InitializeNRFIWorker, initargs=(self.GetNRFITestingTensor(),))
+
+        try:
+            while totalEvaluated < totalPoints:
+                batchSize = min(a_batchSize, totalPoints - totalEvaluated)
+
+                #Random exploration first, then batches proposed by the optimizer.
+                if totalEvaluated < a_numInitPoints or len(optimizer.space) == 0:
+                    batchSize = min(batchSize, max(a_numInitPoints - totalEvaluated, 1))
+                    batch = [self.CreateRandomWeights(bounds, randomState) for _ in range(batchSize)]
+                else:
+                    batch = self.ProposeNRFIBatch(optimizer, bounds, batchSize, randomState, stoppedPoints)
+
+                incumbentAccuracy = optimizer.max['target'] if a_earlyStopping and len(optimizer.space) else None
+                targets = self.EvaluateNRFIBatch(batch, executor, a_processes, incumbentAccuracy)
+
+                #A NaN target means the point was stopped early, and its accuracy is unknown.
+                for params, target in zip(batch, targets):
+                    if np.isnan(target):
+                        stoppedPoints.append(params)
+                    else:
+                        self.RegisterObservation(optimizer, params, target)
+
+                if a_logPath:
+                    self.AppendOptimizationLog(a_logPath, batch, targets)
+
+                totalEvaluated += len(batch)
+                print('Evaluated', totalEvaluated, 'of', totalPoints, 'points. Best accuracy so far:', optimizer.max['target'])
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        #A resumed log may hold nothing but points that were stopped early, none of which have a real accuracy.
+        if len(optimizer.space) == 0:
+            raise ValueError('No points with a known accuracy were observed. Increase the number of points, or remove the log at '
+                             + str(a_logPath) + ' to start over.')
+
+        optimizedWeights = dict(optimizer.max['params'])
+
+        #Re-normalize the pitcher and team weights to add back up to 1.
+        '''
+        The calculation portion of this method has been omitted for privacy reasons.
+        If you wish to know more about how the NRFI/YRFI bet predictions are created, reach out to me.
+        '''
+
+        return optimizedWeights
+
+    def ProposeNRFIBatch(self, a_optimizer, a_bounds, a_batchSize, a_randomState, a_stoppedPoints = None):
+        """Proposes a batch of points to evaluate next, using the constant liar strategy.
+
+        This method is a helper method for the OptimizeNRFIWeightsInBatches() method. A separate proposal optimizer
+        is given every real observation. A point is then suggested, and registered with the proposal optimizer as if it
+        had scored the worst accuracy observed so far (the "lie"), which steers the next suggestion away from it. This
+        is repeated until the batch is full. If a suggestion repeats a point that has already been registered, a
+        random point is used instead. Points that were stopped early are given the lie as well, so they are not
+        proposed again, but they never reach the optimizer holding the real observations.
+
+        Args:
+            a_optimizer (BayesianOptimization): The optimizer holding every real observation.
+            a_bounds (dict): The lower and upper bounds of each weight.
+            a_batchSize (int): The number of points to propose.
+            a_randomState (numpy.random.RandomState): The random number generator used for the proposals.
+            a_stoppedPoints (list): A list of dictionaries, each mapping every weight name to the value of a point that
+                                    was stopped early.
+
+        Returns:
+            A list of dictionaries, each mapping every weight name to its proposed value.
+        """
+        proposalOptimizer = BayesianOptimization(f=None, pbounds=a_bounds, random_state=a_randomState.randint(2 ** 31 - 1), verbose=0)
+        for params, target in zip(a_optimizer.space.params, a_optimizer.space.target):
+            proposalOptimizer.register(params=a_optimizer.space.array_to_params(params), target=target)
+
+        lie = float(np.min(a_optimizer.space.target))
+        for point in a_stoppedPoints or []:
+            self.RegisterObservation(proposalOptimizer, point, lie)
+
+        batch = []
+        while len(batch) < a_batchSize:
+            if UtilityFunction is not None:
+                point = proposalOptimizer.suggest(UtilityFunction(kind='ucb', kappa=2.576, xi=0.0))
+            else:
+                point = proposalOptimizer.suggest()
+
+            point = { weightName: float(point[weightName]) for weightName in a_bounds }
+            if not self.RegisterObservation(proposalOptimizer, point, lie):
+                point = self.CreateRandomWeights(a_bounds, a_randomState)
+                self.RegisterObservation(proposalOptimizer, point, lie)
+
+            batch.append(point)
+
+        return batch
+
+    def EvaluateNRFIBatch(self, a_batch, a_executor = None, a_processes = 1, a_incumbentAccuracy = None):
+        """Evaluates the NRFI accuracy of a batch of weights.
+
+        This method is a helper method for the OptimizeNRFIWeightsInBatches() method. Without an executor, the whole
+        batch is evaluated in one vectorized pass (see EvaluateNRFIWeights()). With an executor, the batch is split
+        into one chunk per worker process, and the chunks are evaluated at the same time.
+
+        Args:
+            a_batch (list): A list of dictionaries, each mapping every weight name to its value.
+            a_executor (ProcessPoolExecutor): The pool of worker processes to evaluate the batch with, if any.
+            a_processes (int): The number of worker processes in the pool.
+            a_incumbentAccuracy (float): The best NRFI accuracy found so far, used for early stopping if provided.
+
+        Returns:
+            A list of floats, representing the NRFI accuracy of each point in the batch. Points that were stopped early
+            are NaN.
+        """
+        weightMatrix = np.array([[params[weightName] for weightName in self.NRFI_WEIGHT_NAMES] for params in a_batch])
+
+        if a_executor is None:
+            return self.EvaluateNRFIWeights(weightMatrix, 1, a_incumbentAccuracy)['NRFI Success Rate'].tolist()
+
+        chunks = [chunk for chunk in np.array_split(weightMatrix, min(a_processes, len(weightMatrix))) if len(chunk)]
+        chunkAccuracies = a_executor.map(BetPredictor.EvaluateNRFIWeightsInWorker, chunks, [a_incumbentAccuracy] * len(chunks))
+        return np.concatenate(list(chunkAccuracies)).tolist()
+
+    def RegisterObservation(self, a_optimizer, a_params, a_target):
+        """Registers an observed point with an optimizer, unless the optimizer has already seen that point.
+
+        Args:
+            a_optimizer (BayesianOptimization): The optimizer to register the point with.
+            a_params (dict): A dictionary mapping every weight name to its value.
+            a_target (float): The accuracy observed at the point.
+
+        Returns:
+            A boolean, true if the point was registered, false if it was a duplicate.
+        """
+        point = a_optimizer.space.params_to_array(a_params)
+        if len(a_optimizer.space) and np.any(np.all(np.isclose(a_optimizer.space.params, point), axis=1)):
+            return False
+
+        a_optimizer.register(params=a_params, target=a_target)
+        return True
+
+    def CreateRandomWeights(self, a_bounds, a_randomState):
+        """Creates a random point within the bounds of each weight.
+
+        Args:
+            a_bounds (dict): The lower and upper bounds of each weight.
+            a_randomState (numpy.random.RandomState): The random number generator to use.
+
+        Returns:
+            A dictionary mapping every weight name to a random value within its bounds.
+        """
+        return { weightName: float(a_randomState.uniform(lower, upper)) for weightName, (lower, upper) in a_bounds.items() }
+
+    def LoadOptimizationLog(self, a_logPath):
+        """Loads every observed point from a JSON-lines optimization log.
+
+        A partially written last line (from a run that was interrupted while writing) is ignored. Points that were
+        stopped early have no target, and are marked with 'stoppedEarly'.
+
+        Args:
+            a_logPath (string): The path of the log.
+
+        Returns:
+            A list of dictionaries, each containing the 'params' and 'target' of an observed point, and 'stoppedEarly'
+            for points that were stopped early.
+        """
+        observations = []
+        with open(a_logPath, 'r') as logFile:
+            for line in logFile:
+                try:
+                    observations.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+
+        return observations
+
+    def AppendOptimizationLog(self, a_logPath, a_batch, a_targets):
+        """Appends a batch of observed points to a JSON-lines optimization log.
+
+        Args:
+            a_logPath (string): The path of the log.
+            a_batch (list): A list of dictionaries, each mapping every weight name to its value.
+            a_targets (list): The accuracy observed at each point in the batch, or NaN if it was stopped early.
+
+        Returns:
+            Nothing.
+        """
+        with open(a_logPath, 'a') as logFile:
+            for params, target in zip(a_batch, a_targets):
+                if np.isnan(target):
+                    observation = { 'params': params, 'target': None, 'stoppedEarly': True }
+                else:
+                    observation = { 'params': params, 'target': float(target) }
+
+                logFile.write(json.dumps(observation) + '\n')
+            logFile.flush()
+            os.fsync(logFile.fileno())
+
+    @staticmethod
+    def InitializeNRFIWorker(a_testingTensor):
+        """Prepares an optimization worker process to evaluate NRFI weights.
+
+        Args:
+            a_testingTensor (NRFITestingData): The in-memory NRFI testing data, loaded once by the parent process.
+
+        Returns:
+            Nothing.
+        """
+        BetPredictor.WORKER_PREDICTOR = BetPredictor()
+        BetPredictor.WORKER_PREDICTOR.m_NRFITensor = a_testingTensor
+
+    @staticmethod
+    def EvaluateNRFIWeightsInWorker(a_weightMatrix, a_incumbentAccuracy = None):
+        """Evaluates the NRFI accuracy of a chunk of weights inside an optimization worker process.
+
+        Args:
+            a_weightMatrix (numpy.ndarray): A 2D array of shape candidates x weights.
+            a_incumbentAccuracy (float): The best NRFI accuracy found so far, used for early stopping if provided.
+
+        Returns:
+            A NumPy array of floats, representing the NRFI accuracy of each candidate. Candidates that were stopped
+            early are NaN.
+        """
+        return BetPredictor.WORKER_PREDICTOR.EvaluateNRFIWeights(a_weightMatrix, 1, a_incumbentAccuracy)['NRFI Success Rate']
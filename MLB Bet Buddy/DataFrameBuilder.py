@@ -0,0 +1,86 @@
+#********************************************************************************************************************************
+# Author: Ian Pluchino                                                                                                          *
+# Class: DataFrameBuilder class                                                                                                 *
+# Description: Collects table rows column by column and creates the final pandas DataFrame in a single step.                   *
+# Date: 5/2/24                                                                                                                  *
+#********************************************************************************************************************************
+
+import pandas as pd
+
+class DataFrameBuilder():
+    #CONSTRUCTOR
+    def __init__(self, a_columns, a_columnTypes = None):
+        """Constructor for the DataFrameBuilder class.
+
+        This constructor is used to create an empty builder for a table with the provided columns. Rows added to the
+        builder are stored as one Python list per column, and the pandas DataFrame is only created once all the rows
+        have been added (see Build()). This avoids creating a new DataFrame for every row that is added.
+
+        Args:
+            a_columns (list): A list of strings, representing the columns of the table in order.
+            a_columnTypes (dict): A dictionary mapping column names to the pandas data type they should have in the
+                                  final DataFrame. Columns that are not included keep the type pandas infers.
+
+        Returns:
+            Nothing.
+        """
+        #The columns of the table, in the order they will appear in the final DataFrame.
+        self.m_columns = list(a_columns)
+
+        #The data types that certain columns will be converted to in the final DataFrame.
+        self.m_columnTypes = dict(a_columnTypes) if a_columnTypes else {}
+
+        #The values of each column, stored as a list per column.
+        self.m_columnData = { column: [] for column in self.m_columns }
+
+        #The total number of rows that have been added.
+        self.m_totalRows = 0
+
+    #GETTERS
+    def GetTotalRows(self):
+        """Gets the total number of rows that have been added to the builder.
+
+        Returns:
+            An integer, representing the total number of rows added so far.
+        """
+        return self.m_totalRows
+
+    #UTILITY METHODS
+    def AddRow(self, a_row):
+        """Adds a single row to the table.
+
+        Any column missing from the row is filled with None. If the row contains a column that the builder has not
+        seen before, that column is added to the end of the table and filled with None for all the previous rows,
+        which matches how pandas handles concatenating a row with extra columns.
+
+        Args:
+            a_row (dict): A dictionary representing a row of the table, where each key is a column name.
+
+        Returns:
+            Nothing.
+        """
+        #Add any columns the builder does not know about yet.
+        for column in a_row:
+            if column not in self.m_columnData:
+                self.m_columns.append(column)
+                self.m_columnData[column] = [None] * self.m_totalRows
+
+        for column in self.m_columns:
+            self.m_columnData[column].append(a_row.get(column))
+
+        self.m_totalRows += 1
+
+    def Build(self):
+        """Creates a pandas DataFrame from all the rows that have been added.
+
+        Returns:
+            A pandas DataFrame containing every added row, with the columns in order and the provided column types
+            applied.
+        """
+        dataFrame = pd.DataFrame(self.m_columnData, columns=self.m_columns)
+
+        for column, columnType in self.m_columnTypes.items():
+            if column in dataFrame.columns:
+                dataFrame[column] = dataFrame[column].astype(columnType)
+
+        return dataFrame
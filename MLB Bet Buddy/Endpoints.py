@@ -6,6 +6,7 @@
 #********************************************************************************************************************************
 
 import requests
+import contextvars
 import time
 
 class Endpoints():
@@ -56,7 +57,15 @@ class Endpoints():
     WEATHER_URL = 'https://api.weatherapi.com/v1/forecast.json?key={API_key}&q={city}' 
     
     #Endpoint to get a list of all hitters in a specified season.
-    ALL_HITTERS_URL = 'https://statsapi.mlb.com/api/v1/stats?stats=season&group=hitting&season={season}&playerPool=QUALIFIED&offset={offset}'        
+    ALL_HITTERS_URL = 'https://statsapi.mlb.com/api/v1/stats?stats=season&group=hitting&season={season}&playerPool=QUALIFIED&offset={offset}'
+
+    #Endpoint to get a list of every player on an MLB roster in a specified season.
+    ALL_PLAYERS_URL = 'https://statsapi.mlb.com/api/v1/sports/1/players?season={season}'
+
+    #Read-through cache of endpoint responses (URL --> JSON data) shared by every Endpoints object used by the current
+    #call (such as a single bet prediction update). It is stored in a context variable rather than a plain class variable,
+    #so that two updates running at the same time in different threads each have their own cache. None disables caching.
+    SHARED_CACHE = contextvars.ContextVar('SharedCache', default=None)
 
     #CONSTRUCTOR
     def __init__(self):
@@ -69,30 +78,76 @@ class Endpoints():
         self.session = requests.Session()
     
     #UTILITY METHODS
-    def AccessEndpointData(self, a_URL):
+    def AccessEndpointData(self, a_URL, a_useCache = True):
         """Sends a get request to the provided endpoint URL and returns the JSON data in the response.
 
         This method is used throughout the entire project to retrieve data from both the MLB API and Weather API. All 
         data is returned in a JSON format. Before returning, this function makes sure that the data was successfully 
-        retrieved. If there are any errors, the function sleeps for 10 seconds and tries to access the API again.
+        retrieved. If there are any errors, the function sleeps for 10 seconds and tries to access the API again. If a
+        shared cache has been set (see SetSharedCache()), it is checked before the request is sent and filled with the
+        data afterwards.
 
         Args:
             a_URL (string): The URL to send a get request to.
+            a_useCache (bool): False to always send the request and never store the data in the shared cache. Used for
+                               large responses (such as game feeds) that should not be kept in memory.
 
         Returns:
             A dictionary representing the JSON data returned from accessing the provided endpoint URL.
         """    
+        #Use the shared cache's copy of the data if another request has already retrieved it.
+        sharedCache = Endpoints.GetSharedCache() if a_useCache else None
+        if sharedCache is not None:
+            cachedData = sharedCache.get(a_URL)
+            if cachedData is not None:
+                return cachedData
+
         #Attempt to make a request to the endpoint.
         try:
             response = self.session.get(a_URL)
             data = response.json()
+            if sharedCache is not None:
+                sharedCache[a_URL] = data
             return data
         #Occasionally the data may be missing or the API may not respond. It is fixed by simply waiting a short time, then trying again.
         except Exception as e:
             print(e, '\n\n', a_URL)
             time.sleep(10)
-            return self.AccessEndpointData(a_URL)
-            
+            return self.AccessEndpointData(a_URL, a_useCache)
+
+    @staticmethod
+    def GetSharedCache():
+        """Gets the read-through cache used by the current call.
+
+        Returns:
+            A dictionary mapping URLs to their JSON data, or None if no shared cache has been set.
+        """
+        return Endpoints.SHARED_CACHE.get()
+
+    @staticmethod
+    def SetSharedCache(a_cache):
+        """Sets the read-through cache used by every Endpoints object in the current call.
+
+        The cache only applies to the current thread (and to any code run with a copy of its context, such as
+        asyncio.to_thread()), so separate calls never read or overwrite each other's data.
+
+        Args:
+            a_cache (dict): A dictionary mapping URLs to their JSON data.
+
+        Returns:
+            Nothing.
+        """
+        Endpoints.SHARED_CACHE.set(a_cache)
+
+    @staticmethod
+    def ClearSharedCache():
+        """Stops the Endpoints objects in the current call from using a shared cache.
+
+        Returns:
+            Nothing.
+        """
+        Endpoints.SHARED_CACHE.set(None)
+
     def FormatDate(self, a_dateObj):
         """Converts a datetime object into the correct string format.
 
@@ -318,4 +373,15 @@ class Endpoints():
         Returns:
             A string representing the URL endpoint required to retrieve the qualified hitter list.
         """
-        return self.ALL_HITTERS_URL.format(season=a_season, offset=a_offset)
\ No newline at end of file
+        return self.ALL_HITTERS_URL.format(season=a_season, offset=a_offset)
+
+    def GetAllPlayersEndpoint(self, a_season):
+        """Gets the endpoint URL to get a full list of every player on an MLB roster for a specific season.
+
+        Args:
+            a_season (int): The season to get the list of players from.
+
+        Returns:
+            A string representing the URL endpoint required to retrieve the list of players.
+        """
+        return self.ALL_PLAYERS_URL.format(season=a_season)
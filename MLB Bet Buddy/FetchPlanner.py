@@ -0,0 +1,355 @@
+#********************************************************************************************************************************
+# Author: Ian Pluchino                                                                                                          *
+# Class: FetchPlanner class                                                                                                     *
+# Description: Plans every MLB API request needed for a day's bet predictions, removes duplicates, and prefetches them.         *
+# Date: 5/2/24                                                                                                                  *
+#********************************************************************************************************************************
+
+from Endpoints import Endpoints
+from Game import Game
+from Pitcher import Pitcher
+from Team import Team
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from requests.adapters import HTTPAdapter
+
+class FetchPlanner():
+    #CONSTANTS
+    #Maximum number of requests that are sent at the same time while prefetching.
+    MAXIMUM_FETCH_WORKERS = 16
+
+    #Request priorities. Lower priorities are fetched first. Pitcher data is needed by both the NRFI/YRFI and hitting
+    #predictions, so it is fetched before anything else.
+    PITCHER_PRIORITY = 0
+    TEAM_PRIORITY = 1
+    HITTER_PRIORITY = 2
+    GAME_FEED_PRIORITY = 3
+
+    #Number of last 10 games date ranges to prefetch for each hitter (see Last10Stats() in the Hitter class). Ranges start
+    #at 7 days and grow by a day at a time, and most hitters reach 10 games within the first few ranges.
+    LAST_10_RANGES_TO_PREFETCH = 5
+
+    #CONSTRUCTOR
+    def __init__(self):
+        """Constructor for the FetchPlanner class.
+
+        This constructor is used to create an empty FetchPlanner object. URLs are added to the plan with PlanSlate()
+        (or AddURL()), and are fetched into the shared Endpoints cache of the current call with Prefetch().
+
+        Returns:
+            Nothing.
+        """
+        #Endpoint object from the Endpoints class to handle MLB API access. The connection pool is enlarged so that every
+        #prefetching thread can keep its own connection open.
+        self.m_endpointObj = Endpoints()
+        self.m_endpointObj.session.mount('https://', HTTPAdapter(pool_connections=self.MAXIMUM_FETCH_WORKERS, pool_maxsize=self.MAXIMUM_FETCH_WORKERS))
+
+        #URL --> the lowest priority it was requested with. Dictionaries keep insertion order, which is used to break ties.
+        self.m_plannedURLs = {}
+
+        #Game log URLs whose game IDs are expanded into first inning summaries once they are fetched. URL --> team ID for
+        #team game logs, or None for pitcher game logs.
+        self.m_gameLogURLs = {}
+
+        #Hitter ID --> the URLs planned for that hitter. Used to give each worker process only its own hitters' data.
+        self.m_hitterURLs = {}
+
+        #Team ID --> list of (pitcher ID, game date) for each announced probable pitcher that team is facing. Filled by
+        #PlanSlate(), and used to plan the hitters once the pitchers have been fetched (see PlanHitters()).
+        self.m_opposingPitchers = {}
+
+        #The hitters, dates, season and minimum games started passed to PlanSlate(), used by PlanHitters().
+        self.m_hitters = []
+        self.m_openingDayDate = None
+        self.m_currentDate = None
+        self.m_season = None
+        self.m_minimumGamesStarted = 0
+
+        #Counters used to report how many requests were saved.
+        self.m_totalRequested = 0
+        self.m_totalFetched = 0
+
+    #GETTERS
+    def GetTotalRequested(self):
+        """Gets the total number of requests added to the plan, including duplicates.
+
+        Returns:
+            An integer, representing the total number of requests added to the plan.
+        """
+        return self.m_totalRequested
+
+    def GetTotalUnique(self):
+        """Gets the total number of unique requests in the plan.
+
+        Returns:
+            An integer, representing the total number of unique URLs in the plan.
+        """
+        return len(self.m_plannedURLs)
+
+    def GetFetchReport(self):
+        """Gets a summary of the planned and prefetched requests.
+
+        Returns:
+            A dictionary containing the total number of requested, unique, saved (duplicate) and actually fetched
+            requests.
+        """
+        return { 'requested': self.m_totalRequested,
+                 'unique': len(self.m_plannedURLs),
+                 'saved': self.m_totalRequested - len(self.m_plannedURLs),
+                 'fetched': self.m_totalFetched }
+
+    def GetHitterURLs(self, a_hitterID):
+        """Gets the URLs that were planned for a single hitter.
+
+        Args:
+            a_hitterID (int): The ID used by the MLB API to represent the hitter.
+
+        Returns:
+            A list of strings, representing the endpoint URLs planned for the hitter. The list is empty if the hitter
+            was not planned (for example, if they are not playing that day).
+        """
+        return self.m_hitterURLs.get(a_hitterID, [])
+
+    #UTILITY METHODS
+    def AddURL(self, a_URL, a_priority):
+        """Adds a URL to the plan.
+
+        If the URL has already been planned, it is not added a second time, but it keeps the lower of the two
+        priorities.
+
+        Args:
+            a_URL (string): The endpoint URL to fetch.
+            a_priority (int): The priority of the request. Lower priorities are fetched first.
+
+        Returns:
+            Nothing.
+        """
+        self.m_totalRequested += 1
+
+        if a_URL not in self.m_plannedURLs or a_priority < self.m_plannedURLs[a_URL]:
+            self.m_plannedURLs[a_URL] = a_priority
+
+    def PlanSlate(self, a_scheduleDataFrame, a_hitters, a_openingDayDate, a_currentDate, a_season, a_minimumGamesStarted = 0):
+        """Plans every request the NRFI/YRFI and hitting bet predictions will make for a schedule.
+
+        This method walks the schedule the same way CreateNRFIPredictions() in the BetPredictor class does, and adds
+        the URL of every request it will make to the plan. For each probable pitcher, their statistics, hand
+        information, lefty/righty splits and game log are planned. For each team, their offensive statistics and game
+        log are planned. The hitters are planned later, once the pitchers' data has been fetched (see PlanHitters()),
+        since the hitting predictions skip pitchers that are not eligible and those pitchers can only be checked
+        with their statistics. The same URL is often needed many times (a pitcher is faced by roughly nine hitters,
+        and both teams in a game share the same game feeds), so duplicates are only kept once. The games themselves
+        can only be planned once the game logs have been fetched (see Prefetch()).
+
+        Args:
+            a_scheduleDataFrame (pandas.DataFrame): A pandas DataFrame containing the schedule information.
+            a_hitters (list): A list of dictionaries, each representing a qualified hitter (see Hitter.GetAllHitters()).
+            a_openingDayDate (datetime): The date of opening day of the season the schedule was generated for.
+            a_currentDate (datetime): The date the predictions are being generated for.
+            a_season (int): The season the schedule was generated for.
+            a_minimumGamesStarted (int): The minimum number of games a pitcher must have started for hitters to be
+                                         predicted against them (see CreatePitcherPlan() in the BetPredictor class).
+
+        Returns:
+            Nothing.
+        """
+        for gameInformation in a_scheduleDataFrame.to_dict('records'):
+            gameDatetimeObj = datetime.strptime(gameInformation['Date'], '%m/%d/%Y')
+
+            for homeOrAway, opponentSide in [('Home', 'Away'), ('Away', 'Home')]:
+                teamID = gameInformation[homeOrAway + ' Team ID']
+                pitcherID = gameInformation[homeOrAway + ' Team Probable Pitcher ID']
+
+                #Team offense and team YRFI percentage.
+                self.AddURL(self.m_endpointObj.GetTeamOffensiveEndpoint(teamID, a_season, a_openingDayDate, gameDatetimeObj), self.TEAM_PRIORITY)
+                teamGameLogURL = self.m_endpointObj.GetTeamGameLogEndpoint(teamID, a_season, a_openingDayDate, gameDatetimeObj)
+                self.AddURL(teamGameLogURL, self.TEAM_PRIORITY)
+                self.m_gameLogURLs[teamGameLogURL] = teamID
+
+                #Pitchers that have not been announced yet are skipped by the predictions, so nothing is planned for them.
+                if gameInformation[homeOrAway + ' Team Probable Pitcher Name'] == 'T.B.D.' or pitcherID == 0:
+                    continue
+
+                #Pitcher statistics, hand information, splits and pitcher YRFI percentage.
+                self.AddURL(self.m_endpointObj.GetIndividualPitchingEndpoint(pitcherID, a_season, a_openingDayDate, gameDatetimeObj), self.PITCHER_PRIORITY)
+                self.AddURL(self.m_endpointObj.GetGeneralPlayerInfoEndpoint(pitcherID), self.PITCHER_PRIORITY)
+                self.AddURL(self.m_endpointObj.GetLRPitcherSplitsEndpoint(pitcherID, a_season), self.PITCHER_PRIORITY)
+                pitchingGameLogURL = self.m_endpointObj.GetPitchingGameLogEndpoint(pitcherID, a_season, a_openingDayDate, gameDatetimeObj)
+                self.AddURL(pitchingGameLogURL, self.PITCHER_PRIORITY)
+                self.m_gameLogURLs[pitchingGameLogURL] = None
+
+                #The hitters on the other team face this pitcher.
+                self.m_opposingPitchers.setdefault(gameInformation[opponentSide + ' Team ID'], []).append((pitcherID, gameDatetimeObj))
+
+        self.m_hitters = a_hitters
+        self.m_openingDayDate = a_openingDayDate
+        self.m_currentDate = a_currentDate
+        self.m_season = a_season
+        self.m_minimumGamesStarted = a_minimumGamesStarted
+
+    def PlanHitters(self):
+        """Plans every request the hitting bet predictions will make for the hitters passed to PlanSlate().
+
+        This method walks the hitters the same way CreateHittingPredictions() in the BetPredictor class does, and must
+        be called once the pitchers planned by PlanSlate() have been fetched. Each opposing pitcher is checked the same
+        way CreatePitcherPlan() in the BetPredictor class checks them (see IsPitcherEligible()), using the fetched
+        data. For each qualified hitter facing at least one eligible pitcher, their statistics, hand information,
+        lefty/righty splits, recent date ranges and career numbers off each eligible opposing pitcher are planned.
+        Hitters that are not playing that day or only face pitchers that are not eligible are skipped by the
+        predictions, so nothing is planned for them. The URLs planned for each hitter are also recorded separately
+        (see GetHitterURLs()).
+
+        Returns:
+            Nothing.
+        """
+        #Team ID --> list of the eligible opposing pitcher IDs that team is facing. Each pitcher is only checked once.
+        eligiblePitchers = {}
+        pitcherEligibility = {}
+        for teamID, opposingPitchers in self.m_opposingPitchers.items():
+            for pitcherID, gameDatetimeObj in opposingPitchers:
+                if (pitcherID, gameDatetimeObj) not in pitcherEligibility:
+                    pitcherEligibility[(pitcherID, gameDatetimeObj)] = self.IsPitcherEligible(pitcherID, gameDatetimeObj)
+
+                if pitcherEligibility[(pitcherID, gameDatetimeObj)]:
+                    eligiblePitchers.setdefault(teamID, []).append(pitcherID)
+
+        for hitter in self.m_hitters:
+            hitterID = hitter['playerID']
+            hitterTeamID = hitter['teamID']
+
+            if hitterTeamID not in eligiblePitchers:
+                continue
+
+            hitterURLs = [self.m_endpointObj.GetIndividualHittingEndpoint(hitterID, self.m_season, self.m_openingDayDate, self.m_currentDate),
+                          self.m_endpointObj.GetGeneralPlayerInfoEndpoint(hitterID),
+                          self.m_endpointObj.GetLRHitterSplitsEndpoint(hitterID, self.m_season)]
+
+            #The first few date ranges checked when finding the hitter's last 10 games.
+            for extraDays in range(self.LAST_10_RANGES_TO_PREFETCH):
+                startDate = self.m_currentDate - timedelta(days=7 + extraDays)
+                hitterURLs.append(self.m_endpointObj.GetIndividualHittingEndpoint(hitterID, self.m_season, startDate, self.m_currentDate))
+
+            for pitcherID in eligiblePitchers[hitterTeamID]:
+                hitterURLs.append(self.m_endpointObj.GetCareerHittingNumbersEndpoint(hitterID, pitcherID))
+
+            for URL in hitterURLs:
+                self.AddURL(URL, self.HITTER_PRIORITY)
+            self.m_hitterURLs[hitterID] = hitterURLs
+
+    def IsPitcherEligible(self, a_pitcherID, a_gameDate):
+        """Determines if the hitting bet predictions will be created against a probable pitcher.
+
+        The pitcher is checked the same way CreatePitcherPlan() in the BetPredictor class checks them: their statistics
+        must be found, they must have started at least the minimum number of games, and their hand information must be
+        found. The data is read from the shared Endpoints cache, so the pitcher must already have been fetched.
+
+        Args:
+            a_pitcherID (int): The ID used by the MLB API to represent the pitcher.
+            a_gameDate (datetime): The date of the game the pitcher is starting.
+
+        Returns:
+            A boolean, true if the hitting bet predictions will be created against the pitcher, false otherwise.
+        """
+        pitcherObj = Pitcher(a_pitcherID)
+        pitcherStats = pitcherObj.GetPitchingStatistics(self.m_season, self.m_openingDayDate, a_gameDate)
+        if not pitcherStats or pitcherStats['gamesStarted'] < self.m_minimumGamesStarted:
+            return False
+
+        return bool(pitcherObj.GetHandInformation())
+
+    def Prefetch(self, a_cache = None):
+        """Fetches every planned URL concurrently, in priority order, into the shared Endpoints cache.
+
+        The planned URLs are fetched in three stages. First, every URL planned with PlanSlate() is fetched, with the
+        lowest priorities submitted first. Next, the hitters facing eligible pitchers are planned (see PlanHitters())
+        and fetched. Then, the game IDs found in the fetched pitcher and team game logs are deduplicated, and the first
+        inning summary of each game is fetched (see GetFirstInningSummary() in the Game class). Only the small summaries are kept in the cache, since the full game feeds are large and there are
+        thousands of them by the middle of the season. Data already in the cache is not fetched again. Once this
+        method returns, the bet prediction methods read their data from the cache instead of the MLB API.
+
+        Args:
+            a_cache (dict): The cache to fill. If it is not provided, the shared cache of the current call is used, and
+                            a new one is created (see Endpoints.SetSharedCache()) if there isn't one.
+
+        Returns:
+            A dictionary, representing the fetch report (see GetFetchReport()).
+
+        Assistance Received:
+            - https://docs.python.org/3/library/concurrent.futures.html#threadpoolexecutor
+        """
+        if a_cache is not None:
+            Endpoints.SetSharedCache(a_cache)
+        elif Endpoints.GetSharedCache() is None:
+            Endpoints.SetSharedCache({})
+
+        sharedCache = Endpoints.GetSharedCache()
+
+        #Stage one: everything planned from the schedule. AccessEndpointData() stores each response in the shared cache.
+        plannedURLs = sorted(self.m_plannedURLs, key=self.m_plannedURLs.get)
+        self.FetchConcurrently(self.m_endpointObj.AccessEndpointData, [URL for URL in plannedURLs if sharedCache.get(URL) is None])
+
+        #Stage two: the hitters facing pitchers that are eligible, now that the pitchers' statistics are in the cache.
+        fetchedURLs = set(plannedURLs)
+        self.PlanHitters()
+        hitterURLs = [URL for URL in self.m_plannedURLs if URL not in fetchedURLs]
+        self.FetchConcurrently(self.m_endpointObj.AccessEndpointData, [URL for URL in hitterURLs if sharedCache.get(URL) is None])
+
+        #Stage three: the first inning summaries needed for every YRFI percentage. Each game feed is only counted once.
+        gameIDs = []
+        for gameLogURL, teamID in self.m_gameLogURLs.items():
+            for gameID in self.ExtractGameLogIDs(sharedCache.get(gameLogURL, {}), teamID):
+                gameFeedURL = self.m_endpointObj.GetGameAnalysisEndpoint(gameID)
+                if gameFeedURL not in self.m_plannedURLs:
+                    gameIDs.append(gameID)
+                self.AddURL(gameFeedURL, self.GAME_FEED_PRIORITY)
+
+        #GetFirstInningSummary() stores each summary in the shared cache.
+        self.FetchConcurrently(Game.GetFirstInningSummary,
+                               [gameID for gameID in gameIDs if sharedCache.get((Game.FIRST_INNING_SUMMARY_KEY, gameID)) is None])
+
+        return self.GetFetchReport()
+
+    def FetchConcurrently(self, a_fetchFunction, a_arguments):
+        """Calls a fetching function concurrently for each provided argument.
+
+        Each call is run with a copy of the current context, so that the worker threads read and fill the same shared
+        Endpoints cache as the call that is prefetching (see Endpoints.SetSharedCache()).
+
+        Args:
+            a_fetchFunction (function): The function that fetches a single item and stores it in the shared cache.
+            a_arguments (list): The arguments to call the function with, in the order they should be submitted.
+
+        Returns:
+            Nothing.
+        """
+        with ThreadPoolExecutor(max_workers=self.MAXIMUM_FETCH_WORKERS) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, a_fetchFunction, argument) for argument in a_arguments]
+
+            for future in futures:
+                future.result()
+
+        self.m_totalFetched += len(a_arguments)
+
+    def ExtractGameLogIDs(self, a_gameLogData, a_teamID):
+        """Extracts the IDs of the games whose feeds will be needed from a fetched game log.
+
+        Args:
+            a_gameLogData (dict): The JSON data of a pitcher or team game log.
+            a_teamID (int): The ID of the team for team game logs, or None for pitcher game logs.
+
+        Returns:
+            A list of integers, representing the game IDs found in the game log.
+        """
+        #Team game logs are filtered the same way the Team class filters them (see ExtractGameIDs() in the Team class).
+        if a_teamID is not None:
+            if 'dates' not in a_gameLogData or int(a_gameLogData.get('totalGames', 0)) == 0:
+                return []
+
+            return [game['gameID'] for game in Team(a_teamID).ExtractGameIDs(a_gameLogData['dates'])]
+
+        #Pitcher game logs only need the games the pitcher started.
+        if 'stats' not in a_gameLogData or not a_gameLogData['stats']:
+            return []
+
+        return [game['game']['gamePk'] for game in a_gameLogData['stats'][0]['splits'] if int(game['stat']['gamesStarted']) > 0]
@@ -7,6 +7,10 @@
 from Endpoints import Endpoints
 
 class Game():
+    #CONSTANTS
+    #Name used in the shared Endpoints cache keys of first inning summaries (see GetFirstInningSummary()).
+    FIRST_INNING_SUMMARY_KEY = 'First Inning Summary'
+
     #CONSTRUCTOR
     def __init__(self, a_gameID = 746418):
         """Constructor for the Game class.
@@ -52,8 +56,9 @@ class Game():
         #Create the individual game analysis endpoint.
         gameEndpoint = self.m_endpointObj.GetGameAnalysisEndpoint(self.m_gameID)
         
-        #Access the created endpoint and store the data.
-        gameData = self.m_endpointObj.AccessEndpointData(gameEndpoint)
+        #Access the created endpoint and store the data. Game feeds are large, so they are never kept in the shared cache
+        #(see GetFirstInningSummary() for the data that is cached instead).
+        gameData = self.m_endpointObj.AccessEndpointData(gameEndpoint, False)
         
         #It needs to be made sure that the actual game entered as the game id exists and can be scanned before other information can be gathered.
         if 'gamePk' in gameData:
@@ -90,6 +95,7 @@ class Game():
         #Setting the state of the game - whether the game is final or not (sometimes games can be postponed or cancelled due to 
         #rain - this is important for game tracking).
         gameState = gameInformation['status']['detailedState']
+        self.m_gameState = gameState
         if gameState != 'Final' and 'Completed Early' not in gameState:
             self.m_isFinal = False
         else:
@@ -175,6 +181,14 @@ class Game():
         """
         return self.m_isFinal
 
+    def GetGameState(self):
+        """Gets the detailed state of the game.
+
+        Returns:
+            A string, representing the state of the game as reported by the MLB API (example: Final, Postponed).
+        """
+        return self.m_gameState
+
     def GetHomeTeamName(self):
         """Gets the name of the home team of the game.
 
@@ -421,4 +435,57 @@ class Game():
             if pitcherID == a_pitcherID:
                 return True
             
-        return False
\ No newline at end of file
+        return False
+
+    def CreateFirstInningSummary(self):
+        """Creates a small summary of the first inning of the game.
+
+        The summary holds everything the YRFI percentages of pitchers and teams need from a game (see
+        CalculateYRFIPercentage() in the Pitcher and Team classes), so that the full game feed does not need to be kept.
+        Each first inning scoring play is recorded with the team that scored (see DidTeamScoreFirstInning()) and the
+        pitcher who let up the run (see DidPitcherLetUpRunFirstInning()).
+
+        Returns:
+            A dictionary containing whether the game is final, and the lists of the team IDs and pitcher IDs of each
+            first inning scoring play.
+        """
+        firstInningScoringPlays = self.ExtractFirstInningScoringPlays()
+
+        scoringTeamIDs = []
+        scoringPitcherIDs = []
+        for scoringPlay in firstInningScoringPlays:
+            #Runs in the top of the first inning are scored by the away team, and in the bottom by the home team.
+            if scoringPlay['about']['halfInning'] == 'top':
+                scoringTeamIDs.append(self.GetAwayTeamID())
+            else:
+                scoringTeamIDs.append(self.GetHomeTeamID())
+
+            scoringPitcherIDs.append(scoringPlay['matchup']['pitcher']['id'])
+
+        return { 'isFinal': self.IsGameFinal(), 'scoringTeamIDs': scoringTeamIDs, 'scoringPitcherIDs': scoringPitcherIDs }
+
+    @staticmethod
+    def GetFirstInningSummary(a_gameID):
+        """Gets the first inning summary of a game, using the shared Endpoints cache if one has been set.
+
+        The summary is stored in the shared cache (see Endpoints.SetSharedCache()) under the game ID, so a game that
+        appears in many pitcher and team game logs is only requested once per bet prediction update.
+
+        Args:
+            a_gameID (int): The ID used by the MLB API to represent the game.
+
+        Returns:
+            A dictionary, representing the first inning summary of the game (see CreateFirstInningSummary()).
+        """
+        sharedCache = Endpoints.GetSharedCache()
+        summaryKey = (Game.FIRST_INNING_SUMMARY_KEY, a_gameID)
+        if sharedCache is not None:
+            cachedSummary = sharedCache.get(summaryKey)
+            if cachedSummary is not None:
+                return cachedSummary
+
+        firstInningSummary = Game(a_gameID).CreateFirstInningSummary()
+        if sharedCache is not None:
+            sharedCache[summaryKey] = firstInningSummary
+
+        return firstInningSummary
@@ -0,0 +1,301 @@
+#********************************************************************************************************************************
+# Author: Ian Pluchino                                                                                                          *
+# Class: NRFITestingData class                                                                                                  *
+# Description: Holds the NRFI testing data in memory as NumPy arrays so bet prediction weights can be evaluated very quickly.   *
+# Date: 5/2/24                                                                                                                  *
+#********************************************************************************************************************************
+
+from Game import Game
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+class NRFITestingData():
+    #CONSTANTS
+    #Maximum number of games whose first inning results are looked up at the same time.
+    MAXIMUM_OUTCOME_WORKERS = 8
+
+    #Fractions of the testing days a candidate has been scored on at each early stopping checkpoint (see
+    #EvaluateWeightMatrixWithEarlyStopping()). The last checkpoint must be the full set of days.
+    EARLY_STOPPING_RUNGS = [0.125, 0.25, 0.5, 1.0]
+
+    #Largest chance that early stopping drops a candidate whose accuracy over every day would have reached the incumbent.
+    #It is split evenly across the checkpoints before the last one.
+    EARLY_STOPPING_FAILURE_PROBABILITY = 0.05
+
+    #CONSTRUCTOR
+    def __init__(self, a_dayFeatures, a_dayGameIDs, a_fileNames = None):
+        """Constructor for the NRFITestingData class.
+
+        This constructor is used to stack the testing data of every day into a single days x games x statistics
+        feature tensor. Days have different numbers of games, so every day is padded to the largest day, and a mask
+        keeps track of which entries are real games. The first inning result of every game is looked up once (see
+        LoadOutcomes()) and kept as an array alongside the features.
+
+        Args:
+            a_dayFeatures (list): A list of 2D NumPy arrays, one per day, each of shape games x statistics. The overall
+                                  NRFI score of a game must be the product of its row and the weight vector.
+            a_dayGameIDs (list): A list of lists of game IDs, one per day, in the same order as the feature rows.
+            a_fileNames (list): The names of the testing data files each day came from.
+
+        Returns:
+            Nothing.
+        """
+        totalDays = len(a_dayFeatures)
+        maximumGames = max((len(gameIDs) for gameIDs in a_dayGameIDs), default=0)
+        totalStats = a_dayFeatures[0].shape[1] if totalDays else 0
+
+        #Days x games x statistics, with padded entries left as 0.
+        self.m_features = np.zeros((totalDays, maximumGames, totalStats))
+
+        #Days x games, true where the entry is a real game.
+        self.m_mask = np.zeros((totalDays, maximumGames), dtype=bool)
+
+        #Days x games, with padded entries left as 0.
+        self.m_gameIDs = np.zeros((totalDays, maximumGames), dtype=np.int64)
+
+        for day, (features, gameIDs) in enumerate(zip(a_dayFeatures, a_dayGameIDs)):
+            totalGames = len(gameIDs)
+            self.m_features[day, :totalGames] = features
+            self.m_mask[day, :totalGames] = True
+            self.m_gameIDs[day, :totalGames] = gameIDs
+
+        #The number of games on each day.
+        self.m_gamesPerDay = self.m_mask.sum(axis=1)
+
+        #Days x games, true where a run was scored in the first inning. Filled by LoadOutcomes().
+        self.m_yrfiOutcomes = np.zeros((totalDays, maximumGames), dtype=bool)
+
+        self.m_fileNames = list(a_fileNames) if a_fileNames else []
+
+    #GETTERS
+    def GetTotalDays(self):
+        """Gets the total number of days of testing data.
+
+        Returns:
+            An integer, representing the total number of days.
+        """
+        return self.m_features.shape[0]
+
+    def GetTotalStats(self):
+        """Gets the total number of statistics (weights) each game has.
+
+        Returns:
+            An integer, representing the size of the last dimension of the feature tensor.
+        """
+        return self.m_features.shape[2]
+
+    def GetFileNames(self):
+        """Gets the names of the testing data files each day came from.
+
+        Returns:
+            A list of strings, in the same order as the days of the feature tensor.
+        """
+        return self.m_fileNames
+
+    #UTILITY METHODS
+    def LoadOutcomes(self, a_outcomeFunction = None):
+        """Looks up whether a run was scored in the first inning of every game in the testing data.
+
+        Each game is only looked up once, no matter how many weight vectors are evaluated afterwards.
+
+        Args:
+            a_outcomeFunction (function): A function taking a game ID and returning true if a YRFI occurred. By default,
+                                          a Game object is created for the game (see DidYRFIOccur() in the Game class).
+
+        Returns:
+            Nothing.
+        """
+        outcomeFunction = a_outcomeFunction if a_outcomeFunction else self.DidYRFIOccur
+
+        uniqueGameIDs = [int(gameID) for gameID in np.unique(self.m_gameIDs[self.m_mask])]
+        with ThreadPoolExecutor(max_workers=self.MAXIMUM_OUTCOME_WORKERS) as executor:
+            outcomes = dict(zip(uniqueGameIDs, executor.map(outcomeFunction, uniqueGameIDs)))
+
+        for day, game in zip(*np.nonzero(self.m_mask)):
+            self.m_yrfiOutcomes[day, game] = outcomes[int(self.m_gameIDs[day, game])]
+
+    def EvaluateWeights(self, a_weights, a_topX = 1, a_minimumPredictions = 0):
+        """Calculates the NRFI and YRFI accuracy of a weight vector over every day of testing data.
+
+        This method produces the same results as AccuracyTestNRFIYRFI() in the BetPredictor class, without reading
+        any files or accessing the MLB API. It is the single weight vector version of EvaluateWeightMatrix().
+
+        Args:
+            a_weights (numpy.ndarray): The weight vector, with one weight per statistic.
+            a_topX (int): The number of top bets for each day to consider.
+            a_minimumPredictions (int): The minimum number of games a day must have to be considered.
+
+        Returns:
+            A dictionary, containing both the NRFI and YRFI success rates, as well as the total games analyzed and the
+            total NRFI and YRFI successes.
+        """
+        accuracies = self.EvaluateWeightMatrix(np.asarray(a_weights, dtype=float)[np.newaxis, :], a_topX, a_minimumPredictions)
+        if isinstance(accuracies, str):
+            return accuracies
+
+        return { 'NRFI Success Rate': float(accuracies['NRFI Success Rate'][0]),
+                 'YRFI Success Rate': float(accuracies['YRFI Success Rate'][0]),
+                 'Total Games': accuracies['Total Games'],
+                 'Total NRFI': int(accuracies['Total NRFI'][0]),
+                 'Total YRFI': int(accuracies['Total YRFI'][0]) }
+
+    def EvaluateWeightMatrix(self, a_weightMatrix, a_topX = 1, a_minimumPredictions = 0):
+        """Calculates the NRFI and YRFI accuracy of many weight vectors at once over every day of testing data.
+
+        Every candidate is scored on every valid day (see CountSuccesses()). Days without enough games are skipped.
+
+        Args:
+            a_weightMatrix (numpy.ndarray): A 2D array of shape candidates x statistics, with one weight vector per row.
+            a_topX (int): The number of top bets for each day to consider.
+            a_minimumPredictions (int): The minimum number of games a day must have to be considered.
+
+        Returns:
+            A dictionary, containing the NRFI and YRFI success rates and the total NRFI and YRFI successes as NumPy
+            arrays with one entry per weight vector, as well as the total games analyzed (the same for every weight
+            vector).
+        """
+        validDays = self.GetValidDays(a_topX, a_minimumPredictions)
+        totalGames = len(validDays) * a_topX
+        if totalGames == 0:
+            return 'No games found in test data!'
+
+        totalNRFI, totalYRFI = self.CountSuccesses(a_weightMatrix, validDays, a_topX)
+
+        return { 'NRFI Success Rate': totalNRFI / totalGames,
+                 'YRFI Success Rate': totalYRFI / totalGames,
+                 'Total Games': totalGames,
+                 'Total NRFI': totalNRFI,
+                 'Total YRFI': totalYRFI }
+
+    def EvaluateWeightMatrixWithEarlyStopping(self, a_weightMatrix, a_incumbentAccuracy, a_topX = 1, a_minimumPredictions = 0, a_seed = 0):
+        """Calculates the NRFI accuracy of many weight vectors, stopping early on vectors that cannot beat the incumbent.
+
+        This method is the multi-fidelity version of EvaluateWeightMatrix(). The valid days are shuffled once, and
+        every candidate is first scored on a small fraction of them (see EARLY_STOPPING_RUNGS). After each checkpoint,
+        an upper confidence bound on the NRFI accuracy a candidate would finish with is calculated from the days scored
+        so far. Since the scored days are a random sample of the valid days taken without replacement, the
+        Hoeffding-Serfling inequality bounds how far the accuracy over every day can be above the accuracy over the
+        sample. Candidates whose upper bound is below the incumbent accuracy (the best accuracy found so far) are
+        dropped, and only the rest are promoted to the next, larger fraction of days. A candidate that would have
+        reached the incumbent is dropped with a probability of at most EARLY_STOPPING_FAILURE_PROBABILITY.
+
+        Args:
+            a_weightMatrix (numpy.ndarray): A 2D array of shape candidates x statistics, with one weight vector per row.
+            a_incumbentAccuracy (float): The best NRFI accuracy found so far. No candidate is dropped if it is None.
+            a_topX (int): The number of top bets for each day to consider.
+            a_minimumPredictions (int): The minimum number of games a day must have to be considered.
+            a_seed (int): The seed used to shuffle the days. The same seed always scores the days in the same order.
+
+        Returns:
+            A dictionary, containing the NRFI success rates, the total NRFI successes, whether each candidate was
+            stopped early, and the number of days each candidate was scored on as NumPy arrays with one entry per
+            weight vector, as well as the total games analyzed. The success rate of a candidate that was stopped early
+            is NaN, since it was not scored on every day.
+
+        Assistance Received:
+            - https://arxiv.org/abs/1309.4029
+        """
+        validDays = self.GetValidDays(a_topX, a_minimumPredictions)
+        totalDays = len(validDays)
+        totalGames = totalDays * a_topX
+        if totalGames == 0:
+            return 'No games found in test data!'
+
+        weightMatrix = np.array(a_weightMatrix, dtype=float, ndmin=2)
+        dayOrder = np.random.RandomState(a_seed).permutation(validDays)
+
+        totalNRFI = np.zeros(len(weightMatrix), dtype=np.int64)
+        daysEvaluated = np.zeros(len(weightMatrix), dtype=np.int64)
+        promoted = np.ones(len(weightMatrix), dtype=bool)
+
+        #The chance of wrongly dropping a candidate is split across every checkpoint that can drop one.
+        totalCheckpoints = max(len(self.EARLY_STOPPING_RUNGS) - 1, 1)
+        confidenceTerm = np.log(totalCheckpoints / self.EARLY_STOPPING_FAILURE_PROBABILITY)
+
+        startDay = 0
+        for fraction in self.EARLY_STOPPING_RUNGS:
+            endDay = max(int(np.ceil(fraction * totalDays)), startDay)
+            candidates = np.nonzero(promoted)[0]
+            if endDay == startDay or len(candidates) == 0:
+                continue
+
+            #Only the candidates that are still promoted are scored on the next group of days.
+            NRFISuccesses, _ = self.CountSuccesses(weightMatrix[candidates], dayOrder[startDay:endDay], a_topX)
+            totalNRFI[candidates] += NRFISuccesses
+            daysEvaluated[candidates] = endDay
+
+            #Drop the candidates whose upper confidence bound is below the incumbent. There is nothing left to bound
+            #once every day has been scored.
+            if a_incumbentAccuracy is not None and endDay < totalDays:
+                sampleAccuracy = totalNRFI[candidates] / (endDay * a_topX)
+                boundWidth = np.sqrt(confidenceTerm * (1 - (endDay - 1) / totalDays) / (2 * endDay))
+                promoted[candidates] = sampleAccuracy + boundWidth >= a_incumbentAccuracy
+
+            startDay = endDay
+
+        stoppedEarly = daysEvaluated < totalDays
+
+        return { 'NRFI Success Rate': np.where(stoppedEarly, np.nan, totalNRFI / totalGames),
+                 'Total Games': totalGames,
+                 'Total NRFI': totalNRFI,
+                 'Stopped Early': stoppedEarly,
+                 'Days Evaluated': daysEvaluated }
+
+    def GetValidDays(self, a_topX, a_minimumPredictions):
+        """Gets the days that have enough games to be used in accuracy testing.
+
+        Args:
+            a_topX (int): The number of top bets for each day to consider.
+            a_minimumPredictions (int): The minimum number of games a day must have to be considered.
+
+        Returns:
+            A NumPy array of integers, representing the indices of the valid days.
+        """
+        return np.nonzero((self.m_gamesPerDay >= a_topX * 2) & (self.m_gamesPerDay >= a_minimumPredictions))[0]
+
+    def CountSuccesses(self, a_weightMatrix, a_days, a_topX):
+        """Counts the successful NRFI and YRFI picks of many weight vectors over a set of days.
+
+        The overall NRFI score of every game under every weight vector is one matrix product of the feature tensor
+        with the weight matrix. On each day, the games are sorted by score, the first a_topX games are taken as the
+        NRFI picks and the last a_topX games as the YRFI picks, and their results are gathered from the outcome array.
+        The games are ordered exactly like the sorted DataFrame in AccuracyTestNRFIYRFI() in the BetPredictor class:
+        the sort is stable, so tied scores keep their original order, and games with a missing (NaN) score are placed
+        after every other game, making them YRFI picks.
+
+        Args:
+            a_weightMatrix (numpy.ndarray): A 2D array of shape candidates x statistics, with one weight vector per row.
+            a_days (numpy.ndarray): The indices of the days to score.
+            a_topX (int): The number of top bets for each day to consider.
+
+        Returns:
+            A tuple, containing a NumPy array of the total NRFI successes and a NumPy array of the total YRFI successes,
+            with one entry per weight vector.
+        """
+        #Candidates x days x games. Padded entries are set to NaN, and since they come after every real game on their day,
+        #the stable sort places them after the real games with a NaN score.
+        scores = np.moveaxis(self.m_features[a_days] @ np.asarray(a_weightMatrix, dtype=float).T, 2, 0)
+        sortedGames = np.argsort(np.where(self.m_mask[a_days], scores, np.nan), axis=2, kind='stable')
+
+        #The NRFI picks are the first games in the order, and the YRFI picks are the last real games in the order.
+        YRFIPositions = self.m_gamesPerDay[a_days][:, np.newaxis] - a_topX + np.arange(a_topX)
+        NRFIPicks = sortedGames[:, :, :a_topX]
+        YRFIPicks = np.take_along_axis(sortedGames, np.broadcast_to(YRFIPositions, sortedGames.shape[:2] + (a_topX,)), axis=2)
+
+        outcomes = np.broadcast_to(self.m_yrfiOutcomes[a_days], scores.shape)
+        totalNRFI = (~np.take_along_axis(outcomes, NRFIPicks, axis=2)).sum(axis=(1, 2))
+        totalYRFI = np.take_along_axis(outcomes, YRFIPicks, axis=2).sum(axis=(1, 2))
+
+        return totalNRFI, totalYRFI
+
+    @staticmethod
+    def DidYRFIOccur(a_gameID):
+        """Determines if a run was scored in the first inning of a game using the MLB API.
+
+        Args:
+            a_gameID (int): The ID used by the MLB API to represent the game.
+
+        Returns:
+            A boolean, true if a run was scored in the first inning, false otherwise.
+        """
+        return Game(a_gameID).DidYRFIOccur()
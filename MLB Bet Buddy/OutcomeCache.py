@@ -0,0 +1,145 @@
+#********************************************************************************************************************************
+# Author: Ian Pluchino                                                                                                          *
+# Class: OutcomeCache class                                                                                                     *
+# Description: Stores the results of finished games and hitter bet reviews on disk so they never need to be fetched again.      *
+# Date: 5/2/24                                                                                                                  *
+#********************************************************************************************************************************
+
+from Game import Game
+from Hitter import Hitter
+from datetime import datetime
+import sqlite3
+import json
+
+class OutcomeCache():
+    #CONSTANTS
+    #Default location of the outcome database, next to the server's database.
+    DEFAULT_DATABASE_PATH = 'outcomes.db'
+
+    #States of games that were never played and never will be, once their date has passed.
+    UNPLAYED_GAME_STATES = ['Postponed', 'Cancelled']
+
+    #CONSTRUCTOR
+    def __init__(self, a_databasePath = DEFAULT_DATABASE_PATH):
+        """Constructor for the OutcomeCache class.
+
+        This constructor is used to open (and create, if necessary) the outcome database. Game results are stored by
+        game ID, and hitter bet reviews are stored by hitter ID and date. Only results that can no longer change are
+        stored: games that are final, games that were postponed or cancelled on a date that has already passed, and
+        hitter bet reviews for final games on dates that have already passed. Outcome databases created before game
+        states were stored have the state column added, and every game already in them is final.
+
+        Args:
+            a_databasePath (string): The path of the SQLite database file to store the outcomes in.
+
+        Returns:
+            Nothing.
+        """
+        self.m_databasePath = a_databasePath
+
+        with self.Connect() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS GameOutcomes (Game_ID INTEGER PRIMARY KEY, YRFI INTEGER NOT NULL, '
+                               'Status TEXT NOT NULL DEFAULT \'Final\')')
+
+            #Older outcome databases only stored final games, without their state.
+            gameColumns = [column[1] for column in connection.execute('PRAGMA table_info(GameOutcomes)')]
+            if 'Status' not in gameColumns:
+                connection.execute('ALTER TABLE GameOutcomes ADD COLUMN Status TEXT NOT NULL DEFAULT \'Final\'')
+
+            connection.execute('CREATE TABLE IF NOT EXISTS HittingOutcomes (Hitter_ID INTEGER NOT NULL, Date TEXT NOT NULL, '
+                               'Bet_Review TEXT NOT NULL, PRIMARY KEY (Hitter_ID, Date))')
+
+    #UTILITY METHODS
+    def GetGameOutcome(self, a_gameID):
+        """Gets whether a game is final and whether a run was scored in its first inning.
+
+        The outcome database is checked first. If the game is not stored, a Game object is created for it (see
+        IsGameFinal() and DidYRFIOccur() in the Game class). The result is stored if the game is final, or if it was
+        postponed or cancelled and its date has passed, so games that were never played are not fetched again either.
+
+        Args:
+            a_gameID (int): The ID used by the MLB API to represent the game.
+
+        Returns:
+            A dictionary containing whether the game is final, and whether a YRFI occurred (always false for games
+            that are not final).
+        """
+        gameID = int(a_gameID)
+
+        with self.Connect() as connection:
+            storedOutcome = connection.execute('SELECT YRFI, Status FROM GameOutcomes WHERE Game_ID = ?', (gameID,)).fetchone()
+
+        if storedOutcome is not None:
+            return { 'isFinal': storedOutcome[1] == 'Final', 'yrfi': bool(storedOutcome[0]) }
+
+        gameObj = Game(gameID)
+        if not gameObj.IsGameFinal():
+            #Games that were never played will not change once their date has passed.
+            gameDate = datetime.strptime(gameObj.GetGameDate(), '%Y-%m-%d').date()
+            if gameObj.GetGameState() in self.UNPLAYED_GAME_STATES and gameDate < datetime.today().date():
+                with self.Connect() as connection:
+                    connection.execute('INSERT OR REPLACE INTO GameOutcomes (Game_ID, YRFI, Status) VALUES (?, ?, ?)',
+                                       (gameID, 0, gameObj.GetGameState()))
+
+            return { 'isFinal': False, 'yrfi': False }
+
+        yrfi = gameObj.DidYRFIOccur()
+        with self.Connect() as connection:
+            connection.execute('INSERT OR REPLACE INTO GameOutcomes (Game_ID, YRFI, Status) VALUES (?, ?, ?)', (gameID, int(yrfi), 'Final'))
+
+        return { 'isFinal': True, 'yrfi': yrfi }
+
+    def DidYRFIOccur(self, a_gameID):
+        """Determines whether a run was scored in the first inning of a game, using the stored result if there is one.
+
+        Args:
+            a_gameID (int): The ID used by the MLB API to represent the game.
+
+        Returns:
+            A boolean, true if a run was scored in the first inning of the game, false otherwise.
+        """
+        return self.GetGameOutcome(a_gameID)['yrfi']
+
+    def GetHittingBetReview(self, a_hitterID, a_gameDate, a_gameID):
+        """Gets the betting benchmarks a hitter achieved on a specific day, using the stored review if there is one.
+
+        If the review is not stored, a Hitter object is created for the hitter (see HittingBetReview() in the Hitter
+        class). The review is only stored once the date has passed and the hitter's game is final (see
+        GetGameOutcome()), since a hitter whose game is late, suspended or still in progress would otherwise be stored
+        as not playing.
+
+        Args:
+            a_hitterID (int): The ID used by the MLB API to represent the hitter.
+            a_gameDate (string): The date of the game being reviewed as a string (ex: 05/15/2024).
+            a_gameID (int): The ID used by the MLB API to represent the hitter's game on that date.
+
+        Returns:
+            A dictionary containing several betting benchmarks, and whether the hitter reached them. If the hitter did
+            not play on the given date, an empty dictionary is returned.
+        """
+        hitterID = int(a_hitterID)
+
+        with self.Connect() as connection:
+            storedReview = connection.execute('SELECT Bet_Review FROM HittingOutcomes WHERE Hitter_ID = ? AND Date = ?', (hitterID, a_gameDate)).fetchone()
+
+        if storedReview is not None:
+            return json.loads(storedReview[0])
+
+        betReview = Hitter(hitterID).HittingBetReview(a_gameDate)
+
+        if datetime.strptime(a_gameDate, '%m/%d/%Y').date() < datetime.today().date() and self.GetGameOutcome(a_gameID)['isFinal']:
+            with self.Connect() as connection:
+                connection.execute('INSERT OR REPLACE INTO HittingOutcomes (Hitter_ID, Date, Bet_Review) VALUES (?, ?, ?)',
+                                   (hitterID, a_gameDate, json.dumps(betReview)))
+
+        return betReview
+
+    def Connect(self):
+        """Opens a new connection to the outcome database.
+
+        A new connection is opened for every operation so that the cache can be shared between threads.
+
+        Returns:
+            A sqlite3.Connection object. When used in a with statement, the changes are committed at the end of it.
+        """
+        return sqlite3.connect(self.m_databasePath, timeout=30)
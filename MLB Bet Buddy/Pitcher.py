@@ -151,10 +151,10 @@ class Pitcher(Player):
         """Calculates the percentage of games a pitcher lets up a run in the first inning.
 
         This method is used to calculate the YRFI percentage for a pitcher. First, all the pitcher's starts within 
-        the provided date range is extracted from the MLB API. Then, a Game object is created for each of their 
-        starts, and the total number of games where the pitcher lets up a run in the first inning is tallied. The 
-        YRFI percentage is calculated by taking this total and dividing it by their total number of starts in the 
-        date range.
+        the provided date range is extracted from the MLB API. Then, the first inning of each of their starts is looked
+        up (see GetFirstInningSummary() in the Game class), and the total number of games where the pitcher lets up a
+        run in the first inning is tallied. The YRFI percentage is calculated by taking this total and dividing it by
+        their total number of starts in the date range.
 
         Args:
             a_season (int): The season to get the YRFI percentage for.
@@ -190,16 +190,16 @@ class Pitcher(Player):
             else:
                 totalGamesStarted += 1
             
-            #Extract the game's ID and create a Game object from that ID.
+            #Extract the game's ID and get the summary of that game's first inning (see GetFirstInningSummary() in the Game class).
             gameID = game['game']['gamePk']
-            gameObj = Game(gameID)
+            firstInningSummary = Game.GetFirstInningSummary(gameID)
             
             #Ensure the game has ended. If it hasn't, continue looping through all the games.
-            if not gameObj.IsGameFinal():
+            if not firstInningSummary['isFinal']:
                 continue
             
             #Determine if the pitcher lets up a run in the 1st inning for that game.
-            if gameObj.DidPitcherLetUpRunFirstInning(self.m_playerID):
+            if self.m_playerID in firstInningSummary['scoringPitcherIDs']:
                 yrfiCount += 1
         
         #Make sure a game has been played to avoid division by 0 error.
@@ -6,8 +6,13 @@
 #********************************************************************************************************************************
 
 from Endpoints import Endpoints
+from PlayerIndex import PlayerIndex
 
 class Player():
+    #CONSTANTS
+    #Local index of every player on the season rosters, shared by all lookups so names can be resolved without the MLB API.
+    PLAYER_INDEX = PlayerIndex()
+
     #CONSTRUCTOR
     def __init__(self, a_playerID = 592450):
         """Constructor for the Player class.
@@ -79,7 +84,10 @@ class Player():
     def FindPlayerID(a_playerFullName):
         """Searches for a player ID based on a player's full name.
 
-        This method is used to obtain a player's ID that's used for the MLB API, based on a full name. In the case
+        This method is used to obtain a player's ID that's used for the MLB API, based on a full name. The local player
+        index (see the PlayerIndex class) is searched first, which handles exact and accent-folded names without
+        accessing the MLB API. The index is rebuilt from the season rosters once a day. Only if the
+        player cannot be found in the index (such as a retired player) is the MLB API's people search used. In the case
         where the full name is shared between two players, the most recent player with that name is returned.
 
         Args:
@@ -88,6 +96,11 @@ class Player():
         Returns:
             An integer, representing the player's ID.
         """
+        #Search the local player index first.
+        playerID = Player.PLAYER_INDEX.FindPlayerID(a_playerFullName)
+        if playerID != 0:
+            return playerID
+
         #Create a temporary endpoint object.
         tempEndpointObj = Endpoints()
         
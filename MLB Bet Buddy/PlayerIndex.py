@@ -0,0 +1,263 @@
+#********************************************************************************************************************************
+# Author: Ian Pluchino                                                                                                          *
+# Class: PlayerIndex class                                                                                                      *
+# Description: A local name to player ID index built from the season rosters, used to look up players without the MLB API.     *
+# Date: 5/2/24                                                                                                                  *
+#********************************************************************************************************************************
+
+from Endpoints import Endpoints
+from collections import Counter
+from datetime import date
+import threading
+import unicodedata
+
+class PlayerIndex():
+    #CONSTANTS
+    #Characters that are removed from names before they are compared (ex: "J.D. Martinez" --> "jd martinez").
+    IGNORED_NAME_CHARACTERS = ".'`-,"
+
+    #CONSTRUCTOR
+    def __init__(self):
+        """Constructor for the PlayerIndex class.
+
+        This constructor is used to create an empty PlayerIndex object. The index is filled the first time a lookup is
+        made (see Refresh()), and is automatically rebuilt once a day so that call-ups and trades are picked up.
+
+        Returns:
+            Nothing.
+        """
+        #Endpoint object from the Endpoints class to handle MLB API access.
+        self.m_endpointObj = Endpoints()
+
+        #Exact full name --> player ID.
+        self.m_exactIndex = {}
+
+        #Accent-folded, lowercase name without punctuation --> player ID.
+        self.m_foldedIndex = {}
+
+        #Trigram --> set of player IDs whose folded name contains that trigram. Used for fuzzy searching.
+        self.m_trigramIndex = {}
+
+        #Player ID --> the total number of trigrams in that player's folded name.
+        self.m_trigramCounts = {}
+
+        #Player ID --> full name, used when returning fuzzy search results.
+        self.m_playerNames = {}
+
+        #The date and season the index was last built for.
+        self.m_lastRefreshDate = None
+        self.m_season = None
+
+        #Makes sure only one thread rebuilds the index at a time, since the index is shared by every thread.
+        self.m_refreshLock = threading.Lock()
+
+    #GETTERS
+    def GetLastRefreshDate(self):
+        """Gets the date that the index was last built.
+
+        Returns:
+            A date object representing the last time the index was built, or None if it has never been built.
+        """
+        return self.m_lastRefreshDate
+
+    def GetTotalPlayers(self):
+        """Gets the total number of players stored in the index.
+
+        Returns:
+            An integer, representing the total number of players in the index.
+        """
+        return len(self.m_playerNames)
+
+    #UTILITY METHODS
+    def NeedsRefresh(self, a_season):
+        """Determines if the index needs to be rebuilt.
+
+        Args:
+            a_season (int): The season the index is being used for.
+
+        Returns:
+            A boolean, true if the index has not been built today or was built for a different season, false otherwise.
+        """
+        return self.m_lastRefreshDate != date.today() or self.m_season != a_season
+
+    def Refresh(self, a_season):
+        """Rebuilds the index from every player on an MLB roster in the provided season.
+
+        This method downloads the full list of players for the season from the MLB API in a single call and rebuilds
+        the exact, accent-folded and trigram indices from it. If no players are returned (between seasons, or if the
+        roster could not be loaded), the previous season's players are used instead. The index is marked as built for
+        the day either way, so the rosters are downloaded at most once a day. In the rare case where two players share
+        a name, the player with the larger ID (the more recent player) is kept, matching the behavior of
+        Player.FindPlayerID().
+
+        Args:
+            a_season (int): The season to build the index from.
+
+        Returns:
+            Nothing.
+        """
+        #Get every player in the season. If the season has not started yet, use the players from the previous season.
+        people = self.GetSeasonPlayers(a_season)
+        if not people:
+            people = self.GetSeasonPlayers(a_season - 1)
+
+        exactIndex = {}
+        foldedIndex = {}
+        trigramIndex = {}
+        trigramCounts = {}
+        playerNames = {}
+
+        for person in people:
+            if 'fullName' not in person or 'id' not in person:
+                continue
+
+            fullName = person['fullName']
+            playerID = person['id']
+
+            #Keep the most recent player in the case of shared names.
+            if fullName in exactIndex and exactIndex[fullName] > playerID:
+                continue
+
+            exactIndex[fullName] = playerID
+
+        #Build the folded and trigram indices from the final set of players.
+        for fullName, playerID in exactIndex.items():
+            foldedName = self.FoldName(fullName)
+            playerNames[playerID] = fullName
+            foldedIndex[foldedName] = playerID
+
+            trigrams = self.CreateTrigrams(foldedName)
+            trigramCounts[playerID] = len(trigrams)
+            for trigram in trigrams:
+                trigramIndex.setdefault(trigram, set()).add(playerID)
+
+        #Swap in the new indices all at once.
+        self.m_exactIndex = exactIndex
+        self.m_foldedIndex = foldedIndex
+        self.m_trigramIndex = trigramIndex
+        self.m_trigramCounts = trigramCounts
+        self.m_playerNames = playerNames
+        self.m_season = a_season
+        self.m_lastRefreshDate = date.today()
+
+    def GetSeasonPlayers(self, a_season):
+        """Downloads the full list of players on an MLB roster in the provided season.
+
+        Args:
+            a_season (int): The season to get the players of.
+
+        Returns:
+            A list of dictionaries, one per player, as returned by the MLB API. The list is empty if no players could be
+            found.
+        """
+        #Create the endpoint to obtain every player in the season and access the data from it.
+        allPlayersEndpoint = self.m_endpointObj.GetAllPlayersEndpoint(a_season)
+        allPlayersData = self.m_endpointObj.AccessEndpointData(allPlayersEndpoint)
+
+        return allPlayersData.get('people', [])
+
+    def FindPlayerID(self, a_playerFullName, a_season = None):
+        """Searches the index for a player ID based on a player's name.
+
+        This method first checks for an exact match on the full name. If there isn't one, the name is accent-folded
+        and stripped of punctuation (see FoldName()) and checked again, so that "Jose Ramirez" finds "José Ramírez".
+        Fuzzy matches are never returned, since a player who is not on a roster would otherwise be resolved to a
+        different player with a similar name (see FindClosestPlayers() for suggestions). The index is rebuilt first if
+        it has not been built yet today. Only one thread rebuilds the index, while any others wait for it to finish.
+
+        Args:
+            a_playerFullName (string): An MLB player full name.
+            a_season (int): The season to search the rosters of. The current year is used by default.
+
+        Returns:
+            An integer, representing the player's ID. 0 is returned if no player could be matched.
+        """
+        season = a_season if a_season is not None else date.today().year
+        if self.NeedsRefresh(season):
+            with self.m_refreshLock:
+                #Another thread may have rebuilt the index while this one was waiting.
+                if self.NeedsRefresh(season):
+                    self.Refresh(season)
+
+        #Exact match.
+        if a_playerFullName in self.m_exactIndex:
+            return self.m_exactIndex[a_playerFullName]
+
+        #Accent-folded match.
+        foldedName = self.FoldName(a_playerFullName)
+        if foldedName in self.m_foldedIndex:
+            return self.m_foldedIndex[foldedName]
+
+        return 0
+
+    def FindClosestPlayers(self, a_playerName, a_maxResults = 5):
+        """Finds the players in the index whose names are the most similar to the provided name.
+
+        The similarity between two names is the Jaccard similarity of their sets of trigrams (every group of three
+        consecutive characters in the folded name). Only players that share at least one trigram with the provided
+        name are considered, so the search does not need to compare against every player in the index.
+
+        Args:
+            a_playerName (string): The name of the player being searched for.
+            a_maxResults (int): The maximum number of players to return.
+
+        Returns:
+            A list of dictionaries sorted from most to least similar, each containing the player's ID, full name and
+            similarity (between 0 and 1).
+        """
+        queryTrigrams = self.CreateTrigrams(self.FoldName(a_playerName))
+        if not queryTrigrams:
+            return []
+
+        #Count how many trigrams each candidate player shares with the provided name.
+        sharedCounts = Counter()
+        for trigram in queryTrigrams:
+            for playerID in self.m_trigramIndex.get(trigram, ()):
+                sharedCounts[playerID] += 1
+
+        results = []
+        for playerID, sharedCount in sharedCounts.items():
+            similarity = sharedCount / (len(queryTrigrams) + self.m_trigramCounts[playerID] - sharedCount)
+            results.append({ 'playerID': playerID,
+                             'fullName': self.m_playerNames[playerID],
+                             'similarity': similarity })
+
+        results.sort(key=lambda result: result['similarity'], reverse=True)
+        return results[:a_maxResults]
+
+    @staticmethod
+    def FoldName(a_playerName):
+        """Normalizes a name so that accents, case, punctuation and extra spaces are ignored when comparing names.
+
+        Args:
+            a_playerName (string): The name to normalize.
+
+        Returns:
+            A string, representing the normalized name. Example: "José Ramírez Jr." --> "jose ramirez jr".
+        """
+        #Separate the accents from their letters, then drop the accents.
+        decomposedName = unicodedata.normalize('NFKD', a_playerName)
+        foldedName = ''.join(character for character in decomposedName if not unicodedata.combining(character))
+
+        foldedName = foldedName.lower()
+        for character in PlayerIndex.IGNORED_NAME_CHARACTERS:
+            foldedName = foldedName.replace(character, '')
+
+        return ' '.join(foldedName.split())
+
+    @staticmethod
+    def CreateTrigrams(a_foldedName):
+        """Splits a normalized name into its set of trigrams.
+
+        Args:
+            a_foldedName (string): A name that has already been normalized (see FoldName()).
+
+        Returns:
+            A set of strings, each being three consecutive characters of the padded name.
+        """
+        if not a_foldedName:
+            return set()
+
+        #Pad the name so that the first and last letters are weighted the same as the letters in the middle.
+        paddedName = '  ' + a_foldedName + ' '
+        return { paddedName[index:index + 3] for index in range(len(paddedName) - 2) }
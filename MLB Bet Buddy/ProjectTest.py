@@ -42,6 +42,8 @@ playerID = Player.FindPlayerID('Anthony Volpe')
 print('The player ID for Anthony Volpe is:', playerID, '\n')
 player = Player(playerID)
 print('The hand information for Anthony Volpe is:', player.GetHandInformation(), '\n')
+print('The player ID for Jose Ramirez (accents omitted) is:', Player.FindPlayerID('Jose Ramirez'), '\n')
+print('The closest players to the misspelled name Antony Volpe are:', Player.PLAYER_INDEX.FindClosestPlayers('Antony Volpe', 3), '\n')
 
 #Testing the Pitcher class.
 print('TESTING THE PITCHER CLASS')
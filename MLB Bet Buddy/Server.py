@@ -5,20 +5,56 @@
 # Date: 5/2/24                                                                                                                  *
 #********************************************************************************************************************************
 
-from quart import Quart, jsonify
+from quart import Quart, jsonify, request
 import asyncio
-from sqlalchemy import create_engine, Column, Integer, String, Float
+import threading
+import uuid
+import base64
+import json
+from sqlalchemy import create_engine, select, insert, delete, literal, text, or_, and_, case, func, Column, Index, Integer, String, Float, Date as SQLDate
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import pandas as pd
 from BetPredictor import BetPredictor
-from Game import Game
-from Hitter import Hitter
+from Endpoints import Endpoints
+from OutcomeCache import OutcomeCache
 
 #CONSTANTS
 #Names of the valid tables in the database.
 TABLE_NAMES = ['TodaySchedule', 'ArchiveSchedule', 'TodayNRFI', 'ArchiveNRFI', 'TodayHitting', 'ArchiveHitting']
 
+#Names of the accuracy summary tables. They are only used by the accuracy route, so they cannot be viewed.
+SUMMARY_TABLE_NAMES = ['NRFIAccuracySummary', 'HittingAccuracySummary']
+
+#Tables whose view responses are kept in memory. The Today tables are small and requested every time the app is opened.
+CACHED_VIEW_TABLES = ['TodaySchedule', 'TodayNRFI', 'TodayHitting']
+
+#Largest number of top bets the accuracy curve can be requested for.
+MAXIMUM_ACCURACY_CURVE_LENGTH = 200
+
+#Largest number of rows that can be requested in a single page from the view routes.
+MAXIMUM_VIEW_PAGE_SIZE = 1000
+
+#Table name --> column the view routes sort by (best bet first) when order_by=score is requested.
+SCORE_COLUMN_NAMES = { 'TodayNRFI': 'Overall NRFI Score', 'ArchiveNRFI': 'Overall NRFI Score',
+                       'TodayHitting': 'Overall Hitting Score', 'ArchiveHitting': 'Overall Hitting Score' }
+
+#Tables where the lowest score is the best bet. The best NRFI bets have the lowest scores (and the best YRFI bets the highest).
+ASCENDING_SCORE_TABLES = ['TodayNRFI', 'ArchiveNRFI']
+
+#Version of the database layout, stored in the database file so that older databases are migrated on startup (see
+#MigrateDatabase()). Version 1 stores dates as ISO dates (YYYY-MM-DD) and adds the table indexes. Version 2 adds the accuracy
+#summary tables. Version 3 ranks YRFI bets with a missing score first, as the best YRFI bets.
+DATABASE_VERSION = 3
+
+#Archive rows are moved in and reviewed the day after their games, so archive dates at least this many days old never change.
+ARCHIVE_SETTLED_DAYS = 2
+
+#How long (in seconds) clients may keep a settled archive date's response without checking with the server again (one year).
+SETTLED_ARCHIVE_MAX_AGE = 31536000
+
 #Important dates and season information.
 OPENING_DAY_2023 = datetime.strptime('03/30/2023', '%m/%d/%Y')
 OPENING_DAY_2024 = datetime.strptime('03/20/2024', '%m/%d/%Y')
@@ -34,6 +70,11 @@ CURRENT_SEASON = 2024
 MINIMUM_NRFIYRFI_BETS = 7
 MINIMUM_HITTING_BETS = 40
 
+#Read connection pool limits. The view and accuracy routes share this many connections, with a few extra allowed during bursts.
+READ_POOL_SIZE = 5
+READ_POOL_MAX_OVERFLOW = 5
+READ_POOL_TIMEOUT = 30
+
 #QUART AND SQLALCHEMY SETUP.
 #Quart server object.
 app = Quart(__name__)                                           
@@ -50,13 +91,39 @@ engine = create_engine('sqlite:///database.db', echo=True)
 #Session to create a connection with the database.
 Session = sessionmaker(bind=engine)
 
+#Asynchronous database engine used by the read routes, so a slow query does not stop the server from handling other requests.
+asyncEngine = create_async_engine('sqlite+aiosqlite:///database.db', pool_size=READ_POOL_SIZE, max_overflow=READ_POOL_MAX_OVERFLOW,
+                                  pool_timeout=READ_POOL_TIMEOUT)
+
+#Asynchronous session used by the read routes.
+AsyncSession = async_sessionmaker(bind=asyncEngine, expire_on_commit=False)
+
+#VIEW RESPONSE CACHE
+#(table name, date or None) --> serialized JSON response body. Only tables in CACHED_VIEW_TABLES are stored.
+viewResponseCache = {}
+
+#(top NRFI/YRFI bets, top hitting bets) --> accuracy results. Cleared every time the bets are reviewed.
+accuracyResponseCache = {}
+
+#Table name --> data version, increased every time the table is written to (see MarkTablesModified()).
+tableVersions = {tableName: 0 for tableName in TABLE_NAMES + SUMMARY_TABLE_NAMES}
+
+#Table name --> time the table was last written to. Rounded down to the second, since that is all HTTP dates can hold.
+tableModifiedTimes = {tableName: datetime.now(timezone.utc).replace(microsecond=0) for tableName in TABLE_NAMES + SUMMARY_TABLE_NAMES}
+
+#Unique ID for this run of the server. It is part of every ETag, since the table versions start over when the server restarts.
+SERVER_BOOT_ID = uuid.uuid4().hex[:12]
+
+#Lock for the response caches and table versions, since the tables are written to from a worker thread.
+responseCacheLock = threading.Lock()
+
 #DATABASE TABLE MODELS. Note: There will be two tables for each kind of table, an active Today table and an Archive table. 
 #Base table model for a schedule of MLB games.
 class ScheduleBaseModel():
     #Note: Each variable matches the case of how the column is in the database.
     id = Column('id', Integer, primary_key=True)
-    Game_ID = Column('Game ID', Integer)
-    Date = Column('Date', String)
+    Game_ID = Column('Game ID', Integer, index=True)
+    Date = Column('Date', SQLDate, index=True)
     DateTime_String = Column('DateTime String', String)
     Time = Column('Time', String)	
     Home_Team_Name = Column('Home Team Name', String)	
@@ -88,11 +155,11 @@ class ArchiveScheduleTable(ScheduleBaseModel, Base):
 class NRFIBaseModel():
     #Note: Each variable matches the case of how the column is in the database.
     id = Column('id', Integer, primary_key=True)
-    Game_ID = Column('Game ID', Integer)	
-    Date = Column('Date', String)
+    Game_ID = Column('Game ID', Integer, index=True)
+    Date = Column('Date', SQLDate, index=True)
     DateTime_String = Column('DateTime String', String)
     Home_Pitcher_Name = Column('Home Pitcher Name', String)
-    Home_Pitcher_ID = Column('Home Pitcher ID', Integer)
+    Home_Pitcher_ID = Column('Home Pitcher ID', Integer, index=True)
     Home_Pitcher_Games_Started = Column('Home Pitcher Games Started', Integer)
     Home_Pitcher_Record = Column('Home Pitcher Record', String)	
     Home_Pitcher_ERA = Column('Home Pitcher ERA', Float)	
@@ -101,7 +168,7 @@ class NRFIBaseModel():
     Home_Pitcher_Homeruns_Per_9 = Column('Home Pitcher Homeruns Per 9', Float)	
     Home_Pitcher_YRFI_Percentage = Column('Home Pitcher YRFI Percentage', Float)	
     Away_Pitcher_Name = Column('Away Pitcher Name', String)	
-    Away_Pitcher_ID = Column('Away Pitcher ID', Integer)
+    Away_Pitcher_ID = Column('Away Pitcher ID', Integer, index=True)
     Away_Pitcher_Games_Started = Column('Away Pitcher Games Started', Integer)
     Away_Pitcher_Record = Column('Away Pitcher Record', String)
     Away_Pitcher_ERA = Column('Away Pitcher ERA', Float)
@@ -142,20 +209,22 @@ class NRFIBaseModel():
 #Today NRFI/YRFI table.
 class TodayNRFITable(NRFIBaseModel, Base):
     __tablename__ = 'TodayNRFI'
+    __table_args__ = (Index('ix_TodayNRFI_Date_Score', 'Date', 'Overall NRFI Score'),)
 
 #Archive NRFI/YRFI table.
 class ArchiveNRFITable(NRFIBaseModel, Base):
     __tablename__ = 'ArchiveNRFI'
+    __table_args__ = (Index('ix_ArchiveNRFI_Date_Score', 'Date', 'Overall NRFI Score'),)
 
 #Base table model for the hitting bet predictions.    
 class HittingBaseModel():
     #Note: Each variable matches the case of how the column is in the database.
     id = Column('id', Integer, primary_key=True)
-    Game_ID = Column('Game ID', Integer)	
-    Date = Column('Date', String)
+    Game_ID = Column('Game ID', Integer, index=True)
+    Date = Column('Date', SQLDate, index=True)
     DateTime_String = Column('DateTime String', String)
     Hitter_Name = Column('Hitter Name', String)	
-    Hitter_ID = Column('Hitter ID', Integer)	
+    Hitter_ID = Column('Hitter ID', Integer, index=True)
     Hitter_Team_Name = Column('Hitter Team Name', String)	
     Hitter_Team_ID = Column('Hitter Team ID', Integer)	
     Bat_Hand = Column('Bat Hand', String)	
@@ -166,7 +235,7 @@ class HittingBaseModel():
     Vs_Left_BA = Column('Vs. Left BA', Float)	
     Vs_Right_BA = Column('Vs. Right BA', Float)	
     Pitcher_Name = Column('Pitcher Name', String)	
-    Pitcher_ID = Column('Pitcher ID', Integer)	
+    Pitcher_ID = Column('Pitcher ID', Integer, index=True)
     Pitcher_Team_Name = Column('Pitcher Team Name', String)	
     Pitcher_Team_ID = Column('Pitcher Team ID', Integer)	
     Pitching_Hand = Column('Pitching Hand', String)	
@@ -202,10 +271,36 @@ class HittingBaseModel():
 #Today hitting table.
 class TodayHittingTable(HittingBaseModel, Base):
     __tablename__ = 'TodayHitting'
+    __table_args__ = (Index('ix_TodayHitting_Date_Score', 'Date', 'Overall Hitting Score'),)
     
 #Archive hitting table.
 class ArchiveHittingTable(HittingBaseModel, Base):
     __tablename__ = 'ArchiveHitting'
+    __table_args__ = (Index('ix_ArchiveHitting_Date_Score', 'Date', 'Overall Hitting Score'),)
+
+#ACCURACY SUMMARY TABLE MODELS. Note: Each row holds the outcome of the bet at one rank on one day, so the accuracy of the top
+#bets can be tallied without reading the archive tables (see UpdateAccuracySummary()).
+#NRFI/YRFI accuracy summary table. The NRFI and YRFI bets of a day are ranked separately.
+class NRFIAccuracySummaryTable(Base):
+    __tablename__ = 'NRFIAccuracySummary'
+    Date = Column('Date', SQLDate, primary_key=True)
+    Bet_Type = Column('Bet Type', String, primary_key=True)
+    Rank = Column('Rank', Integer, primary_key=True, index=True)
+    Day_Bets = Column('Day Bets', Integer)
+    Played = Column('Played', Integer)
+    Win = Column('Win', Integer)
+
+#Hitting accuracy summary table.
+class HittingAccuracySummaryTable(Base):
+    __tablename__ = 'HittingAccuracySummary'
+    Date = Column('Date', SQLDate, primary_key=True)
+    Rank = Column('Rank', Integer, primary_key=True, index=True)
+    Day_Bets = Column('Day Bets', Integer)
+    Played = Column('Played', Integer)
+    At_Least_1_Hit_Win = Column('At Least 1 Hit Win', Integer)
+    At_Least_2_Hit_Win = Column('At Least 2 Hit Win', Integer)
+    At_Least_2_HRR_Win = Column('At Least 2 HRR Win', Integer)
+    At_Least_3_HRR_Win = Column('At Least 3 HRR Win', Integer)
     
 #SERVER ROUTES
 #Route to view data from any of the tables. Data is returned in a JSON format.
@@ -215,64 +310,30 @@ async def ViewTable(a_tableName):
 
     This route is used to view the information from any of the tables that are stored in the database. The desired
     table is specified in the request. If the table name being requested is not valid, a 404 error is returned and an
-    error message is added into the response JSON. If the table name is valid, a connection is made with the
-    database, and the data from the database is acquired. The data returned from the database is looped through in
-    order to build a list of dictionaries (each dictionary represents a row of the table) so that it can be returned
-    in a JSON format once all rows have been processed.
+    error message is added into the response JSON. If the table name is valid, the table's data is returned in a JSON
+    format (see CreateViewResponse()). The Today tables are served from memory until they are next updated, and a
+    304 response with no data is returned if the client already has the latest version of the table. The optional
+    query parameters limit, cursor, columns and order_by can be used to page through large tables (see
+    ParseViewOptions()).
 
     Args:
         a_tableName (string): The name of the table in the database to return the information from.
 
     Returns:
         A response containing JSON data representing the information that's stored in the database for the requested
-        table. The JSON contains an error message if an invalid table name is provided.
-
-    Assistance Received:
-        https://stackoverflow.com/questions/37369686/how-can-i-use-a-string-to-to-represent-an-sqlalchemy-object-attribute
+        table. The JSON contains an error message if an invalid table name or query parameter is provided.
     """
     #First make sure that the table name is valid. If it isn't, return a 404 error.
     if a_tableName not in TABLE_NAMES:
         return jsonify({'error': 'Invalid table name.'}), 404 
 
-    #Create a session connection to the database.
-    session = Session()
-    
-    #Get the table class definition based on the request.
-    tableClassDefinition = GetTableClassDefinition(a_tableName)
-
-    #Query the database for the data.
-    data = session.query(tableClassDefinition).all()
-    session.close()
-    
-    #Make sure there is data in the table.
-    if not data:
-        return jsonify([]), 200
-    
-    #Loop through each row of the returned data from the database.
-    tableColumns = tableClassDefinition.__table__.columns
-    result = []
-    for row in data:
-        data_row = {}
-        
-        #Loop through each column of each row.
-        for column in tableColumns:
-            #Extract information about the individual column, and append it to the row's data. 
-            columnName = column.name
-            
-            #Skip the id column.
-            if columnName == 'id':
-                continue
-            
-            #Note: The column name is fixed from spaces to underscores, since the variables in the database model class 
-            #have underscores, not spaces.
-            columnValue = getattr(row, ConvertColumnName(columnName))
-            
-            data_row[columnName] = columnValue        
-            
-        #Append the row to the overall result.
-        result.append(data_row)
+    #Make sure the pagination, column and ordering options are valid.
+    viewOptions, errorMessage = ParseViewOptions(a_tableName)
+    if errorMessage is not None:
+        return jsonify({'error': errorMessage}), 400
 
-    return jsonify(result), 200
+    #Get the table's data, or a 304 response if the client already has it.
+    return await CreateViewResponse(a_tableName, a_viewOptions=viewOptions)
 
 #Route to view information in the database on a specific date --> Mostly used with the archive tables to view specific past bet predictions.
 @app.route('/view/<a_tableName>/<a_dateStr>', methods=['GET'])
@@ -282,10 +343,10 @@ async def ViewTableSpecificDate(a_tableName, a_dateStr):
     This route is used to view specific information from a certain date from any of the tables that are stored in the
     database. The desired table and date of the information returned is specified in the request. If the table name
     being requested is not valid or the date provided does not follow the required format, a 404/400 error is
-    returned and an error message is added into the response JSON. If the table name is valid, a connection is made
-    with the database, and the data from the database where the dates match is acquired. The data returned from the
-    database is looped through to build a list of dictionaries (each dictionary represents a row of the
-    table) so that it can be returned in a JSON format once all rows have been processed.
+    returned and an error message is added into the response JSON. If the table name is valid, the data from the
+    table where the dates match is returned in a JSON format (see CreateViewResponse()). Archive dates that can no
+    longer change are returned with headers allowing the client to keep them. The same optional query parameters as
+    the ViewTable route are supported (see ParseViewOptions()).
 
     Args:
         a_tableName (string): The name of the table in the database to return the information from.
@@ -293,10 +354,8 @@ async def ViewTableSpecificDate(a_tableName, a_dateStr):
 
     Returns:
         A response containing JSON data representing the information that's stored in the database for the requested
-        table and date. The JSON contains an error message if an invalid table name is provided.
-
-    Assistance Received:
-        https://stackoverflow.com/questions/37369686/how-can-i-use-a-string-to-to-represent-an-sqlalchemy-object-attribute
+        table and date. The JSON contains an error message if an invalid table name, date or query parameter is
+        provided.
     """
     #First make sure that the table name is valid. If it isn't, return a 404 error.
     if a_tableName not in TABLE_NAMES:
@@ -304,47 +363,17 @@ async def ViewTableSpecificDate(a_tableName, a_dateStr):
     
     #Next, make sure the request has the date in a valid format. The format expected is: MM-DD-YYYY. Example: 05-15-2024
     try:
-        #If it is valid, make sure to convert it into the correct format. Dates are stored in the database in the format MM/DD/YYYY
         dateTimeObj = datetime.strptime(a_dateStr, '%m-%d-%Y')
-        formattedDateString = datetime.strftime(dateTimeObj, '%m/%d/%Y')
     except:
         return jsonify({'error': 'Invalid Date Format. Please use the format MM-DD-YYYY. Example: 05-15-2024'}), 400
     
-    #If the date is in the correct format, query the database for records with that date.
-    tableClassDefinition = GetTableClassDefinition(a_tableName)
-    session = Session()
-    data =  session.query(tableClassDefinition).filter(tableClassDefinition.Date == formattedDateString).all()
-    session.close()
-    
-    #Make sure there is data in the returned database query.
-    if not data:
-        return jsonify([]), 200
-
-    #Loop through each row of the returned data from the database.
-    tableColumns = tableClassDefinition.__table__.columns
-    result = []
-    for row in data:
-        data_row = {}
-        
-        #Loop through each column of each row. 
-        for column in tableColumns:
-            #Extract information about the individual column and append it to the row's data. 
-            columnName = column.name
-            
-            #Skip the id column.
-            if columnName == 'id':
-                continue
-            
-            #Note: The column name is fixed from spaces to underscores, since the variables in the database model class
-            #have underscores, not spaces.
-            columnValue = getattr(row, ConvertColumnName(columnName))
-            
-            data_row[columnName] = columnValue        
-            
-        #Append the row to the overall result.
-        result.append(data_row)
+    #Make sure the pagination, column and ordering options are valid.
+    viewOptions, errorMessage = ParseViewOptions(a_tableName)
+    if errorMessage is not None:
+        return jsonify({'error': errorMessage}), 400
 
-    return jsonify(result), 200
+    #If the date is in the correct format, get the records with that date.
+    return await CreateViewResponse(a_tableName, dateTimeObj.date(), viewOptions)
     
 #Route to trigger an update for bet predictions for a new day.
 @app.route('/update', methods=['GET'])
@@ -354,10 +383,12 @@ async def TriggerUpdate():
     This route is used to trigger an update of the schedule and bet predictions for a new day. The current date that
     this route is called is generated, and the schedule along with the bet predictions are generated asynchronously
     so that the server is still responsive while a bet update is ongoing (see UpdateBetPredictions()). Once the
-    schedule and bet predictions are generated, they are inserted into their correct tables in the database.
+    schedule and bet predictions are generated, they are inserted into their correct tables in the database, and the
+    new Today tables are loaded into the view response cache.
 
     Returns:
-        A response containing simple json data letting the user know that a bet prediction update was successful.
+        A response containing simple json data letting the user know that a bet prediction update was successful. Any
+        games that could not be added to the schedule are listed in the response, along with the error for each.
 
     Assistance Received:
         https://superfastpython.com/asyncio-to_thread/
@@ -366,20 +397,31 @@ async def TriggerUpdate():
 
     #Asynchronously create and update the bet predictions for a new day.
     #It is done asynchronously in the background so that the server does not freeze up while the bet predictions are being created.
-    await asyncio.to_thread(UpdateBetPredictions, CURRENT_OPENING_DAY, date, CURRENT_SEASON)
+    failedScheduleGames = await asyncio.to_thread(UpdateBetPredictions, CURRENT_OPENING_DAY, date, CURRENT_SEASON)
+
+    #Load the new Today tables into the view response cache so the first requests after the update are served from memory.
+    for tableName in CACHED_VIEW_TABLES:
+        await GetViewResponseBody(tableName)
 
-    return jsonify({'result': 'Bet update successfully completed.'}), 200 
+    #Let the user know if any games were left out of the schedule (and therefore out of the bet predictions).
+    if failedScheduleGames:
+        return jsonify({'result': 'Bet update completed, but ' + str(len(failedScheduleGames)) + ' game(s) could not be added to the schedule.',
+                        'failedGames': failedScheduleGames}), 200
+
+    return jsonify({'result': 'Bet update successfully completed.', 'failedGames': []}), 200 
 
 @app.route('/accuracy/<a_topNRFIYRFI>/<a_topHitters>', methods=['GET'])
 async def Accuracy(a_topNRFIYRFI, a_topHitters):
     """Route used to check the accuracy of the bet predictions previously made.
 
     This route is used to view information regarding the accuracy of both the NRFI/YRFI bet predictions and hitting
-    bet predictions that have already been made and stored in the database. Every day starting from opening day until
-    the current day is looped through and, the bet predictions are pulled from the ArchiveNRFITable and
-    ArchiveHittingTable. For both the bet types, the top X bet predictions made on that day are looped through (top X
-    determined from a_topNRFIYRFI and a_topHitters) and the total wins for each bet type are tallied. The accuracy
-    information is returned as a JSON, with the accuracies being represented as percentages.
+    bet predictions that have already been made and stored in the database. For every day from opening day until the
+    current day, the top X bet predictions of each bet type (top X determined from a_topNRFIYRFI and a_topHitters)
+    are tallied by the database in a single query for each bet type, using the accuracy summary tables that are
+    updated whenever the bets are reviewed (see CreateNRFIAccuracyQuery() and CreateHittingAccuracyQuery()). The
+    queries are made through an asynchronous connection so that other requests are still handled during the check.
+    The results are stored until the bets are next reviewed. The accuracy information is returned as a JSON, with the
+    accuracies being represented as percentages.
 
     Args:
         a_topNRFIYRFI (int): The number of top NRFI and YRFI bets of each day to consider.
@@ -402,79 +444,108 @@ async def Accuracy(a_topNRFIYRFI, a_topHitters):
     except:
         return jsonify({'error': 'Invalid format! The topNRFIYRFI and topHitters parameters must be integers!'}), 400
     
-    #Initialize the totals for the accuracy check.
-    totalNRFIGames = 0
-    totalYRFIGames = 0
-    totalNRFIWin = 0
-    totalYRFIWin = 0
-    totalHitters = 0
-    totalAtLeast1HitWin = 0
-    totalAtLeast2HitsWin = 0
-    totalAtLeast2HRRWin = 0           
-    totalAtLeast3HRRWin = 0
-    
-    session = Session()
-    date = CURRENT_OPENING_DAY
-    #Loop through each day, starting from opening day to the current one.
-    while date < datetime.today():
-        formattedDateString = datetime.strftime(date, '%m/%d/%Y')
-       
-        #Tally the accuracy of the NRFI and YRFI bets from this day.
-        nrfiyrfiData = session.query(ArchiveNRFITable).filter(ArchiveNRFITable.Date == formattedDateString).all()
-        
-        #Make sure there are enough NRFI/YRFI bets for the current day.
-        if len(nrfiyrfiData) > 2 * int(a_topNRFIYRFI) and len(nrfiyrfiData) >= MINIMUM_NRFIYRFI_BETS:
-            #Extract the top "a_topNRFIYRFI" NRFI and YRFI bets. Note: The best YRFI bets start from the bottom of the table.
-            for index in range(int(a_topNRFIYRFI)):
-                nrfiBet = nrfiyrfiData[index]
-                yrfiBet = nrfiyrfiData[-1 - index]
-                
-                #Check the results of the NRFI and YRFI bet.
-                if nrfiBet.Bet_Result == 'NRFI':
-                    totalNRFIWin += 1
-                
-                if yrfiBet.Bet_Result == 'YRFI':
-                    totalYRFIWin += 1
-                
-                #Increment the total game counters only if the game was not postponed. Postponed games are omitted from accuracy calculations.
-                if nrfiBet.Bet_Result != 'Postponed':
-                    totalNRFIGames += 1
-                
-                if yrfiBet.Bet_Result != 'Postponed':
-                    totalYRFIGames += 1
+    #The results only change when the bets are reviewed, so use the stored results if they have already been tallied.
+    cacheKey = (int(a_topNRFIYRFI), int(a_topHitters))
+    with responseCacheLock:
+        if cacheKey in accuracyResponseCache:
+            return jsonify(accuracyResponseCache[cacheKey]), 200
+        summaryVersions = [tableVersions[tableName] for tableName in SUMMARY_TABLE_NAMES]
 
-           
-        #Tally the accuracy of the hitting bets from this day.
-        hittingData = session.query(ArchiveHittingTable).filter(ArchiveHittingTable.Date == formattedDateString).all() 
-        
-        #Make sure there are enough hitting bets for the current day.
-        if len(hittingData) > int(a_topHitters) and len(hittingData) >= MINIMUM_HITTING_BETS:
-            #Extract only the top "a_topHitters" hitters from each day.   
-            for index in range(int(a_topHitters)):
-                hittingBet = hittingData[index]
-                
-                #Check the results of the hitting bet thresholds.
-                if hittingBet.At_Least_1_Hit_Success == '1':
-                    totalAtLeast1HitWin += 1
-                    
-                if hittingBet.At_Least_2_Hit_Success == '1':
-                    totalAtLeast2HitsWin += 1
-                    
-                if hittingBet.At_Least_2_HRR_Success == '1':
-                    totalAtLeast2HRRWin += 1
-                    
-                if hittingBet.At_Least_3_HRR_Success == '1':
-                    totalAtLeast3HRRWin += 1
-                    
-                #Increment the total hitter counter only if the game did not get postponed and the hitter played in the game.
-                if hittingBet.Result_Statline != 'Postponed' and hittingBet.Result_Statline != 'Did Not Play':
-                    totalHitters += 1
-        
-        #Move on to the next day.
-        date += timedelta(days=1)
+    #Tally the results of the top bets from every day in a single query for each bet type.
+    async with AsyncSession() as session:
+        nrfiyrfiTotals = (await session.execute(CreateNRFIAccuracyQuery(int(a_topNRFIYRFI)))).one()
+        hittingTotals = (await session.execute(CreateHittingAccuracyQuery(int(a_topHitters)))).one()
+
+    accuracyResults = CompileAccuracyResults(int(a_topNRFIYRFI), int(a_topHitters), nrfiyrfiTotals._mapping, hittingTotals._mapping)
+
+    #Only store the results if the bets were not reviewed while they were being tallied.
+    with responseCacheLock:
+        if [tableVersions[tableName] for tableName in SUMMARY_TABLE_NAMES] == summaryVersions:
+            accuracyResponseCache[cacheKey] = accuracyResults
+
+    #Return the results as JSON data.
+    return jsonify(accuracyResults), 200 
+
+#Route to check the accuracy of the bet predictions for every number of top bets, up to a maximum.
+@app.route('/accuracy/curve/<a_maxTop>', methods=['GET'])
+async def AccuracyCurve(a_maxTop):
+    """Route used to check the accuracy of the bet predictions for every number of top bets from 1 to a maximum.
+
+    This route returns the same accuracy information as the Accuracy route, for every number of top NRFI/YRFI and
+    hitting bets from 1 up to a_maxTop, so that the number of bets to publish each day can be chosen. Instead of
+    tallying each number of top bets separately, the bets of each day are ranked once, and each rank's results are
+    added to every number of top bets that includes them (see AccumulateAccuracyCurve()). The optional query
+    parameters start and end (in the format MM-DD-YYYY) limit the days checked (opening day until the current day by
+    default), and the optional stadium query parameter only counts the bets of games played at that stadium (the bets
+    are still ranked against every bet of their day).
+
+    Args:
+        a_maxTop (int): The largest number of top bets of each day to consider.
+
+    Returns:
+        A response containing a JSON list of accuracy results (see CompileAccuracyResults()), the first considering the
+        top bet of each day, the second the top 2 bets, and so on up to a_maxTop. The JSON contains an error message if
+        an invalid parameter is provided.
+    """
+    #Make sure the parameters are valid.
+    try:
+        maxTop = int(a_maxTop)
+    except:
+        return jsonify({'error': 'Invalid format! The maxTop parameter must be an integer!'}), 400
+
+    if maxTop < 1 or maxTop > MAXIMUM_ACCURACY_CURVE_LENGTH:
+        return jsonify({'error': f'Invalid maxTop! The maxTop parameter must be between 1 and {MAXIMUM_ACCURACY_CURVE_LENGTH}.'}), 400
+
+    try:
+        startDate = datetime.strptime(request.args['start'], '%m-%d-%Y').date() if 'start' in request.args else CURRENT_OPENING_DAY.date()
+        endDate = datetime.strptime(request.args['end'], '%m-%d-%Y').date() if 'end' in request.args else datetime.today().date()
+    except:
+        return jsonify({'error': 'Invalid Date Format. Please use the format MM-DD-YYYY. Example: 05-15-2024'}), 400
+
+    stadium = request.args.get('stadium')
+
+    #Rank the bets of each day and group them by rank and number of bets that day, then add up the curves.
+    async with AsyncSession() as session:
+        nrfiResult = await session.execute(CreateNRFICurveQuery('NRFI', maxTop, startDate, endDate, stadium))
+        yrfiResult = await session.execute(CreateNRFICurveQuery('YRFI', maxTop, startDate, endDate, stadium))
+        hittingResult = await session.execute(CreateHittingCurveQuery(maxTop, startDate, endDate, stadium))
+
+    #NRFI/YRFI days need more than twice as many bets as the number of top bets, and hitting days need more bets.
+    nrfiCurve = AccumulateAccuracyCurve(nrfiResult, maxTop, lambda dayBets: (dayBets - 1) // 2)
+    yrfiCurve = AccumulateAccuracyCurve(yrfiResult, maxTop, lambda dayBets: (dayBets - 1) // 2)
+    hittingCurve = AccumulateAccuracyCurve(hittingResult, maxTop, lambda dayBets: dayBets - 1)
+
+    accuracyCurve = [CompileAccuracyResults(top, top, {**nrfiCurve[top - 1], **yrfiCurve[top - 1]}, hittingCurve[top - 1]) 
+                     for top in range(1, maxTop + 1)]
+
+    return jsonify(accuracyCurve), 200
+
+#Helper function for the accuracy routes, used to format the accuracy results.
+def CompileAccuracyResults(a_topNRFIYRFI, a_topHitters, a_nrfiyrfiTotals, a_hittingTotals):
+    """Helper function used to compile the tallied bet results into the accuracy results returned by the accuracy routes.
+
+    Args:
+        a_topNRFIYRFI (int): The number of top NRFI and YRFI bets of each day that were considered.
+        a_topHitters (int): The number of top hitting bets of each day that were considered.
+        a_nrfiyrfiTotals (dict): The totalNRFIGames, totalNRFIWin, totalYRFIGames and totalYRFIWin tallies.
+        a_hittingTotals (dict): The totalHitters, totalAtLeast1HitWin, totalAtLeast2HitsWin, totalAtLeast2HRRWin and
+                                totalAtLeast3HRRWin tallies.
+
+    Returns:
+        A dictionary containing the totals and win percentages of both the NRFI/YRFI and hitting bet predictions.
+    """
+    totalNRFIGames = a_nrfiyrfiTotals['totalNRFIGames']
+    totalYRFIGames = a_nrfiyrfiTotals['totalYRFIGames']
+    totalNRFIWin = a_nrfiyrfiTotals['totalNRFIWin']
+    totalYRFIWin = a_nrfiyrfiTotals['totalYRFIWin']
+    totalHitters = a_hittingTotals['totalHitters']
+    totalAtLeast1HitWin = a_hittingTotals['totalAtLeast1HitWin']
+    totalAtLeast2HitsWin = a_hittingTotals['totalAtLeast2HitsWin']
+    totalAtLeast2HRRWin = a_hittingTotals['totalAtLeast2HRRWin']
+    totalAtLeast3HRRWin = a_hittingTotals['totalAtLeast3HRRWin']
 
     #Compile the accuracy results into a single dictionary. Ensure that there are no divide by zero errors.
-    accuracyResults = { 'NRFI/YRFI': { 'Top NRFI/YRFI Bets Considered For Each Day': int(a_topNRFIYRFI),
+    accuracyResults = { 'NRFI/YRFI': { 'Top NRFI/YRFI Bets Considered For Each Day': a_topNRFIYRFI,
                                        'Total NRFI Games': totalNRFIGames, 
                                        'Total NRFI Win': totalNRFIWin, 
                                        'Total YRFI Games': totalYRFIGames,
@@ -482,7 +553,7 @@ async def Accuracy(a_topNRFIYRFI, a_topHitters):
                                        'NRFI Win Percentage': f'{totalNRFIWin / totalNRFIGames:.4%}' if totalNRFIGames != 0 else '0.0000%',
                                        'YRFI Win Percentage': f'{totalYRFIWin / totalYRFIGames:.4%}' if totalYRFIGames != 0 else '0.0000%' },
                                        
-                        'Hitting': { 'Top Hitting Bets Considered For Each Day': int(a_topHitters),
+                        'Hitting': { 'Top Hitting Bets Considered For Each Day': a_topHitters,
                                      'Total Hitters': totalHitters, 
                                      'Total Over 0.5 Hits': totalAtLeast1HitWin, 
                                      'Total Over 1.5 Hits': totalAtLeast2HitsWin,  
@@ -493,8 +564,271 @@ async def Accuracy(a_topNRFIYRFI, a_topHitters):
                                      'Over 1.5 Hits+Runs+RBIs Win Percentage': f'{totalAtLeast2HRRWin / totalHitters:.4%}' if totalHitters != 0 else '0.0000%',
                                      'Over 2.5 Hits+Runs+RBIs Win Percentage': f'{totalAtLeast3HRRWin / totalHitters:.4%}' if totalHitters != 0 else '0.0000%', } }
 
-    #Return the results as JSON data.
-    return jsonify(accuracyResults), 200 
+    return accuracyResults
+
+#Helper function for the accuracy curve route, used to add up the results of each rank into the results of each number of top bets.
+def AccumulateAccuracyCurve(a_groupedResult, a_maxTop, a_lastTopFunction):
+    """Adds up the results of ranked bets into the results for every number of top bets from 1 to a maximum.
+
+    Each grouped row holds the results of the bets at one rank, on days with the same number of bets. Those bets count
+    toward every number of top bets from their rank up to the largest number of top bets their days have enough bets
+    for. Rather than adding each group to every one of those numbers, the group is added at its rank and subtracted
+    after the largest number (a difference array), and a running total then gives the results of every number of top
+    bets in a single pass.
+
+    Args:
+        a_groupedResult (sqlalchemy.Result): The grouped rows, each with rank and dayBets columns followed by the result
+                                             tallies.
+        a_maxTop (int): The largest number of top bets to add up the results for.
+        a_lastTopFunction (function): Returns the largest number of top bets a day with the given number of bets is
+                                      considered for.
+
+    Returns:
+        A list of dictionaries, containing the tallies for the top 1 bets, then the top 2 bets, and so on.
+    """
+    totalNames = [name for name in a_groupedResult.keys() if name not in ['rank', 'dayBets']]
+    differences = {name: [0] * (a_maxTop + 2) for name in totalNames}
+
+    for row in a_groupedResult:
+        lastTop = min(a_maxTop, a_lastTopFunction(row.dayBets))
+        if row.rank > lastTop:
+            continue
+
+        for name in totalNames:
+            differences[name][row.rank] += row._mapping[name]
+            differences[name][lastTop + 1] -= row._mapping[name]
+
+    curve = []
+    runningTotals = {name: 0 for name in totalNames}
+    for top in range(1, a_maxTop + 1):
+        for name in totalNames:
+            runningTotals[name] += differences[name][top]
+        curve.append(dict(runningTotals))
+
+    return curve
+
+#Helper function for the accuracy curve route, used to tally the NRFI or YRFI bet results at each rank.
+def CreateNRFICurveQuery(a_betType, a_maxTop, a_startDate, a_endDate, a_stadium = None):
+    """Helper function used to create the query that tallies the results of the NRFI or YRFI bets at each rank.
+
+    Args:
+        a_betType (string): The type of bet to tally, either NRFI or YRFI.
+        a_maxTop (int): The largest rank to tally.
+        a_startDate (date): The first day to tally.
+        a_endDate (date): The last day to tally.
+        a_stadium (string): The stadium to tally the bets of. Bets from every stadium are tallied if not provided.
+
+    Returns:
+        A SQLAlchemy select statement returning a row for each rank and number of bets in a day, with the
+        total<type>Games and total<type>Win columns.
+    """
+    rankedBets = CreateRankedNRFIBets(ArchiveNRFITable, ArchiveNRFITable.Date.between(a_startDate, a_endDate))
+    rankColumn = rankedBets.c.nrfiRank if a_betType == 'NRFI' else rankedBets.c.yrfiRank
+
+    query = (select(rankColumn.label('rank'), rankedBets.c.dayBets,
+                    CountWhere(rankedBets.c.betResult.is_distinct_from('Postponed')).label(f'total{a_betType}Games'),
+                    CountWhere(rankedBets.c.betResult == a_betType).label(f'total{a_betType}Win'))
+             .where(rankColumn <= a_maxTop, rankedBets.c.dayBets >= MINIMUM_NRFIYRFI_BETS)
+             .group_by(rankColumn, rankedBets.c.dayBets))
+
+    if a_stadium is not None:
+        query = query.where(rankedBets.c.stadium == a_stadium)
+
+    return query
+
+#Helper function for the accuracy curve route, used to tally the hitting bet results at each rank.
+def CreateHittingCurveQuery(a_maxTop, a_startDate, a_endDate, a_stadium = None):
+    """Helper function used to create the query that tallies the results of the hitting bets at each rank.
+
+    Args:
+        a_maxTop (int): The largest rank to tally.
+        a_startDate (date): The first day to tally.
+        a_endDate (date): The last day to tally.
+        a_stadium (string): The stadium to tally the bets of. Bets from every stadium are tallied if not provided.
+
+    Returns:
+        A SQLAlchemy select statement returning a row for each rank and number of bets in a day, with the
+        totalHitters, totalAtLeast1HitWin, totalAtLeast2HitsWin, totalAtLeast2HRRWin and totalAtLeast3HRRWin columns.
+    """
+    rankedBets = CreateRankedHittingBets(ArchiveHittingTable, ArchiveHittingTable.Date.between(a_startDate, a_endDate))
+    isPlayed = and_(rankedBets.c.resultStatline.is_distinct_from('Postponed'), rankedBets.c.resultStatline.is_distinct_from('Did Not Play'))
+
+    query = (select(rankedBets.c.hittingRank.label('rank'), rankedBets.c.dayBets,
+                    CountWhere(isPlayed).label('totalHitters'),
+                    CountWhere(rankedBets.c.atLeast1Hit == '1').label('totalAtLeast1HitWin'),
+                    CountWhere(rankedBets.c.atLeast2Hits == '1').label('totalAtLeast2HitsWin'),
+                    CountWhere(rankedBets.c.atLeast2HRR == '1').label('totalAtLeast2HRRWin'),
+                    CountWhere(rankedBets.c.atLeast3HRR == '1').label('totalAtLeast3HRRWin'))
+             .where(rankedBets.c.hittingRank <= a_maxTop, rankedBets.c.dayBets >= MINIMUM_HITTING_BETS)
+             .group_by(rankedBets.c.hittingRank, rankedBets.c.dayBets))
+
+    if a_stadium is not None:
+        query = query.where(rankedBets.c.stadium == a_stadium)
+
+    return query
+
+#Helper functions for the accuracy summary and curve, used to rank the bets of each day.
+def CreateRankedNRFIBets(a_nrfiTable, *a_conditions):
+    """Ranks the NRFI and YRFI bets of each day in a NRFI table.
+
+    The NRFI bets are ranked from the lowest score (the best NRFI bets), with the order the bets were inserted in
+    breaking ties and bets with a missing score ranked last. The YRFI bets are ranked in the exact reverse order, so
+    bets with a missing score are the best YRFI bets, as they are at the bottom of the sorted NRFI table.
+
+    Args:
+        a_nrfiTable (type): The class definition of the NRFI table to rank.
+        a_conditions (list): Conditions limiting which bets are ranked (ex: a range of dates).
+
+    Returns:
+        A SQLAlchemy subquery with the date, stadium, betResult, nrfiRank, yrfiRank and dayBets columns.
+
+    Assistance Received:
+        https://www.sqlite.org/windowfunctions.html
+    """
+    dayPartition = a_nrfiTable.Date
+    scoreColumn = a_nrfiTable.Overall_NRFI_Score
+    return (select(a_nrfiTable.Date.label('date'),
+                   a_nrfiTable.Stadium.label('stadium'),
+                   a_nrfiTable.Bet_Result.label('betResult'),
+                   func.row_number().over(partition_by=dayPartition, order_by=[scoreColumn.asc().nulls_last(), a_nrfiTable.id]).label('nrfiRank'),
+                   func.row_number().over(partition_by=dayPartition, order_by=[scoreColumn.desc().nulls_first(), a_nrfiTable.id.desc()]).label('yrfiRank'),
+                   func.count().over(partition_by=dayPartition).label('dayBets'))
+            .where(*a_conditions)
+            .subquery())
+
+def CreateRankedHittingBets(a_hittingTable, *a_conditions):
+    """Ranks the hitting bets of each day in a hitting table from the highest score, with the order the bets were
+    inserted in breaking ties.
+
+    Args:
+        a_hittingTable (type): The class definition of the hitting table to rank.
+        a_conditions (list): Conditions limiting which bets are ranked (ex: a range of dates).
+
+    Returns:
+        A SQLAlchemy subquery with the date, stadium, resultStatline, atLeast1Hit, atLeast2Hits, atLeast2HRR,
+        atLeast3HRR, hittingRank and dayBets columns.
+    """
+    dayPartition = a_hittingTable.Date
+    scoreColumn = a_hittingTable.Overall_Hitting_Score
+    return (select(a_hittingTable.Date.label('date'),
+                   a_hittingTable.Stadium.label('stadium'),
+                   a_hittingTable.Result_Statline.label('resultStatline'),
+                   a_hittingTable.At_Least_1_Hit_Success.label('atLeast1Hit'),
+                   a_hittingTable.At_Least_2_Hit_Success.label('atLeast2Hits'),
+                   a_hittingTable.At_Least_2_HRR_Success.label('atLeast2HRR'),
+                   a_hittingTable.At_Least_3_HRR_Success.label('atLeast3HRR'),
+                   func.row_number().over(partition_by=dayPartition, order_by=[scoreColumn.desc().nulls_last(), a_hittingTable.id]).label('hittingRank'),
+                   func.count().over(partition_by=dayPartition).label('dayBets'))
+            .where(*a_conditions)
+            .subquery())
+
+#Helper function for the accuracy route, used to tally the NRFI and YRFI bet results in the database.
+def CreateNRFIAccuracyQuery(a_topNRFIYRFI):
+    """Helper function used to create the query that tallies the results of the top NRFI and YRFI bets of each day.
+
+    The top "a_topNRFIYRFI" NRFI and YRFI bets of each day from opening day until the current day are tallied from
+    the NRFI accuracy summary table, skipping days without enough bets (more than twice the number of top bets being
+    checked, and at least MINIMUM_NRFIYRFI_BETS). Postponed games are not counted as games.
+
+    Args:
+        a_topNRFIYRFI (int): The number of top NRFI and YRFI bets of each day to consider.
+
+    Returns:
+        A SQLAlchemy select statement returning a single row with the totalNRFIGames, totalNRFIWin, totalYRFIGames and
+        totalYRFIWin columns.
+    """
+    summary = NRFIAccuracySummaryTable
+    isNRFIBet = summary.Bet_Type == 'NRFI'
+    isYRFIBet = summary.Bet_Type == 'YRFI'
+
+    return (select(CountWhere(and_(isNRFIBet, summary.Played == 1)).label('totalNRFIGames'),
+                   CountWhere(and_(isNRFIBet, summary.Win == 1)).label('totalNRFIWin'),
+                   CountWhere(and_(isYRFIBet, summary.Played == 1)).label('totalYRFIGames'),
+                   CountWhere(and_(isYRFIBet, summary.Win == 1)).label('totalYRFIWin'))
+            .where(summary.Rank <= a_topNRFIYRFI, summary.Day_Bets > 2 * a_topNRFIYRFI, summary.Day_Bets >= MINIMUM_NRFIYRFI_BETS,
+                   summary.Date.between(CURRENT_OPENING_DAY.date(), datetime.today().date())))
+
+#Helper function for the accuracy route, used to tally the hitting bet results in the database.
+def CreateHittingAccuracyQuery(a_topHitters):
+    """Helper function used to create the query that tallies the results of the top hitting bets of each day.
+
+    The top "a_topHitters" bets of each day from opening day until the current day are tallied from the hitting
+    accuracy summary table, skipping days without enough bets (more than the number of top bets being checked, and at
+    least MINIMUM_HITTING_BETS). Hitters whose game was postponed or who did not play are not counted as hitters.
+
+    Args:
+        a_topHitters (int): The number of top hitting bets of each day to consider.
+
+    Returns:
+        A SQLAlchemy select statement returning a single row with the totalHitters, totalAtLeast1HitWin,
+        totalAtLeast2HitsWin, totalAtLeast2HRRWin and totalAtLeast3HRRWin columns.
+    """
+    summary = HittingAccuracySummaryTable
+
+    return (select(CountWhere(summary.Played == 1).label('totalHitters'),
+                   CountWhere(summary.At_Least_1_Hit_Win == 1).label('totalAtLeast1HitWin'),
+                   CountWhere(summary.At_Least_2_Hit_Win == 1).label('totalAtLeast2HitsWin'),
+                   CountWhere(summary.At_Least_2_HRR_Win == 1).label('totalAtLeast2HRRWin'),
+                   CountWhere(summary.At_Least_3_HRR_Win == 1).label('totalAtLeast3HRRWin'))
+            .where(summary.Rank <= a_topHitters, summary.Day_Bets > a_topHitters, summary.Day_Bets >= MINIMUM_HITTING_BETS,
+                   summary.Date.between(CURRENT_OPENING_DAY.date(), datetime.today().date())))
+
+#Helper function for the bet review, used to record the outcome of each ranked bet in the accuracy summary tables.
+def UpdateAccuracySummary(a_session, a_nrfiTable, a_hittingTable):
+    """Records the outcomes of the bets in a NRFI table and hitting table in the accuracy summary tables.
+
+    The bets of each day are ranked by the database (see CreateRankedNRFIBets() and CreateRankedHittingBets()). The rank,
+    number of bets that day, whether the bet was played, and whether it won are then inserted into the summary tables.
+    Any summary rows already stored for the same days are replaced, so reviewing a day again does not count it twice.
+    The changes are part of the session's transaction, and are saved when the session is committed.
+
+    Args:
+        a_session (sqlalchemy.orm.Session): The session to make the changes in.
+        a_nrfiTable (type): The class definition of the NRFI table to summarize.
+        a_hittingTable (type): The class definition of the hitting table to summarize.
+
+    Returns:
+        Nothing.
+    """
+    #Rank the NRFI and YRFI bets of each day.
+    rankedBets = CreateRankedNRFIBets(a_nrfiTable)
+
+    summary = NRFIAccuracySummaryTable
+    a_session.execute(delete(summary).where(summary.Date.in_(select(a_nrfiTable.Date))))
+
+    isPlayed = case((rankedBets.c.betResult.is_distinct_from('Postponed'), 1), else_=0)
+    for betType, rankColumn in [('NRFI', rankedBets.c.nrfiRank), ('YRFI', rankedBets.c.yrfiRank)]:
+        a_session.execute(insert(summary).from_select(['Date', 'Bet Type', 'Rank', 'Day Bets', 'Played', 'Win'],
+                                                      select(rankedBets.c.date, literal(betType), rankColumn, rankedBets.c.dayBets, isPlayed,
+                                                             case((rankedBets.c.betResult == betType, 1), else_=0))))
+
+    #Rank the hitting bets of each day.
+    rankedBets = CreateRankedHittingBets(a_hittingTable)
+
+    summary = HittingAccuracySummaryTable
+    a_session.execute(delete(summary).where(summary.Date.in_(select(a_hittingTable.Date))))
+
+    isPlayed = and_(rankedBets.c.resultStatline.is_distinct_from('Postponed'), rankedBets.c.resultStatline.is_distinct_from('Did Not Play'))
+    a_session.execute(insert(summary).from_select(['Date', 'Rank', 'Day Bets', 'Played', 'At Least 1 Hit Win', 'At Least 2 Hit Win',
+                                                   'At Least 2 HRR Win', 'At Least 3 HRR Win'],
+                                                  select(rankedBets.c.date, rankedBets.c.hittingRank, rankedBets.c.dayBets,
+                                                         case((isPlayed, 1), else_=0),
+                                                         case((rankedBets.c.atLeast1Hit == '1', 1), else_=0),
+                                                         case((rankedBets.c.atLeast2Hits == '1', 1), else_=0),
+                                                         case((rankedBets.c.atLeast2HRR == '1', 1), else_=0),
+                                                         case((rankedBets.c.atLeast3HRR == '1', 1), else_=0))))
+
+#Helper function for the accuracy queries, used to count the rows matching a condition.
+def CountWhere(a_condition):
+    """Creates an aggregate that counts the rows matching a condition.
+
+    Args:
+        a_condition (sqlalchemy.ColumnElement): The condition the rows must match.
+
+    Returns:
+        A SQLAlchemy expression counting the matching rows (0 if there are none).
+    """
+    return func.count(case((a_condition, 1)))
 
 #Helper function for the update route. Creates all the bet prediction DataFrames and then stores them in the database.
 def UpdateBetPredictions(a_openingDayDate, a_date, a_season):
@@ -511,7 +845,8 @@ def UpdateBetPredictions(a_openingDayDate, a_date, a_season):
         a_season (int): The season the schedule and bet predictions will be generated for.
 
     Returns:
-        Nothing.
+        A list of dictionaries, each containing the game ID of a game that could not be added to the schedule and the
+        error that occurred (see GetFailedScheduleGames() in the BetPredictor class).
     """
     #First, review the bet outcomes for accuracy purposes.
     print('Reviewing the previous bet predictions.')
@@ -520,11 +855,19 @@ def UpdateBetPredictions(a_openingDayDate, a_date, a_season):
     #Create all three bet prediction tables.
     bp = BetPredictor()
     print('Creating Schedule table.')
-    scheduleDataFrame = bp.CreateSchedule(a_date, a_season)
-    print('Creating NRFI table.')
-    NRFIDataFrame = bp.CreateNRFIPredictions(scheduleDataFrame, a_openingDayDate, a_season)
-    print('Creating Hitting table.')
-    hittingDataFrame = bp.CreateHittingPredictions(scheduleDataFrame, a_openingDayDate, a_date, a_season)
+    scheduleDataFrame = bp.CreateSchedule(a_date, a_season, True)
+
+    #Fetch everything the bet predictions need up front. The cached data is discarded once the tables are created.
+    try:
+        print('Prefetching bet prediction data.')
+        fetchReport = bp.PrefetchSlate(scheduleDataFrame, a_openingDayDate, a_date, a_season)
+        print('Prefetched', fetchReport['unique'], 'unique requests,', fetchReport['saved'], 'duplicate requests saved.')
+        print('Creating NRFI table.')
+        NRFIDataFrame = bp.CreateNRFIPredictions(scheduleDataFrame, a_openingDayDate, a_season)
+        print('Creating Hitting table.')
+        hittingDataFrame = bp.CreateHittingPredictions(scheduleDataFrame, a_openingDayDate, a_date, a_season, bp.DEFAULT_HITTING_PROCESSES)
+    finally:
+        Endpoints.ClearSharedCache()
     print('All done creating tables, updating them into the database.')
          
     #Update the database with the newly created bet predictions.
@@ -532,13 +875,15 @@ def UpdateBetPredictions(a_openingDayDate, a_date, a_season):
     UpdateTableInDatabase(NRFIDataFrame, TodayNRFITable, ArchiveNRFITable)    
     UpdateTableInDatabase(hittingDataFrame, TodayHittingTable, ArchiveHittingTable)    
 
+    return bp.GetFailedScheduleGames()
+
 def UpdateTableInDatabase(a_dataFrame, a_todayTable, a_archiveTable):
     """Triggers a database update for a table.
 
     This function is used to update one of the three main Today tables, based on information from a provided
     DataFrame. First, all the data inside the Today table is copied over into its respective archive table (see
-    MoveDataToArchive()). Then, the Today table is completely cleared (see DeleteData()). Every row of the provided
-    DataFrame is then looped through and inserted into the database inside the "a_todayTable" table.
+    MoveDataToArchive()). Then, the Today table is completely cleared (see DeleteData()). The provided DataFrame is
+    then matched to the "a_todayTable" table's columns and all of its rows are inserted with a single statement.
 
     Args:
         a_dataFrame (pandas.DataFrame): A pandas DataFrame containing information to insert into a database table.
@@ -554,33 +899,21 @@ def UpdateTableInDatabase(a_dataFrame, a_todayTable, a_archiveTable):
     #Next, clear the data in the today table.
     DeleteData(a_todayTable)
     
-    #Then, insert the newly created data into the today table.
-    session = Session()
-    
-    #Loop through each row of the provided DataFrame.
-    for index, row in a_dataFrame.iterrows():
-        data_dict = {}
-        #Loop through each column of each row, and create a dictionary representing its data.
-        for column in a_todayTable.__table__.columns:
-            columnName = column.name
-
-            #Skip the id column, since it is automatically handled by SQLAlchemy.
-            if columnName == 'id':
-                continue
+    #Then, insert the newly created data into the today table. Each DataFrame column is matched to its table column once. Some
+    #columns are purposefully left empty (the bet review columns), so any table column missing from the DataFrame is filled with None.
+    columnNames = [column.name for column in a_todayTable.__table__.columns if column.name != 'id']
+    insertDataFrame = a_dataFrame.reindex(columns=columnNames)
 
-            #Attempt to fill the data of the row into a dictionary. Some columns are purposefully left empty (the bet review columns) so fill
-            #empty columns with None. 
-            try:
-                data_dict[ConvertColumnName(columnName)] = row[columnName]
-            except:
-                data_dict[ConvertColumnName(columnName)] = None
-    
-        #Unpack the dictionary because it sends each key/value pair as an argument to the constructor.
-        data = a_todayTable(**data_dict)
-        session.add(data)
-    
-    session.commit()
-    session.close()
+    #Dates are created in the format MM/DD/YYYY, but are stored as dates.
+    insertDataFrame['Date'] = pd.to_datetime(insertDataFrame['Date'], format='%m/%d/%Y').dt.date
+
+    #Convert the values into plain Python values, with missing values as None, and insert every row in a single statement.
+    insertRows = insertDataFrame.astype(object).where(insertDataFrame.notna(), None).to_dict('records')
+    if insertRows:
+        with Session.begin() as session:
+            session.execute(insert(a_todayTable.__table__), insertRows)
+
+    MarkTablesModified([a_todayTable.__tablename__])
 
 #Helper function for the view route, used to get the class definition for a table.
 def GetTableClassDefinition(a_tableName):
@@ -608,42 +941,387 @@ def GetTableClassDefinition(a_tableName):
     else:
         return None    
 
-#Helper function for the view route, used to convert column names into their variable names in the model classes 
-#since class variables cannot contain spaces and other special characters).
-def ConvertColumnName(a_columnName):
-    """Helper function used to convert column names when going from database column names to table class names.
+#Helper function for the view routes, used to precompute which columns are returned for each table.
+def BuildViewColumnSpecs():
+    """Helper function used to precompute the columns returned by the view routes for every table.
+
+    Every column of each table except for id is returned by the view routes. The columns and their names are worked
+    out once when the server starts, so that the view routes can select them directly and build each row's
+    dictionary by zipping the names with the row's values (see SerializeRows()). Dates are stored as ISO dates, so
+    the Date column is converted back to the format MM/DD/YYYY in the query.
 
-    This helper function is used to convert a column name that's used in the actual database, to the corresponding
-    column name used in the table subclasses (TodaySchedule, ArchiveSchedule, etc.). Spaces are replaced by
-    underscores, and any periods or slashes are removed since these characters cannot be in variable names. An
-    example is conversion of Game ID to Game_ID. This function is used when dealing with column names
-    programmatically.
+    Returns:
+        A dictionary mapping each table name to a tuple, with the first element being the list of columns (or column
+        expressions) to select and the second being the list of their names in the database.
+    """
+    columnSpecs = {}
+    for tableName in TABLE_NAMES:
+        tableColumns = []
+        columnNames = []
+        for column in GetTableClassDefinition(tableName).__table__.columns:
+            if column.name == 'id':
+                continue
+
+            if column.name == 'Date':
+                tableColumns.append(func.strftime('%m/%d/%Y', column).label(column.name))
+            else:
+                tableColumns.append(column)
+            columnNames.append(column.name)
+
+        columnSpecs[tableName] = (tableColumns, columnNames)
+
+    return columnSpecs
+
+#Helper function for the view routes, used to convert rows returned from the database into dictionaries.
+def SerializeRows(a_columnNames, a_rows):
+    """Helper function used to convert rows returned from a database query into dictionaries.
 
     Args:
-        a_columnName (string): The name of the column used in the actual database to be converted.
+        a_columnNames (list): The names of the columns in the order they were selected.
+        a_rows (list): The rows returned from the database, each being a tuple of column values.
 
     Returns:
-        A string, representing the converted column name.
+        A list of dictionaries, each mapping the column names to the values of a single row.
     """
-    #Convert spaces to underscores.
-    modifiedColumnName = a_columnName.replace(' ', '_')
-    
-    #Remove special characters as necessary (/ and .)
-    modifiedColumnName = modifiedColumnName.replace('.', '')
-    modifiedColumnName = modifiedColumnName.replace('/', '')
-    
-    return modifiedColumnName
+    return [dict(zip(a_columnNames, row)) for row in a_rows]
+
+#Helper function for the view routes, used to create a response that supports conditional requests.
+async def CreateViewResponse(a_tableName, a_date = None, a_viewOptions = None):
+    """Helper function used to create the response for a view route.
+
+    Every response carries an ETag made from the table's data version (see MarkTablesModified()) and a Last-Modified
+    date. If the request's If-None-Match (or If-Modified-Since) header shows that the client already has the latest
+    version of the table, a 304 response with no data is returned without querying the database. Responses for
+    settled archive dates (see IsArchiveDateSettled()) can be kept by the client without checking again, while every
+    other response must be checked with the server before it is reused. If there are more rows after the returned
+    page, the cursor for the next page is returned in the X-Next-Cursor header.
+
+    Args:
+        a_tableName (string): The name of the table in the database to return the information from.
+        a_date (date): The date of the rows to return. All rows are returned if not provided.
+        a_viewOptions (dict): The pagination, column and ordering options of the request (see ParseViewOptions()).
+
+    Returns:
+        A Quart Response object containing the JSON data of the requested rows, or a 304 response.
+
+    Assistance Received:
+        https://developer.mozilla.org/en-US/docs/Web/HTTP/Conditional_requests
+    """
+    #Read the version before the data, so that the ETag is never newer than the data it is sent with.
+    with responseCacheLock:
+        tableVersion = tableVersions[a_tableName]
+        lastModified = tableModifiedTimes[a_tableName]
+    etag = f'{SERVER_BOOT_ID}-{tableVersion}'
+
+    #If-Modified-Since is only used when the client did not send an ETag.
+    if request.if_none_match:
+        isNotModified = request.if_none_match.contains(etag)
+    else:
+        isNotModified = request.if_modified_since is not None and lastModified <= request.if_modified_since
+
+    if isNotModified:
+        response = app.response_class('', status=304)
+    else:
+        responseBody, nextCursor = await GetViewResponseBody(a_tableName, a_date, a_viewOptions)
+        response = app.response_class(responseBody, mimetype='application/json')
+        if nextCursor is not None:
+            response.headers['X-Next-Cursor'] = nextCursor
+
+    response.set_etag(etag)
+    response.last_modified = lastModified
+
+    #Archive dates that have settled will never change, so the client does not need to check them again.
+    if await IsArchiveDateSettled(a_tableName, a_date):
+        response.cache_control.public = True
+        response.cache_control.max_age = SETTLED_ARCHIVE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+
+    return response
+
+#Helper function for the view routes, used to find out if an archive date's rows can no longer change.
+async def IsArchiveDateSettled(a_tableName, a_date):
+    """Helper function used to determine if the rows of an archive table on a date can no longer change.
+
+    A date has settled if it is at least ARCHIVE_SETTLED_DAYS old, the archive table has rows on that date, and the
+    date is on or before the latest date in the archive table. Bets are reviewed before they are moved into the
+    archive (see UpdateBetPredictions()), so the latest archived date is also the latest reviewed date. Dates without
+    rows are never settled, since they may be a date that has not been archived yet.
+
+    Args:
+        a_tableName (string): The name of the table in the database the rows are from.
+        a_date (date): The date of the rows. Responses for every date of a table are never settled.
+
+    Returns:
+        A boolean, true if the rows on the date can no longer change, false otherwise.
+    """
+    if not a_tableName.startswith('Archive') or a_date is None or a_date > datetime.today().date() - timedelta(days=ARCHIVE_SETTLED_DAYS):
+        return False
+
+    table = GetTableClassDefinition(a_tableName).__table__
+    query = select(select(table.c['id']).where(table.c['Date'] == a_date).exists(), select(func.max(table.c['Date'])).scalar_subquery())
+
+    async with asyncEngine.connect() as connection:
+        hasRows, latestArchivedDate = (await connection.execute(query)).one()
+
+    return bool(hasRows) and latestArchivedDate is not None and a_date <= latestArchivedDate
+
+#Helper function for the view routes, used to get a table's JSON data from the cache or the database.
+async def GetViewResponseBody(a_tableName, a_date = None, a_viewOptions = None):
+    """Helper function used to get the JSON response body for a view route.
+
+    If the table is one of the cached tables (see CACHED_VIEW_TABLES) and the response has already been built since
+    the table was last written to, the stored response body is returned. Otherwise, the table's precomputed columns
+    are selected from the database through an asynchronous connection (so other requests are still handled while the
+    query runs), and each row is converted into a dictionary (see SerializeRows()). The response body is only stored
+    if the table was not written to while the query was running. Requests with pagination, column or ordering
+    options are never cached, and the options are applied in the query itself so only the requested rows and columns
+    are read. Pages are found by the sort key of the previous page's last row (keyset pagination), so later pages
+    are as fast as the first.
+
+    Args:
+        a_tableName (string): The name of the table in the database to return the information from.
+        a_date (date): The date of the rows to return. All rows are returned if not provided.
+        a_viewOptions (dict): The pagination, column and ordering options of the request (see ParseViewOptions()).
+
+    Returns:
+        A tuple, with the first element being a bytes object representing the JSON data of the requested rows, and
+        the second being the cursor of the next page (None if there are no more rows).
+
+    Assistance Received:
+        https://docs.sqlalchemy.org/en/20/tutorial/data_select.html
+    """
+    cacheKey = (a_tableName, a_date)
+    isCachedTable = a_tableName in CACHED_VIEW_TABLES and a_viewOptions is None
+
+    with responseCacheLock:
+        if isCachedTable and cacheKey in viewResponseCache:
+            return viewResponseCache[cacheKey], None
+        tableVersion = tableVersions[a_tableName]
+
+    #Build the query for the data. Rows are returned as plain tuples, not model objects.
+    tableColumns, columnNames = VIEW_COLUMN_SPECS[a_tableName]
+    table = GetTableClassDefinition(a_tableName).__table__
+    if a_viewOptions is not None and a_viewOptions['columns']:
+        columnsByName = dict(zip(columnNames, tableColumns))
+        columnNames = a_viewOptions['columns']
+        tableColumns = [columnsByName[columnName] for columnName in columnNames]
+
+    query = select(*tableColumns)
+    if a_date is not None:
+        query = query.where(table.c['Date'] == a_date)
+
+    sortColumns = []
+    if a_viewOptions is not None:
+        query, sortColumns = ApplyViewOptions(query, table, a_tableName, a_viewOptions)
+    else:
+        #Return the rows in the order they were inserted. Without an order, SQLite returns them in the order of the index it searches.
+        query = query.order_by(table.c['id'])
+
+    async with asyncEngine.connect() as connection:
+        data = (await connection.execute(query)).all()
+
+    #One extra row is requested to find out if there is another page. The cursor is the sort key of the page's last row.
+    nextCursor = None
+    limit = a_viewOptions['limit'] if a_viewOptions is not None else None
+    if limit is not None and len(data) > limit:
+        data = data[:limit]
+        nextCursor = EncodeCursor(list(data[-1][-len(sortColumns):]))
+
+    #Note: The sort key columns are selected after the requested columns, so zipping with the column names leaves them out.
+    responseBody = await jsonify(SerializeRows(columnNames, data)).get_data()
+
+    #Only store the response if it was not made out of date by a write during the query.
+    if isCachedTable:
+        with responseCacheLock:
+            if tableVersions[a_tableName] == tableVersion:
+                viewResponseCache[cacheKey] = responseBody
+
+    return responseBody, nextCursor
+
+#Helper function for the view routes, used to read the pagination, column and ordering options of a request.
+def ParseViewOptions(a_tableName):
+    """Helper function used to read and validate the optional query parameters of a view request.
+
+    The following query parameters are supported:
+        limit: The largest number of rows to return (at most MAXIMUM_VIEW_PAGE_SIZE).
+        cursor: The value of the X-Next-Cursor header from the previous page, used to get the next page.
+        columns: A comma separated list of the names of the columns to return. All columns are returned if not given.
+        order_by: Either id (the order the rows were inserted in, used by default) or score (the best bets first).
+                  The score order is only available for the NRFI and hitting tables (see SCORE_COLUMN_NAMES).
+
+    Args:
+        a_tableName (string): The name of the table being requested.
+
+    Returns:
+        A tuple, with the first element being a dictionary of the options (None if no options were given), and the
+        second being an error message (None if all of the options are valid).
+    """
+    if not any(parameter in request.args for parameter in ['limit', 'cursor', 'columns', 'order_by']):
+        return None, None
+
+    viewOptions = { 'limit': None, 'cursor': None, 'columns': [], 'orderBy': request.args.get('order_by', 'id') }
+
+    #Make sure the limit is a whole number in the allowed range.
+    if 'limit' in request.args:
+        try:
+            viewOptions['limit'] = int(request.args['limit'])
+        except:
+            return None, 'Invalid limit! The limit must be an integer.'
+
+        if viewOptions['limit'] < 1 or viewOptions['limit'] > MAXIMUM_VIEW_PAGE_SIZE:
+            return None, f'Invalid limit! The limit must be between 1 and {MAXIMUM_VIEW_PAGE_SIZE}.'
+
+    #Make sure every requested column exists in the table. Duplicate columns are only returned once.
+    if 'columns' in request.args:
+        validColumnNames = VIEW_COLUMN_SPECS[a_tableName][1]
+        for columnName in request.args['columns'].split(','):
+            columnName = columnName.strip()
+            if columnName not in validColumnNames:
+                return None, f'Invalid column name: {columnName}'
+
+            if columnName not in viewOptions['columns']:
+                viewOptions['columns'].append(columnName)
+
+    #Make sure the order is valid for the table.
+    if viewOptions['orderBy'] not in ['id', 'score']:
+        return None, 'Invalid order_by! The order_by parameter must be id or score.'
+
+    if viewOptions['orderBy'] == 'score' and a_tableName not in SCORE_COLUMN_NAMES:
+        return None, f'The {a_tableName} table cannot be ordered by score.'
+
+    #Make sure the cursor came from a page with the same order. Score cursors hold [score, id], and id cursors hold [id].
+    if 'cursor' in request.args:
+        viewOptions['cursor'] = DecodeCursor(request.args['cursor'])
+        expectedLength = 2 if viewOptions['orderBy'] == 'score' else 1
+        if viewOptions['cursor'] is None or len(viewOptions['cursor']) != expectedLength:
+            return None, 'Invalid cursor! Use the X-Next-Cursor header of the previous page with the same order_by.'
+
+    return viewOptions, None
+
+#Helper function for the view routes, used to apply the pagination and ordering options to a query.
+def ApplyViewOptions(a_query, a_table, a_tableName, a_viewOptions):
+    """Helper function used to add the ordering, cursor and limit of a view request to its query.
+
+    The rows are ordered by id, or by score (best bet first, with rows missing a score last) with id breaking ties. The
+    columns being sorted on are selected after the requested columns so that the cursor of the next page can be
+    created from the last row. If a cursor is given, only the rows that come after it in the order are returned.
+
+    Args:
+        a_query (sqlalchemy.Select): The query selecting the requested columns.
+        a_table (sqlalchemy.Table): The table being requested.
+        a_tableName (string): The name of the table being requested.
+        a_viewOptions (dict): The pagination, column and ordering options of the request (see ParseViewOptions()).
+
+    Returns:
+        A tuple, with the first element being the updated query, and the second being the list of columns being
+        sorted on.
+
+    Assistance Received:
+        https://use-the-index-luke.com/no-offset
+    """
+    idColumn = a_table.c['id']
+    cursor = a_viewOptions['cursor']
+
+    if a_viewOptions['orderBy'] == 'score':
+        scoreColumn = a_table.c[SCORE_COLUMN_NAMES[a_tableName]]
+        isAscending = a_tableName in ASCENDING_SCORE_TABLES
+        sortColumns = [scoreColumn, idColumn]
+        scoreOrder = scoreColumn.asc() if isAscending else scoreColumn.desc()
+        query = a_query.add_columns(*sortColumns).order_by(scoreOrder.nulls_last(), idColumn)
+
+        #Rows after the cursor have a worse score, the same score and a higher id, or no score at all.
+        if cursor is not None:
+            cursorScore, cursorID = cursor
+            if cursorScore is None:
+                query = query.where(scoreColumn.is_(None), idColumn > cursorID)
+            else:
+                worseScore = scoreColumn > cursorScore if isAscending else scoreColumn < cursorScore
+                query = query.where(or_(worseScore, and_(scoreColumn == cursorScore, idColumn > cursorID), scoreColumn.is_(None)))
+    else:
+        sortColumns = [idColumn]
+        query = a_query.add_columns(idColumn).order_by(idColumn)
+        if cursor is not None:
+            query = query.where(idColumn > cursor[0])
+
+    #Request one extra row to find out if there is another page.
+    if a_viewOptions['limit'] is not None:
+        query = query.limit(a_viewOptions['limit'] + 1)
+
+    return query, sortColumns
+
+#Helper functions for the view routes, used to convert the sort key of a row to and from a cursor string.
+def EncodeCursor(a_sortKey):
+    """Converts the sort key of a row into a cursor string that can be sent to the client.
+
+    Args:
+        a_sortKey (list): The values of the columns being sorted on for a row.
+
+    Returns:
+        A string, representing the cursor.
+    """
+    return base64.urlsafe_b64encode(json.dumps(a_sortKey).encode()).decode()
+
+def DecodeCursor(a_cursor):
+    """Converts a cursor string sent by the client back into the sort key of a row.
+
+    Args:
+        a_cursor (string): The cursor string.
+
+    Returns:
+        A list, representing the values of the columns being sorted on. The last value (the id) is always an integer,
+        and the others are numbers or None. None is returned if the cursor is not valid.
+    """
+    try:
+        sortKey = json.loads(base64.urlsafe_b64decode(a_cursor.encode()))
+    except:
+        return None
+
+    if not isinstance(sortKey, list) or not sortKey or not isinstance(sortKey[-1], int):
+        return None
+
+    if not all(value is None or isinstance(value, (int, float)) for value in sortKey[:-1]):
+        return None
+
+    return sortKey
+
+#Helper function for the functions that write to the database, used to drop the view responses that are now out of date.
+def MarkTablesModified(a_tableNames):
+    """Records that tables in the database have been written to.
+
+    This function must be called after every commit that changes a table. The data version and last modified time
+    of each table are updated, and any of its stored view responses are removed from the cache. Changes to the
+    accuracy summary tables clear the stored accuracy results.
+
+    Args:
+        a_tableNames (list): The names of the tables that were written to.
+
+    Returns:
+        Nothing.
+    """
+    modifiedTime = datetime.now(timezone.utc).replace(microsecond=0)
+
+    with responseCacheLock:
+        for tableName in a_tableNames:
+            tableVersions[tableName] += 1
+            tableModifiedTimes[tableName] = modifiedTime
+
+            for cacheKey in [key for key in viewResponseCache if key[0] == tableName]:
+                del viewResponseCache[cacheKey]
+
+            if tableName in SUMMARY_TABLE_NAMES:
+                accuracyResponseCache.clear()
 
 #Moves all of the data in one of the database tables, to another. Used for moving data from a Today table to an Archive table.
 def MoveDataToArchive(a_sourceTable, a_destinationTable):
     """Moves data from a source table to a destination table.
 
-    This function is used to copy all the data from a source table into a destination table. A connection is made with
-    the database, and the data from the source table is extracted. Then, each row of the source table is looped
-    through, and each column in each of those rows (besides the id column) is copied into a new row that will be
-    inserted into the destination table. If the column types mismatch between the two tables, an error is displayed
-    and no data is copied over to the destination table. This process continues until all the rows from the source
-    table are successfully copied over to the destination table.
+    This function is used to copy all the data from a source table into a destination table. Every column of the
+    source table (besides the id column) must also be in the destination table. If it isn't, an error is displayed
+    and no data is copied over to the destination table. The rows are copied by the database itself in a single
+    INSERT ... SELECT statement and transaction, in the order they were inserted into the source table, so the data
+    never needs to be loaded into Python.
 
     Args:
         a_sourceTable (string): The name of the source table.
@@ -651,43 +1329,25 @@ def MoveDataToArchive(a_sourceTable, a_destinationTable):
 
     Returns:
         Nothing.
+
+    Assistance Received:
+        https://docs.sqlalchemy.org/en/20/core/dml.html#sqlalchemy.sql.expression.Insert.from_select
     """
-    #Create a session connection to the database.
-    session = Session()
-    
-    #Query the database for the source data.
-    data = session.query(a_sourceTable).all()
-    
-    #Make sure data was returned before trying to move anything.
-    if not data:
+    #Allow SQLAlchemy to automatically handle the id column.
+    columnNames = [column.name for column in a_sourceTable.__table__.columns if column.name != 'id']
+
+    #Make sure the destination table has every column being copied.
+    if any(columnName not in a_destinationTable.__table__.columns for columnName in columnNames):
+        print('Error moving data - column mismatch! Could not move the data from the source table to the destination table.')
         return
-    
-    #Loop through each row of the source table.
-    tableColumns = a_sourceTable.__table__.columns
-    for sourceRow in data:
-        destinationRow = a_destinationTable()
-        
-        #Loop through each column of each row.
-        for sourceColumn in tableColumns:
-            sourceColumnName = sourceColumn.name
-            
-            #Allow SQLAlchemy to automatically handle the id column.
-            if sourceColumnName == 'id':
-                continue
-            
-            #Attempt to copy the data from the source table row to the destination table row. 
-            try:
-                columnValue = getattr(sourceRow, ConvertColumnName(sourceColumnName))
-                setattr(destinationRow, ConvertColumnName(sourceColumnName), columnValue)
-            except Exception as error:
-                print('Error moving data - column mismatch! Could not move the data from the source table to the destination table.')
-                return
-            
-        #Add the newly created destination row to the destination table.
-        session.add(destinationRow)
-        session.commit()
-        
-    session.close()
+
+    #Copy every row of the source table into the destination table.
+    sourceColumns = [a_sourceTable.__table__.c[columnName] for columnName in columnNames]
+    with Session.begin() as session:
+        result = session.execute(insert(a_destinationTable).from_select(columnNames, select(*sourceColumns).order_by(a_sourceTable.id)))
+
+    if result.rowcount:
+        MarkTablesModified([a_destinationTable.__tablename__])
     
 #Deletes the contents of a database table.
 def DeleteData(a_table):
@@ -709,6 +1369,7 @@ def DeleteData(a_table):
     session.query(a_table).delete()
     session.commit()        
     session.close()
+    MarkTablesModified([a_table.__tablename__])
 
 def ReviewBets():
     """Reviews the latest bet predictions and appends their results to them in the database.
@@ -716,12 +1377,14 @@ def ReviewBets():
     This method goes through all the NRFI/YRFI bet predictions as well as the hitting bet predictions, and updates
     their results into the database. First, a connection is made with the database and all the current NRFI/YRFI bet
     predictions are extracted from the TodayNRFI table. Each row in the table is looped through, a Game object is
-    created for each bet prediction game, and the Bet_Result column is filled with either NRFI or YRFI. A similar
+    looked up for each bet prediction game, and the Bet_Result column is filled with either NRFI or YRFI. A similar
     process then occurs for the hitting bet predictions, with a Hitter object being created for each hitter from the
     hitting bet predictions in the TodayHitting table. For the hitting bet predictions, the hitter's statline and
     whether they met the following thresholds is input into the database: Over 0.5 hits, Over 1.5 hits, Over 1.5 Hits
     + Runs + RBIs, and Over 2.5 Hits + Runs + RBIs. If a game is postponed or a hitter does not play in any of the
-    bet predictions, the result columns are filled with Postponed or Did Not Play respectively.
+    bet predictions, the result columns are filled with Postponed or Did Not Play respectively. Game results and
+    hitter statlines are looked up through the outcome cache (see the OutcomeCache class), so results already
+    fetched by the accuracy tests are not fetched again.
 
     Returns:
         Nothing.
@@ -731,19 +1394,20 @@ def ReviewBets():
     """
     #Create a session connection to the database.
     session = Session()    
+    outcomeCache = OutcomeCache()
 
     #Review the NRFI and YRFI bets.
     nrfiyrfiData = session.query(TodayNRFITable).all()
     
     #Loop through each bet in the TodayNRFI table.
     for row in nrfiyrfiData:
-        gameObj = Game(row.Game_ID)
+        gameOutcome = outcomeCache.GetGameOutcome(row.Game_ID)
         
         #If the game hasn't been completed, it means the game was postponed.
-        if not gameObj.IsGameFinal():
+        if not gameOutcome['isFinal']:
             row.Bet_Result = 'Postponed'
         else:
-            if gameObj.DidYRFIOccur():
+            if gameOutcome['yrfi']:
                 row.Bet_Result = 'YRFI'
             else:
                 row.Bet_Result = 'NRFI'
@@ -753,18 +1417,17 @@ def ReviewBets():
     
     #Loop through each bet in the TodayHitting table.
     for row in hittingData:
-        gameObj = Game(row.Game_ID)
+        gameOutcome = outcomeCache.GetGameOutcome(row.Game_ID)
         
         #If the game hasn't been completed, it means the game was postponed.
-        if not gameObj.IsGameFinal():
+        if not gameOutcome['isFinal']:
             row.Result_Statline = 'Postponed'
             row.At_Least_1_Hit_Success = 'Postponed' 
             row.At_Least_2_Hit_Success = 'Postponed' 
             row.At_Least_2_HRR_Success = 'Postponed' 
             row.At_Least_3_HRR_Success = 'Postponed' 
         else:
-            hitterObj = Hitter(row.Hitter_ID)
-            betReview = hitterObj.HittingBetReview(row.Date)
+            betReview = outcomeCache.GetHittingBetReview(row.Hitter_ID, row.Date.strftime('%m/%d/%Y'), row.Game_ID)
             
             #If an empty dictionary is returned from the HittingBetReview() method, the hitter did not play in the game.
             if not betReview:
@@ -780,11 +1443,58 @@ def ReviewBets():
                 row.At_Least_2_HRR_Success = betReview['atLeast2HRR']
                 row.At_Least_3_HRR_Success = betReview['atLeast3HRR']
 
+    #Record the reviewed bets in the accuracy summary tables, in the same transaction as the results.
+    UpdateAccuracySummary(session, TodayNRFITable, TodayHittingTable)
+
     session.commit()
     session.close()   
+    MarkTablesModified([TodayNRFITable.__tablename__, TodayHittingTable.__tablename__] + SUMMARY_TABLE_NAMES)
+
+#Brings a database created by an older version of the server up to date.
+def MigrateDatabase():
+    """Migrates an existing database to the current database layout.
+
+    The layout version of the database is stored in SQLite's user_version. Databases older than version 1 store their
+    dates as strings in the format MM/DD/YYYY, which cannot be compared as dates or searched in order. Every date is
+    rewritten in place as an ISO date (YYYY-MM-DD), and the indexes on the date, score and ID columns are created.
+    New databases already have the indexes from create_all(), so only the version is recorded. Databases older than
+    version 3 have their accuracy summary tables filled in again from the bets already in the archive tables, since
+    version 2 ranked YRFI bets with a missing score last.
 
-#Make sure that the tables are created if they do not already exist.
+    Returns:
+        Nothing.
+
+    Assistance Received:
+        https://www.sqlite.org/pragma.html#pragma_user_version
+    """
+    with Session.begin() as session:
+        databaseVersion = session.execute(text('PRAGMA user_version')).scalar()
+        if databaseVersion >= DATABASE_VERSION:
+            return
+
+        print('Migrating the database from version', databaseVersion, 'to version', DATABASE_VERSION)
+        if databaseVersion < 1:
+            connection = session.connection()
+            for table in Base.metadata.sorted_tables:
+                #Convert MM/DD/YYYY into YYYY-MM-DD. Dates that are already converted do not match the pattern.
+                connection.exec_driver_sql(f'UPDATE "{table.name}" SET "Date" = substr("Date", 7, 4) || \'-\' || substr("Date", 1, 2) || '
+                                           f'\'-\' || substr("Date", 4, 2) WHERE "Date" LIKE \'__/__/____\'')
+
+                for index in table.indexes:
+                    index.create(connection, checkfirst=True)
+
+        if databaseVersion < 3:
+            UpdateAccuracySummary(session, ArchiveNRFITable, ArchiveHittingTable)
+
+        session.execute(text(f'PRAGMA user_version = {DATABASE_VERSION}'))
+
+#Make sure that the tables are created if they do not already exist, and that older databases are up to date.
 Base.metadata.create_all(engine)
+MigrateDatabase()
+
+#Precompute the columns returned by the view routes for each table.
+VIEW_COLUMN_SPECS = BuildViewColumnSpecs()
 
-#Start the server.
-app.run(host='Omitted', port='Omitted')
\ No newline at end of file
+#Start the server. Note: The guard keeps worker processes (which import this file again) from starting their own server.
+if __name__ == '__main__':
+    app.run(host='Omitted', port='Omitted')
\ No newline at end of file
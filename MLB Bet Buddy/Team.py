@@ -303,8 +303,9 @@ class Team():
         
         This method calculates the percentage that the team scores a run in the 1st inning, considering games between 
         a_startDate and a_endDate. First, the game IDs of each valid game played during that date range is extracted 
-        (see ExtractGameIDs()). Then, a Game object is created for each game, and it is checked if a run is scored in 
-        the 1st inning or not. A final percentage is returned.
+        (see ExtractGameIDs()). Then, the first inning of each game is looked up (see GetFirstInningSummary() in the
+        Game class), and it is checked if a run is scored in the 1st inning by the team or not. A final percentage is
+        returned.
         
         Args:
             a_season (int): The season to get the YRFI percentage for.
@@ -333,10 +334,10 @@ class Team():
         yrfiCount = 0
         for game in gameIDs:
             gameID = game['gameID']
-            gameObj = Game(gameID)
+            firstInningSummary = Game.GetFirstInningSummary(gameID)
             
             #If a run was scored in the 1st inning of the game by the team, increment the YRFI count.
-            if gameObj.DidTeamScoreFirstInning(self.m_teamID):
+            if self.m_teamID in firstInningSummary['scoringTeamIDs']:
                 yrfiCount += 1
 
         #The YRFI rate represents the percentage of games a team scores in the 1st inning of their games. Lower YRFI rates are better for NRFI. 
@@ -0,0 +1,237 @@
+#********************************************************************************************************************************
+# Author: Ian Pluchino                                                                                                          *
+# Class: TestingDataCache class                                                                                                 *
+# Description: Keeps a Parquet copy of each Excel testing data spreadsheet so accuracy testing does not have to re-parse Excel.  *
+# Date: 5/2/24                                                                                                                  *
+#********************************************************************************************************************************
+
+import pandas as pd
+import importlib.util
+import hashlib
+import json
+import os
+
+#Parquet support is optional. Without pyarrow, the spreadsheets are read directly from Excel every time.
+PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+class TestingDataCache():
+    #CONSTANTS
+    #Extension of the testing data spreadsheets.
+    SPREADSHEET_EXTENSION = '.xlsx'
+
+    #Name of the file in the cache directory that records which version of each spreadsheet has been converted.
+    MANIFEST_FILE_NAME = 'manifest.json'
+
+    #Size of the chunks a spreadsheet is read in when calculating its hash.
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    #CONSTRUCTOR
+    def __init__(self, a_dataDirectory, a_cacheDirectory):
+        """Constructor for the TestingDataCache class.
+
+        This constructor is used to create a cache for a directory of testing data spreadsheets. Each spreadsheet is
+        converted into a Parquet file in the cache directory the first time it is loaded (see LoadFile()), and the
+        Parquet file is used from then on until the spreadsheet changes.
+
+        Args:
+            a_dataDirectory (string): The path of the directory containing the Excel testing data.
+            a_cacheDirectory (string): The path of the directory to store the Parquet copies and manifest in.
+
+        Returns:
+            Nothing.
+        """
+        self.m_dataDirectory = a_dataDirectory
+        self.m_cacheDirectory = a_cacheDirectory
+        self.m_manifestPath = os.path.join(a_cacheDirectory, self.MANIFEST_FILE_NAME)
+
+        #Spreadsheet file name --> { 'mtime', 'size', 'hash', 'mirror' }. Loaded from disk the first time it is needed.
+        self.m_manifest = None
+
+    #GETTERS
+    def GetFileNames(self):
+        """Gets the names of every testing data spreadsheet in the data directory.
+
+        Returns:
+            A sorted list of strings, representing the file names of the spreadsheets.
+        """
+        return sorted(fileName for fileName in os.listdir(self.m_dataDirectory) if fileName.endswith(self.SPREADSHEET_EXTENSION))
+
+    #UTILITY METHODS
+    def LoadFile(self, a_fileName, a_columns = None):
+        """Loads a single testing data spreadsheet as a pandas DataFrame.
+
+        The Parquet copy of the spreadsheet is used if it is up to date (see IsMirrorCurrent()). Otherwise, the
+        spreadsheet is read from Excel and a new Parquet copy is written for next time. Only the requested columns
+        are read from the Parquet copy.
+
+        Args:
+            a_fileName (string): The file name of the spreadsheet inside the data directory.
+            a_columns (list): The names of the columns to load. All columns are loaded if not provided.
+
+        Returns:
+            A pandas DataFrame containing the contents of the spreadsheet.
+        """
+        if not PARQUET_AVAILABLE:
+            return self.ReadSpreadsheet(a_fileName, a_columns)
+
+        manifest = self.GetManifest()
+        if not self.IsMirrorCurrent(a_fileName):
+            dataFrame = self.ConvertFile(a_fileName)
+            return dataFrame[a_columns] if a_columns else dataFrame
+
+        #Spreadsheets that could not be converted are always read from Excel.
+        mirror = manifest[a_fileName]['mirror']
+        if mirror is None:
+            return self.ReadSpreadsheet(a_fileName, a_columns)
+
+        return pd.read_parquet(os.path.join(self.m_cacheDirectory, mirror), columns=a_columns)
+
+    def LoadAll(self, a_columns = None):
+        """Loads every testing data spreadsheet in the data directory.
+
+        Args:
+            a_columns (list): The names of the columns to load. All columns are loaded if not provided.
+
+        Returns:
+            A list of tuples, with the first element being the file name and the second being the spreadsheet's
+            contents as a pandas DataFrame.
+        """
+        return [(fileName, self.LoadFile(fileName, a_columns)) for fileName in self.GetFileNames()]
+
+    def ConvertAll(self):
+        """Converts every spreadsheet in the data directory whose Parquet copy is missing or out of date.
+
+        Returns:
+            An integer, representing the number of spreadsheets that were converted.
+        """
+        if not PARQUET_AVAILABLE:
+            return 0
+
+        totalConverted = 0
+        for fileName in self.GetFileNames():
+            if not self.IsMirrorCurrent(fileName):
+                self.ConvertFile(fileName)
+                totalConverted += 1
+
+        return totalConverted
+
+    def ConvertFile(self, a_fileName):
+        """Reads a spreadsheet from Excel and writes its Parquet copy to the cache directory.
+
+        If the spreadsheet cannot be written as Parquet (for example, a column mixes numbers and text), it is recorded
+        in the manifest as unconvertible so it is read from Excel without retrying the conversion.
+
+        Args:
+            a_fileName (string): The file name of the spreadsheet inside the data directory.
+
+        Returns:
+            A pandas DataFrame containing the contents of the spreadsheet.
+        """
+        dataFrame = self.ReadSpreadsheet(a_fileName)
+
+        os.makedirs(self.m_cacheDirectory, exist_ok=True)
+        mirror = os.path.splitext(a_fileName)[0] + '.parquet'
+        try:
+            dataFrame.to_parquet(os.path.join(self.m_cacheDirectory, mirror), index=False)
+        except Exception as e:
+            print('Could not create a Parquet copy of', a_fileName, '-', e)
+            mirror = None
+
+        spreadsheetPath = os.path.join(self.m_dataDirectory, a_fileName)
+        fileStats = os.stat(spreadsheetPath)
+        self.GetManifest()[a_fileName] = { 'mtime': fileStats.st_mtime,
+                                           'size': fileStats.st_size,
+                                           'hash': self.HashFile(spreadsheetPath),
+                                           'mirror': mirror }
+        self.SaveManifest()
+
+        return dataFrame
+
+    def IsMirrorCurrent(self, a_fileName):
+        """Determines if the Parquet copy of a spreadsheet matches the spreadsheet.
+
+        The file's modification time and size are checked first, since they are free to read. Only when they have
+        changed is the file hashed, so that a spreadsheet that was saved without any changes does not need to be
+        converted again.
+
+        Args:
+            a_fileName (string): The file name of the spreadsheet inside the data directory.
+
+        Returns:
+            A boolean, true if the Parquet copy can be used, false if the spreadsheet needs to be converted.
+        """
+        manifest = self.GetManifest()
+        if a_fileName not in manifest:
+            return False
+
+        entry = manifest[a_fileName]
+        if entry['mirror'] is not None and not os.path.exists(os.path.join(self.m_cacheDirectory, entry['mirror'])):
+            return False
+
+        spreadsheetPath = os.path.join(self.m_dataDirectory, a_fileName)
+        fileStats = os.stat(spreadsheetPath)
+        if fileStats.st_mtime == entry['mtime'] and fileStats.st_size == entry['size']:
+            return True
+
+        if self.HashFile(spreadsheetPath) != entry['hash']:
+            return False
+
+        #The contents are the same, so only the recorded modification time needs to be updated.
+        entry['mtime'] = fileStats.st_mtime
+        entry['size'] = fileStats.st_size
+        self.SaveManifest()
+        return True
+
+    def ReadSpreadsheet(self, a_fileName, a_columns = None):
+        """Reads a spreadsheet directly from Excel.
+
+        Args:
+            a_fileName (string): The file name of the spreadsheet inside the data directory.
+            a_columns (list): The names of the columns to load. All columns are loaded if not provided.
+
+        Returns:
+            A pandas DataFrame containing the contents of the spreadsheet.
+        """
+        return pd.read_excel(os.path.join(self.m_dataDirectory, a_fileName), usecols=a_columns)
+
+    def GetManifest(self):
+        """Gets the manifest of converted spreadsheets, loading it from the cache directory if necessary.
+
+        Returns:
+            A dictionary mapping each converted spreadsheet's file name to its recorded modification time, size,
+            hash and Parquet file name.
+        """
+        if self.m_manifest is None:
+            if os.path.exists(self.m_manifestPath):
+                with open(self.m_manifestPath, 'r') as manifestFile:
+                    self.m_manifest = json.load(manifestFile)
+            else:
+                self.m_manifest = {}
+
+        return self.m_manifest
+
+    def SaveManifest(self):
+        """Writes the manifest of converted spreadsheets to the cache directory.
+
+        Returns:
+            Nothing.
+        """
+        os.makedirs(self.m_cacheDirectory, exist_ok=True)
+        with open(self.m_manifestPath, 'w') as manifestFile:
+            json.dump(self.GetManifest(), manifestFile, indent=4)
+
+    def HashFile(self, a_filePath):
+        """Calculates the SHA-256 hash of a file's contents.
+
+        Args:
+            a_filePath (string): The path of the file to hash.
+
+        Returns:
+            A string, representing the hexadecimal hash of the file.
+        """
+        fileHash = hashlib.sha256()
+        with open(a_filePath, 'rb') as file:
+            for chunk in iter(lambda: file.read(self.HASH_CHUNK_SIZE), b''):
+                fileHash.update(chunk)
+
+        return fileHash.hexdigest()